@@ -12,6 +12,7 @@ from backend.app.services.collection import (
     create_collection,
     update_collection,
     delete_collection,
+    get_collection_indexes,
 )
 
 router = APIRouter(prefix="/collections", tags=["collections"])
@@ -62,3 +63,30 @@ async def delete_collection_endpoint(
     """컬렉션 삭제 (Owner only)"""
     await delete_collection(collection_id, db)
     return None
+
+
+@router.get("/{collection_id}/indexes")
+async def get_collection_indexes_endpoint(
+    collection_id: int,
+    db: Session = Depends(get_db),
+    email: str = Depends(require_owner)
+):
+    """
+    컬렉션 MongoDB 인덱스 상태 (Owner only)
+
+    - missing: field_definitions에 따라 있어야 하지만 없는 인덱스
+    - stale: 정렬/필터 설정이 해제되어 삭제할 관리 인덱스
+    - unmanaged: 관리 대상이 아닌 인덱스 (중복 감지 등, 삭제하지 않음)
+    - unused: MongoDB 시작 후 한 번도 사용되지 않은 인덱스
+    """
+    return await get_collection_indexes(collection_id, db)
+
+
+@router.post("/{collection_id}/indexes")
+async def reconcile_collection_indexes_endpoint(
+    collection_id: int,
+    db: Session = Depends(get_db),
+    email: str = Depends(require_owner)
+):
+    """컬렉션 인덱스를 field_definitions에 맞춤 (없는 인덱스 생성, 불필요한 관리 인덱스 삭제, Owner only)"""
+    return await get_collection_indexes(collection_id, db, apply=True)
@@ -1,9 +1,14 @@
 """아이템 API 라우터"""
-from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi import APIRouter, HTTPException, Depends, status, Query, File, UploadFile, Form
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Optional
+from urllib.parse import quote
+import json
 
-from backend.app.schemas.item import ItemCreate, ItemUpdate, ItemResponse, PaginatedItemsResponse
+from backend.app.schemas.item import (
+    ItemCreate, ItemUpdate, ItemResponse, PaginatedItemsResponse, ItemBulkRequest, ItemBulkResponse,
+)
 from backend.app.db import get_db
 from backend.app.core.auth import require_owner, is_owner
 from backend.app.services.item import (
@@ -12,7 +17,14 @@ from backend.app.services.item import (
     create_item,
     update_item,
     delete_item,
+    bulk_edit_items,
+    get_bulk_job,
 )
+from backend.app.services.item.bulk_service import job_summary
+from backend.app.services.item.export import create_item_exporter
+from backend.app.services.item.item_import import ItemImporter
+from backend.app.services.item.projection import parse_fields
+from backend.app.services.collection import get_collection_by_id
 
 router = APIRouter(prefix="/items", tags=["items"])
 
@@ -26,6 +38,10 @@ async def get_items_endpoint(
     search_field: str = Query(None, description="검색 필드 (all 또는 특정 필드 key)"),
     sort_key: str = Query("created_at", description="정렬 필드"),
     sort_order: str = Query("desc", description="정렬 순서 (asc 또는 desc)"),
+    cursor: Optional[str] = Query(None, description="커서 방식 페이지네이션 (빈 값: 첫 페이지, 이후 next_cursor, 지정하면 page 무시)"),
+    include_total: bool = Query(True, description="전체 개수 포함 여부 (false면 total/total_pages 생략, 무한 스크롤용)"),
+    view: str = Query("full", description="응답 필드 (full: 전체, summary: 제목/이미지/짧은 필드만)"),
+    fields: Optional[str] = Query(None, description="포함할 메타데이터 필드 (쉼표로 구분, 지정하면 view 무시)"),
     db: Session = Depends(get_db),
     user_is_owner: bool = Depends(is_owner)
 ):
@@ -39,8 +55,104 @@ async def get_items_endpoint(
         search_query=search_query,
         search_field=search_field,
         sort_key=sort_key,
-        sort_order=sort_order
+        sort_order=sort_order,
+        cursor=cursor,
+        include_total=include_total,
+        view=view,
+        fields=parse_fields(fields)
+    )
+
+
+@router.get("/export")
+async def export_items_endpoint(
+    collection_id: int,
+    format: str = Query("csv", description="내보내기 형식 (csv, jsonl, parquet)"),
+    search_query: str = Query(None, description="검색어"),
+    search_field: str = Query(None, description="검색 필드 (all 또는 특정 필드 key)"),
+    db: Session = Depends(get_db),
+    user_is_owner: bool = Depends(is_owner)
+):
+    """
+    컬렉션 아이템 내보내기 (스트리밍 다운로드, Owner만 비공개 포함)
+
+    커서 하나로 읽으며 배치 단위로 전송하므로 아이템 수와 관계없이 메모리 사용량이 일정합니다.
+    CSV 열 순서는 컬렉션 field_definitions 순서를 따릅니다.
+    """
+    exporter, filename = await create_item_exporter(
+        collection_id,
+        db,
+        fmt=format,
+        is_owner=user_is_owner,
+        search_query=search_query,
+        search_field=search_field,
     )
+    return StreamingResponse(
+        exporter.stream(),
+        media_type=exporter.media_type,
+        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"},
+    )
+
+
+@router.post("/import")
+async def import_items_endpoint(
+    file: UploadFile = File(...),
+    collection_id: int = Form(...),
+    format: Optional[str] = Form(None),
+    apply_mapping: bool = Form(False),
+    ordered: bool = Form(False),
+    batch_size: Optional[int] = Form(None),
+    db: Session = Depends(get_db),
+    email: str = Depends(require_owner)
+):
+    """
+    메타데이터가 있는 JSONL/CSV 파일을 스크래핑 없이 바로 가져오기 (SSE 스트리밍, Owner only)
+
+    - format: jsonl 또는 csv (생략하면 파일 확장자)
+    - 행마다 field_definitions로 검증 (필수 필드, 숫자, 선택 옵션), apply_mapping=true면 저장된 field_mapping 적용
+    - batch_size개씩 insert_many로 저장 (생략하면 ITEM_IMPORT_BATCH_SIZE)
+    - ordered=true면 첫 실패 행에서 중단, false면 실패 행만 제외하고 계속
+    - 이벤트: start → error_item / progress(배치마다) → complete
+    """
+    fmt = format or (file.filename or "").rsplit(".", 1)[-1].lower()
+    collection = await get_collection_by_id(collection_id, db)
+    try:
+        importer = ItemImporter(collection, fmt, apply_mapping=apply_mapping, ordered=ordered, batch_size=batch_size)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def generate():
+        async for event in importer.events(file):
+            yield f"data: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(generate(), media_type="text/event-stream")
+
+
+@router.post("/bulk", response_model=ItemBulkResponse)
+async def bulk_edit_items_endpoint(
+    request: ItemBulkRequest,
+    db: Session = Depends(get_db),
+    email: str = Depends(require_owner)
+):
+    """
+    아이템 일괄 수정 (Owner only)
+
+    - 대상: ids(아이템 ID 목록) 또는 filter(목록 조회와 같은 search_query/search_field + conditions), 둘 다 있으면 AND
+    - operation: set_fields(fields의 메타데이터 필드 설정), set_public(is_public 변경), delete
+    - dry_run=true면 대상 수만 반환, background=true면 작업으로 실행하고 job_id 반환 (/bulk/jobs/{job_id}로 확인)
+    """
+    return await bulk_edit_items(request, db)
+
+
+@router.get("/bulk/jobs/{job_id}", response_model=ItemBulkResponse)
+async def get_bulk_job_endpoint(
+    job_id: str,
+    email: str = Depends(require_owner)
+):
+    """일괄 수정 작업 진행 상황 조회 (Owner only)"""
+    job = await get_bulk_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job_summary(job)
 
 
 @router.get("/{collection_id}/{item_id}", response_model=ItemResponse)
@@ -1,7 +1,8 @@
 """스크래핑 API 엔드포인트"""
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form
-from fastapi.responses import StreamingResponse, Response
+from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form, Header, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from typing import Optional
 import logging
 import traceback
 import json
@@ -15,12 +16,17 @@ from ..schemas.scraper import (
 )
 from ..services.scraper import mapping_service
 from ..services.scraper import scraper_service
+from ..services.scraper.web_scraper import SoftBlockError, get_tier_stats
+from ..services.scraper.rate_limiter import get_rate_limiter
+from ..services.scraper.scrape_cache import get_scrape_cache
+from ..services.scraper.artifact_store import get_artifact_store
 from ..services.scraper.csv_processor import (
-    process_csv_file,
+    iter_csv_rows,
     get_collection_mapping,
-    bulk_scrape_csv_stream,
-    get_remaining_csv
+    open_remaining_csv
 )
+from ..services.scraper import import_jobs
+from ..services.scraper.dedup import DUPLICATE_MODES
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +68,19 @@ async def delete_field_mapping_endpoint(
     return await mapping_service.delete_field_mapping(collection_id, db)
 
 
+@router.get("/stats")
+async def get_scraper_stats_endpoint(
+    email: str = Depends(require_owner),
+):
+    """호스트별 처리 단계(캐시/HTTP/브라우저), 속도 제한, 캐시 적중률, 임시 파일 저장소 사용량 조회 (Owner only)"""
+    return {
+        "tiers": get_tier_stats(),
+        "rate_limits": get_rate_limiter().snapshot(),
+        "cache": get_scrape_cache().stats(),
+        "artifacts": await get_artifact_store().stats(),
+    }
+
+
 @router.post("/scrape-url", response_model=ScrapeUrlResponse)
 async def scrape_single_url_endpoint(
     request: ScrapeUrlRequest,
@@ -75,7 +94,8 @@ async def scrape_single_url_endpoint(
             url=str(request.url),
             collection_id=request.collection_id,
             apply_mapping=request.apply_mapping,
-            db=db
+            db=db,
+            force_refresh=request.force_refresh
         )
         logger.info(f"스크래핑 완료: {len(metadata)} 필드")
 
@@ -87,6 +107,10 @@ async def scrape_single_url_endpoint(
         error_msg = str(e)
         logger.error(f"스크래핑 실패: {error_msg}\n{traceback.format_exc()}")
 
+        # 요청 제한 응답 (429/503)
+        if isinstance(e, SoftBlockError) and e.reason == 'status':
+            raise HTTPException(status_code=429, detail=error_msg)
+
         # 제목을 찾을 수 없는 경우 (차단 가능성)
         if "제목을 찾을 수 없습니다" in error_msg:
             raise HTTPException(
@@ -113,74 +137,201 @@ async def scrape_and_create_item_endpoint(
         return await scraper_service.scrape_and_create(
             url=str(request.url),
             collection_id=request.collection_id,
-            db=db
+            db=db,
+            force_refresh=request.force_refresh
         )
     except Exception as e:
         logger.error(f"아이템 생성 실패: {str(e)}\n{traceback.format_exc()}")
         raise HTTPException(status_code=500, detail=f"아이템 생성 실패: {str(e)}")
 
 
+async def _create_import_job_from_csv(
+    file: UploadFile,
+    collection_id: int,
+    apply_mapping: bool,
+    workers: Optional[int],
+    force_refresh: bool,
+    auto_resume: Optional[bool],
+    on_duplicate: Optional[str],
+    db: Session,
+) -> dict:
+    """CSV 검증 후 일괄 등록 작업 생성 (ValueError: CSV 형식 오류, 컬렉션 없음, 잘못된 중복 처리 방식)"""
+    if not file.filename.endswith('.csv'):
+        raise ValueError('CSV 파일만 업로드 가능합니다.')
+    if on_duplicate is not None and on_duplicate not in DUPLICATE_MODES:
+        raise ValueError(f"on_duplicate는 {', '.join(DUPLICATE_MODES)} 중 하나여야 합니다.")
+
+    # 매핑 설정 가져오기 (업로드를 읽기 전에 컬렉션 존재 여부 확인)
+    mapping, ignore_unmapped = await get_collection_mapping(collection_id, db)
+    if not apply_mapping:
+        mapping, ignore_unmapped = {}, False
+
+    # CSV를 청크 단위로 읽으면서 행 저장
+    return await import_jobs.create_import_job(
+        rows=iter_csv_rows(file),
+        collection_id=collection_id,
+        mapping=mapping,
+        ignore_unmapped=ignore_unmapped,
+        workers=workers,
+        force_refresh=force_refresh,
+        auto_resume=auto_resume,
+        on_duplicate=on_duplicate,
+    )
+
+
 @router.post("/bulk-scrape-csv-stream")
 async def bulk_scrape_from_csv_stream_endpoint(
     file: UploadFile = File(...),
     collection_id: int = Form(...),
     apply_mapping: bool = Form(False),
+    workers: Optional[int] = Form(None),
+    force_refresh: bool = Form(False),
+    auto_resume: Optional[bool] = Form(None),
+    on_duplicate: Optional[str] = Form(None),
     db: Session = Depends(get_db),
     email: str = Depends(require_owner),
 ):
-    """CSV 파일에서 URL 일괄 스크래핑 (스트리밍, Owner only)"""
+    """
+    CSV 파일에서 URL 일괄 스크래핑 (스트리밍, 동시 처리 수 지정 가능, force_refresh=true면 캐시 무시, Owner only)
+
+    on_duplicate: 이미 등록된 항목(출처 URL/ISBN 일치) 처리 방식
+    skip(건너뛰고 skipped 이벤트) / update(기존 아이템 갱신) / insert(새로 등록), 생략하면 SCRAPER_IMPORT_ON_DUPLICATE
+
+    백그라운드 작업으로 등록한 뒤 진행 이벤트를 스트리밍합니다.
+    연결이 끊겨도 작업은 계속 진행되며, start 이벤트의 job_id로 /import-jobs/{job_id}/events에 다시 연결할 수 있습니다.
+    auto_resume=true면 차단 시 cooldown 이벤트 후 대기했다가 남은 행부터 이어서 처리합니다
+    (생략하면 SCRAPER_JOB_AUTO_RESUME 설정값).
+    """
     async def generate():
         try:
-            # CSV 파일 검증
-            if not file.filename.endswith('.csv'):
-                yield f"data: {json.dumps({'type': 'error', 'message': 'CSV 파일만 업로드 가능합니다.'})}\n\n"
-                return
-
-            # CSV 파싱
-            urls, additional_data, original_rows = await process_csv_file(file)
-
-            # 매핑 설정 가져오기
-            mapping, ignore_unmapped = {}, False
-            if apply_mapping:
-                mapping, ignore_unmapped = await get_collection_mapping(collection_id, db)
-
-            # 스트리밍 처리
-            async for event in bulk_scrape_csv_stream(
-                urls=urls,
-                additional_data=additional_data,
-                original_rows=original_rows,
-                collection_id=collection_id,
-                mapping=mapping,
-                ignore_unmapped=ignore_unmapped,
-                db=db
-            ):
-                yield event
-
+            job = await _create_import_job_from_csv(
+                file, collection_id, apply_mapping, workers, force_refresh, auto_resume, on_duplicate, db
+            )
         except ValueError as e:
             # CSV 파싱 에러
             yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            return
         except Exception as e:
-            logger.error(f"스트리밍 처리 실패: {str(e)}\n{traceback.format_exc()}")
+            logger.error(f"작업 생성 실패: {str(e)}\n{traceback.format_exc()}")
             yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            return
+
+        async for event in import_jobs.stream_job_events(job["_id"]):
+            yield event
 
     return StreamingResponse(generate(), media_type="text/event-stream")
 
 
+@router.post("/import-jobs")
+async def create_import_job_endpoint(
+    file: UploadFile = File(...),
+    collection_id: int = Form(...),
+    apply_mapping: bool = Form(False),
+    workers: Optional[int] = Form(None),
+    force_refresh: bool = Form(False),
+    auto_resume: Optional[bool] = Form(None),
+    on_duplicate: Optional[str] = Form(None),
+    db: Session = Depends(get_db),
+    email: str = Depends(require_owner),
+):
+    """CSV 일괄 등록 작업 생성 (즉시 반환, 진행 상황은 /import-jobs/{job_id} 또는 /events로 확인, Owner only)"""
+    try:
+        job = await _create_import_job_from_csv(
+            file, collection_id, apply_mapping, workers, force_refresh, auto_resume, on_duplicate, db
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return import_jobs.job_summary(job)
+
+
+@router.get("/import-jobs")
+async def list_import_jobs_endpoint(
+    collection_id: Optional[int] = None,
+    limit: int = Query(20, ge=1, le=100),
+    email: str = Depends(require_owner),
+):
+    """최근 CSV 일괄 등록 작업 목록 (Owner only)"""
+    jobs = await import_jobs.list_import_jobs(collection_id=collection_id, limit=limit)
+    return [import_jobs.job_summary(job) for job in jobs]
+
+
+@router.get("/import-jobs/{job_id}")
+async def get_import_job_endpoint(
+    job_id: str,
+    email: str = Depends(require_owner),
+):
+    """CSV 일괄 등록 작업 상태 조회 (폴링용, Owner only)"""
+    job = await import_jobs.get_import_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return import_jobs.job_summary(job)
+
+
+@router.get("/import-jobs/{job_id}/events")
+async def stream_import_job_events_endpoint(
+    job_id: str,
+    after: int = Query(0, ge=0),
+    last_event_id: Optional[str] = Header(None),
+    email: str = Depends(require_owner),
+):
+    """
+    CSV 일괄 등록 작업 이벤트 스트리밍 (Owner only)
+
+    after(또는 Last-Event-ID 헤더) 이후의 이벤트부터 전송하므로 끊긴 지점부터 다시 연결 가능
+    """
+    job = await import_jobs.get_import_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+
+    if last_event_id and last_event_id.isdigit():
+        after = max(after, int(last_event_id))
+
+    return StreamingResponse(import_jobs.stream_job_events(job_id, after_seq=after), media_type="text/event-stream")
+
+
+@router.post("/import-jobs/{job_id}/cancel")
+async def cancel_import_job_endpoint(
+    job_id: str,
+    email: str = Depends(require_owner),
+):
+    """CSV 일괄 등록 작업 취소 (처리되지 않은 행은 재개 가능, Owner only)"""
+    job = await import_jobs.cancel_import_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return import_jobs.job_summary(job)
+
+
+@router.post("/import-jobs/{job_id}/resume")
+async def resume_import_job_endpoint(
+    job_id: str,
+    email: str = Depends(require_owner),
+):
+    """차단/실패/취소된 작업의 남은 행을 다시 처리 (자동 재개 대기 중이면 바로 재개, Owner only)"""
+    job = await import_jobs.resume_import_job(job_id)
+    if not job:
+        existing = await import_jobs.get_import_job(job_id)
+        if not existing:
+            raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+        raise HTTPException(status_code=409, detail=f"재개할 수 없는 상태입니다: {existing['status']}")
+    return import_jobs.job_summary(job)
+
+
 @router.get("/download-remaining-csv/{token}")
 async def download_remaining_csv_endpoint(
     token: str,
     email: str = Depends(require_owner),
 ):
-    """차단된 남은 URL CSV 다운로드 (Owner only)"""
-    csv_content = get_remaining_csv(token)
+    """차단된 남은 URL CSV 다운로드 (스트리밍, 만료 전까지 여러 번 가능, Owner only)"""
+    artifact = await open_remaining_csv(token)
 
-    if not csv_content:
+    if not artifact:
         raise HTTPException(status_code=404, detail="다운로드 토큰이 유효하지 않거나 만료되었습니다.")
 
-    return Response(
-        content=csv_content.encode('utf-8'),
-        media_type='text/csv; charset=utf-8',
+    return StreamingResponse(
+        artifact.chunks,
+        media_type=artifact.media_type,
         headers={
-            'Content-Disposition': 'attachment; filename="remaining_urls.csv"'
+            'Content-Disposition': f'attachment; filename="{artifact.filename}"',
+            'Content-Length': str(artifact.size),
         }
     )
@@ -31,6 +31,75 @@ class Settings(BaseSettings):
     GEMINI_API_KEY: str = ""
     DEEPL_API_KEY: str = ""  # DeepL 번역 API (슬러그 생성용)
 
+    # 스크래퍼 (Playwright 브라우저 풀)
+    SCRAPER_BROWSER_POOL_SIZE: int = 4  # 동시에 사용할 수 있는 BrowserContext 수
+    SCRAPER_BROWSER_MAX_PAGES: int = 200  # 브라우저 재시작(recycle) 전 최대 처리 페이지 수
+    SCRAPER_PAGE_TIMEOUT_MS: int = 60000  # 페이지 로드 timeout
+    SCRAPER_BLOCK_RESOURCES: bool = True  # 이미지/미디어/폰트/추적 스크립트 요청 차단
+
+    # 스크래퍼 (HTTP 우선 처리, 필요할 때만 브라우저 사용)
+    SCRAPER_HTTP_FIRST: bool = True  # False면 항상 Playwright 사용
+    SCRAPER_HTTP_TIMEOUT_SECONDS: float = 15.0
+    SCRAPER_HTTP_MAX_CONNECTIONS: int = 20  # keep-alive 커넥션 풀 크기
+
+    # 스크래퍼 (CSV 일괄 등록 동시 처리)
+    SCRAPER_BULK_WORKERS: int = 4  # 기본 동시 스크래핑 수 (1이면 순차 처리)
+    SCRAPER_BULK_MAX_WORKERS: int = 8  # 요청으로 지정 가능한 최대 동시 스크래핑 수
+    SCRAPER_PER_DOMAIN_CONCURRENCY: int = 4  # 같은 도메인에 대한 최대 동시 요청 수
+    SCRAPER_BULK_INSERT_BATCH_SIZE: int = 20  # 한 번에 insert_many로 저장하는 아이템 수
+    SCRAPER_BULK_INSERT_FLUSH_SECONDS: float = 2.0  # 배치가 차지 않아도 이 시간이 지나면 저장
+    SCRAPER_IMPORT_ON_DUPLICATE: str = "skip"  # 이미 등록된 항목(출처 URL/ISBN) 처리: skip, update, insert
+
+    # 스크래퍼 (호스트별 요청 속도 제한 및 적응형 backoff)
+    SCRAPER_RATE_LIMIT_INITIAL: float = 1.0  # 호스트별 시작 속도 (요청/초)
+    SCRAPER_RATE_LIMIT_MIN: float = 0.2  # 차단 신호가 계속될 때 최저 속도
+    SCRAPER_RATE_LIMIT_MAX: float = 4.0  # 정상 응답이 이어질 때 최고 속도
+    SCRAPER_RATE_LIMIT_BURST: int = 2  # 순간적으로 허용되는 요청 수 (bucket 크기)
+    SCRAPER_RATE_LIMIT_INCREASE: float = 0.05  # 성공 1회당 증가량 (요청/초)
+    SCRAPER_RATE_LIMIT_DECREASE: float = 0.5  # 차단 신호 1회당 감소 배율
+    SCRAPER_BACKOFF_BASE_SECONDS: float = 5.0  # 차단 신호 후 일시 정지 시간 (연속 발생 시 2배씩 증가)
+    SCRAPER_BACKOFF_MAX_SECONDS: float = 120.0  # 일시 정지 최대 시간
+    SCRAPER_BLOCK_RETRIES: int = 2  # 차단 의심 행 재시도 횟수 (초과 시 차단으로 판단)
+
+    # 스크래퍼 (결과 캐시, MongoDB scrape_cache 컬렉션)
+    SCRAPER_CACHE_ENABLED: bool = True
+    SCRAPER_CACHE_TTL_HOURS: int = 168  # 캐시 유지 시간 (기본 7일)
+    SCRAPER_CACHE_MAX_ENTRIES: int = 50000  # 초과 시 오래된 항목부터 삭제
+
+    # 스크래퍼 (차단 시 남은 URL CSV 등 다운로드용 임시 파일)
+    SCRAPER_ARTIFACT_BACKEND: str = "gridfs"  # gridfs (프로세스 간 공유) 또는 memory (단일 프로세스)
+    SCRAPER_ARTIFACT_TTL_HOURS: int = 24  # 다운로드 토큰 유효 시간
+    SCRAPER_ARTIFACT_MAX_BYTES: int = 50 * 1024 * 1024  # 전체 크기 제한 (초과 시 오래된 파일부터 삭제)
+    SCRAPER_ARTIFACT_PURGE_SECONDS: float = 600.0  # 만료 파일 정리 주기
+
+    # 스크래퍼 (CSV 일괄 등록 작업 큐)
+    SCRAPER_JOB_WORKER_ENABLED: bool = True  # API 서버 안에서 워커 실행 (False면 별도 워커 프로세스 필요)
+    SCRAPER_JOB_CONCURRENCY: int = 2  # 워커 하나가 동시에 실행하는 작업 수
+    SCRAPER_JOB_POLL_SECONDS: float = 5.0  # 대기 중 작업 조회 주기
+    SCRAPER_JOB_HEARTBEAT_SECONDS: float = 15.0  # 실행 중 작업 하트비트 주기
+    SCRAPER_JOB_STALE_SECONDS: float = 60.0  # 하트비트가 이보다 오래 없으면 다른 워커가 이어서 처리
+    SCRAPER_JOB_RETENTION_DAYS: int = 7  # 작업/행/이벤트 보관 기간
+    SCRAPER_JOB_AUTO_RESUME: bool = False  # 요청에 auto_resume이 없을 때 기본값 (차단 시 대기 후 자동 재개)
+    SCRAPER_JOB_COOLDOWN_SECONDS: float = 300.0  # 차단 후 첫 자동 재개까지 대기 시간 (재개할 때마다 2배)
+    SCRAPER_JOB_COOLDOWN_MAX_SECONDS: float = 3600.0  # 자동 재개 대기 시간 최대값
+    SCRAPER_JOB_AUTO_RESUME_MAX_ATTEMPTS: int = 5  # 초과하면 blocked로 종료 (남은 CSV 다운로드)
+
+    # 아이템 직접 가져오기 (스크래핑 없이 JSONL/CSV)
+    ITEM_IMPORT_BATCH_SIZE: int = 1000  # 한 번에 insert_many로 저장하는 아이템 수
+
+    # 아이템 목록 전체 개수 캐시 (같은 조건의 count_documents 재사용, 이 프로세스의 아이템 쓰기 시 무효화)
+    ITEM_COUNT_CACHE_TTL_SECONDS: float = 30.0  # 0이면 캐시 미사용
+    ITEM_COUNT_CACHE_MAX_ENTRIES: int = 1000
+
+    # 아이템 검색 (search_tokens n-gram 인덱스)
+    ITEM_SEARCH_BACKFILL_ON_STARTUP: bool = True  # 시작 시 토큰이 없는 기존 아이템 채우기 (백그라운드)
+
+    # 아이템 중복 감지 키 (dedup.source, dedup.isbn)
+    ITEM_DEDUP_BACKFILL_ON_STARTUP: bool = True  # 시작 시 키가 없는 기존 아이템 채우기 + unique 인덱스 생성 (백그라운드)
+
+    # 아이템 컬렉션 인덱스 관리 (field_definitions의 sortable/filterable 기준)
+    ITEM_INDEX_RECONCILE_ON_STARTUP: bool = True  # 시작 시 모든 컬렉션의 인덱스 맞추기 (백그라운드)
+
     # 서버
     BACKEND_HOST: str = "0.0.0.0"
     BACKEND_PORT: int = 8000
@@ -1,6 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import logging
 
 from backend.app.api import collections_router, auth_router
 from backend.app.api.items import router as items_router
@@ -8,6 +9,19 @@ from backend.app.api.ai import router as ai_router
 from backend.app.api.scraper import router as scraper_router
 from backend.app.db import Base, engine
 from backend.app.db.mongodb import connect_to_mongodb, close_mongodb_connection
+from backend.app.services.scraper.browser_pool import start_browser_pool, stop_browser_pool, get_browser_pool
+from backend.app.services.scraper.http_fetcher import start_http_client, stop_http_client
+from backend.app.services.scraper.scrape_cache import get_scrape_cache
+from backend.app.services.scraper.artifact_store import start_artifact_store, stop_artifact_store
+from backend.app.services.scraper.import_jobs import start_import_worker, stop_import_worker, get_import_worker
+from backend.app.services.item.bulk_service import ensure_bulk_job_indexes
+from backend.app.services.item.count_cache import get_item_count_cache
+from backend.app.services.item.search import start_search_backfill, stop_search_backfill
+from backend.app.services.item.duplicate_keys import start_dedup_backfill, stop_dedup_backfill
+from backend.app.services.item.indexes import start_index_reconcile, stop_index_reconcile
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
@@ -16,8 +30,29 @@ async def lifespan(app: FastAPI):
     # 시작 시
     Base.metadata.create_all(bind=engine)  # PostgreSQL 테이블 생성
     await connect_to_mongodb()  # MongoDB 연결
+    await get_scrape_cache().ensure_indexes()  # 스크래핑 캐시 TTL 인덱스
+    await ensure_bulk_job_indexes()  # 아이템 일괄 수정 작업 TTL 인덱스
+    await start_index_reconcile()  # 아이템 컬렉션 인덱스를 field_definitions에 맞춤 (백그라운드)
+    await start_search_backfill()  # 기존 아이템 검색 토큰 채우기 (백그라운드)
+    await start_dedup_backfill()  # 기존 아이템 중복 감지 키 채우기 (백그라운드)
+    await start_artifact_store()  # 남은 URL CSV 저장소 (만료 파일 정리)
+    await start_http_client()  # 스크래핑용 공용 HTTP 클라이언트 (keep-alive)
+    try:
+        await start_browser_pool()  # 스크래핑용 공용 브라우저 풀
+    except Exception as e:
+        # 브라우저가 없어도 API는 동작해야 함 (스크래핑 시 전용 브라우저로 재시도)
+        logger.warning(f"브라우저 풀 시작 실패: {e}")
+    if settings.SCRAPER_JOB_WORKER_ENABLED:
+        await start_import_worker()  # CSV 일괄 등록 작업 워커 (중단된 작업 이어서 처리)
     yield
     # 종료 시
+    await stop_import_worker()  # 실행 중인 작업은 대기열로 복귀
+    await stop_dedup_backfill()  # 중복 감지 키 채우기 중단 (다음 시작 시 이어서)
+    await stop_search_backfill()  # 검색 토큰 채우기 중단 (다음 시작 시 이어서)
+    await stop_index_reconcile()  # 인덱스 맞추기 중단
+    await stop_browser_pool()  # 브라우저 풀 종료
+    await stop_http_client()  # HTTP 클라이언트 종료
+    await stop_artifact_store()  # 만료 파일 정리 종료
     await close_mongodb_connection()  # MongoDB 연결 종료
 
 
@@ -52,4 +87,11 @@ async def root():
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy"}
+    pool = get_browser_pool()
+    worker = get_import_worker()
+    return {
+        "status": "healthy",
+        "browser_pool": pool.stats() if pool else None,
+        "import_worker": worker.stats() if worker else None,
+        "item_count_cache": get_item_count_cache().stats(),
+    }
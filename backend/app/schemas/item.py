@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 from datetime import datetime
 
 
@@ -52,10 +52,65 @@ class CollectionSchema(BaseModel):
     fields: list[FieldSchema] = Field(default_factory=list)
 
 
+class ItemSummaryResponse(BaseModel):
+    """목록 요약 응답 스키마 (view=summary 또는 fields 지정 시, metadata는 선택한 필드만)"""
+    id: str = Field(alias="_id")
+    title: Optional[str] = None
+    is_public: bool = True
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+    created_at: datetime
+
+    class Config:
+        populate_by_name = True
+        json_encoders = {
+            datetime: lambda v: v.isoformat()
+        }
+
+
 class PaginatedItemsResponse(BaseModel):
     """페이지네이션된 아이템 목록 응답"""
-    items: List[ItemResponse]
-    total: int
-    page: int
+    items: List[Union[ItemResponse, ItemSummaryResponse]]  # view=full이면 ItemResponse
+    total: Optional[int]  # include_total=false면 None
+    page: Optional[int]  # 커서 방식이면 None
     page_size: int
-    total_pages: int
+    total_pages: Optional[int]
+    next_cursor: Optional[str] = None  # 커서 방식의 다음 페이지 (마지막 페이지면 None)
+
+
+class ItemBulkCondition(BaseModel):
+    """일괄 수정 대상 조건 (메타데이터 필드)"""
+    field: str
+    operator: str  # contains, regex, equals, empty, not_empty
+    value: Optional[Any] = None
+
+
+class ItemBulkFilter(BaseModel):
+    """일괄 수정 대상 필터 (목록 조회와 같은 검색 + 추가 조건, 모두 AND)"""
+    search_query: Optional[str] = None
+    search_field: Optional[str] = None  # all 또는 특정 필드 key
+    conditions: List[ItemBulkCondition] = Field(default_factory=list)
+
+
+class ItemBulkRequest(BaseModel):
+    """아이템 일괄 수정 요청 (ids 또는 filter 필요, 둘 다 있으면 AND)"""
+    collection_id: int
+    operation: str  # set_fields, set_public, delete
+    ids: Optional[List[str]] = None
+    filter: Optional[ItemBulkFilter] = None
+    fields: Dict[str, Any] = Field(default_factory=dict)  # set_fields: {메타데이터 필드: 새 값}
+    is_public: Optional[bool] = None  # set_public
+    dry_run: bool = False  # True면 대상 수만 반환
+    background: bool = False  # True면 작업으로 실행하고 job_id 반환
+
+
+class ItemBulkResponse(BaseModel):
+    """아이템 일괄 수정 결과 (background 작업이면 job_id와 진행 상황)"""
+    operation: str
+    status: str  # completed, queued, running, failed
+    dry_run: bool = False
+    matched: int = 0
+    modified: int = 0
+    deleted: int = 0
+    elapsed_seconds: Optional[float] = None
+    job_id: Optional[str] = None
+    error: Optional[str] = None
@@ -15,6 +15,7 @@ class ScrapeUrlRequest(BaseModel):
     url: HttpUrl
     collection_id: int
     apply_mapping: bool = True  # 저장된 매핑 적용 여부
+    force_refresh: bool = False  # 스크래핑 캐시 무시
 
 
 class ScrapeUrlResponse(BaseModel):
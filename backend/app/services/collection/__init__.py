@@ -6,6 +6,7 @@ from .collection_service import (
     update_collection,
     delete_collection,
     generate_mongo_collection_name,
+    get_collection_indexes,
 )
 
 __all__ = [
@@ -15,4 +16,5 @@ __all__ = [
     "update_collection",
     "delete_collection",
     "generate_mongo_collection_name",
+    "get_collection_indexes",
 ]
@@ -2,13 +2,15 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 from fastapi import HTTPException
-from typing import List
+from typing import List, Dict, Any
 import re
 import hashlib
 
 from backend.app.models import Collection
 from backend.app.schemas import CollectionCreate, CollectionUpdate
 from backend.app.db.mongodb import get_database
+from backend.app.services.item.duplicate_keys import ensure_dedup_indexes
+from backend.app.services.item.indexes import reconcile_indexes, schedule_reconcile
 
 
 def generate_mongo_collection_name(slug: str) -> str:
@@ -82,8 +84,10 @@ async def create_collection(collection_data: CollectionCreate, db: Session) -> C
     # MongoDB 컬렉션 생성 및 인덱스 설정
     mongo_db = get_database()
     await mongo_db.create_collection(mongo_collection_name)
-    await mongo_db[mongo_collection_name].create_index("title")  # 제목 인덱스
-    await mongo_db[mongo_collection_name].create_index("created_at")  # 등록일 인덱스
+    # 목록 조회(등록일, 정렬 가능 필드), 검색 토큰, 필터 가능 필드 인덱스
+    await reconcile_indexes(mongo_db[mongo_collection_name], db_collection.field_definitions)
+    # 중복 감지 키 unique 인덱스 (아이템 저장 시 키가 겹치지 않도록)
+    await ensure_dedup_indexes(mongo_db[mongo_collection_name])
 
     return db_collection
 
@@ -108,9 +112,27 @@ async def update_collection(
 
     db.commit()
     db.refresh(db_collection)
+
+    # 필드 정의가 바뀌면 정렬/필터 인덱스를 백그라운드로 맞춤
+    if "field_definitions" in update_data and db_collection.mongo_collection:
+        schedule_reconcile(db_collection.mongo_collection, db_collection.field_definitions)
+
     return db_collection
 
 
+async def get_collection_indexes(collection_id: int, db: Session, apply: bool = False) -> Dict[str, Any]:
+    """
+    컬렉션 인덱스 상태 (field_definitions 기준 없는/불필요한/관리 외/미사용 인덱스)
+
+    apply=True면 바로 맞춘 결과 반환
+    """
+    collection = await get_collection_by_id(collection_id, db)
+    if not collection.mongo_collection:
+        raise HTTPException(status_code=500, detail="MongoDB collection not configured")
+    mongo_db = get_database()
+    return await reconcile_indexes(mongo_db[collection.mongo_collection], collection.field_definitions, dry_run=not apply)
+
+
 async def delete_collection(collection_id: int, db: Session) -> None:
     """컬렉션 삭제"""
     db_collection = db.execute(
@@ -6,6 +6,7 @@ from .item_service import (
     update_item,
     delete_item,
 )
+from .bulk_service import bulk_edit_items, get_bulk_job
 
 __all__ = [
     "get_all_items",
@@ -13,4 +14,6 @@ __all__ = [
     "create_item",
     "update_item",
     "delete_item",
+    "bulk_edit_items",
+    "get_bulk_job",
 ]
@@ -0,0 +1,244 @@
+"""
+아이템 일괄 수정
+조건(포함/정규식/일치/비어 있음)을 MongoDB 쿼리로 변환하여 서버에서 필터링하고,
+대상은 커서로 스트리밍하며 배치 bulk_write($set)로 필드만 변경 (metadata 전체를 다시 쓰지 않음)
+"""
+import logging
+import re
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Any, AsyncIterator, Callable, Awaitable, Iterable, Optional, Tuple
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from backend.app.services.item.duplicate_keys import dedup_keys_changed, refresh_dedup_keys
+from backend.app.services.item.search import search_tokens_changed, refresh_search_tokens
+
+logger = logging.getLogger(__name__)
+
+# 조건 연산자
+CONTAINS = "contains"  # 부분 일치 (대소문자 무시)
+REGEX = "regex"  # 정규식 (대소문자 무시)
+EQUALS = "equals"  # 값이 정확히 같음
+EMPTY = "empty"  # 필드가 없거나 null/빈 문자열
+NOT_EMPTY = "not_empty"  # 필드에 값이 있음
+MATCH_OPERATORS = (CONTAINS, REGEX, EQUALS, EMPTY, NOT_EMPTY)
+
+# 한 번의 bulk_write로 보내는 수정 수
+BULK_EDIT_BATCH_SIZE = 500
+
+_EMPTY_VALUES = [None, ""]
+
+Condition = Tuple[str, str, Any]  # (메타데이터 필드, 연산자, 값)
+
+
+def field_path(field: str) -> str:
+    """메타데이터 필드명 → MongoDB 경로 (metadata.<필드>)"""
+    if not field or field.startswith("$") or "." in field:
+        raise ValueError(f"잘못된 필드명입니다: {field!r}")
+    return f"metadata.{field}"
+
+
+def build_condition(field: str, operator: str, value: Any = None) -> Dict[str, Any]:
+    """조건 하나를 MongoDB 쿼리로 변환"""
+    path = field_path(field)
+    if operator == CONTAINS:
+        return {path: {"$regex": re.escape(str(value)), "$options": "i"}}
+    if operator == REGEX:
+        try:
+            re.compile(str(value))
+        except re.error as e:
+            raise ValueError(f"잘못된 정규식입니다: {e}")
+        return {path: {"$regex": str(value), "$options": "i"}}
+    if operator == EQUALS:
+        return {path: value}
+    if operator == EMPTY:
+        return {path: {"$in": _EMPTY_VALUES}}
+    if operator == NOT_EMPTY:
+        return {path: {"$nin": _EMPTY_VALUES}}
+    raise ValueError(f"조건 연산자는 {', '.join(MATCH_OPERATORS)} 중 하나여야 합니다.")
+
+
+def build_filter(conditions: Iterable[Condition], base: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """조건 목록을 AND로 묶은 MongoDB 쿼리 (base: 공개 여부 등 추가 조건)"""
+    clauses = [build_condition(*condition) for condition in conditions]
+    if base:
+        clauses.insert(0, base)
+    if not clauses:
+        return {}
+    if len(clauses) == 1:
+        return clauses[0]
+    return {"$and": clauses}
+
+
+class BulkEditResult:
+    """일괄 수정 결과 + 처리량"""
+
+    def __init__(self, dry_run: bool):
+        self.dry_run = dry_run
+        self.matched = 0
+        self.modified = 0
+        self.deleted = 0
+        self.failed = 0
+        self.batches = 0
+        self._started_at = time.perf_counter()
+        self.elapsed = 0.0
+
+    def finish(self) -> "BulkEditResult":
+        self.elapsed = time.perf_counter() - self._started_at
+        return self
+
+    @property
+    def rate(self) -> float:
+        """초당 처리한 아이템 수"""
+        return self.matched / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "dry_run": self.dry_run,
+            "matched": self.matched,
+            "modified": self.modified,
+            "deleted": self.deleted,
+            "failed": self.failed,
+            "batches": self.batches,
+            "elapsed_seconds": round(self.elapsed, 3),
+            "items_per_second": round(self.rate, 1),
+        }
+
+
+async def iter_matches(
+    collection,
+    query: Dict[str, Any],
+    fields: Iterable[str] = ("title",),
+    limit: int = 0,
+) -> AsyncIterator[Dict[str, Any]]:
+    """조건에 맞는 아이템을 커서로 스트리밍 (미리보기용, 필요한 메타데이터 필드만 조회)"""
+    projection = {field_path(field): 1 for field in fields}
+    cursor = collection.find(query, projection or {"_id": 1}).sort("_id", 1)
+    if limit:
+        cursor = cursor.limit(limit)
+    async for item in cursor:
+        yield item
+
+
+async def bulk_update(
+    collection,
+    query: Dict[str, Any],
+    values: Dict[str, Any],
+    dry_run: bool = True,
+    batch_size: int = BULK_EDIT_BATCH_SIZE,
+    on_batch: Optional[Callable[[BulkEditResult], Awaitable[None]]] = None,
+    mapping: Optional[Dict[str, str]] = None,
+) -> BulkEditResult:
+    """
+    조건에 맞는 아이템에 $set을 배치로 적용
+
+    대상 _id를 커서로 읽어 batch_size개씩 bulk_write(ordered=False)로
+    {"$set": {경로: 값, "updated_at": ...}}을 적용합니다.
+    메타데이터가 바뀌면 배치의 아이템만 검색 토큰과 중복 감지 키를 다시 계산합니다.
+
+    Args:
+        collection: MongoDB 컬렉션 (motor)
+        query: 대상 조건 (build_filter 결과)
+        values: {문서 경로: 새 값} (예: {"metadata.series": "원피스"}, {"is_public": False})
+        dry_run: True면 대상 수만 세고 변경하지 않음
+        on_batch: 배치마다 호출 (진행 상황 표시용)
+        mapping: 컬렉션의 필드 매핑 (중복 감지 키의 출처 URL/ISBN 키 이름)
+    """
+    if not values:
+        raise ValueError("변경할 필드가 없습니다.")
+    result = BulkEditResult(dry_run)
+    if dry_run:
+        result.matched = await collection.count_documents(query)
+        return result.finish()
+
+    reindex = search_tokens_changed(values)
+    rekey = dedup_keys_changed(values, mapping)
+
+    async def write(batch: List[Any]) -> None:
+        update = {"$set": {**values, "updated_at": datetime.now(timezone.utc)}}
+        try:
+            written = await collection.bulk_write([UpdateOne({"_id": _id}, update) for _id in batch], ordered=False)
+            result.modified += written.modified_count
+        except BulkWriteError as e:
+            write_errors = e.details.get('writeErrors', [])
+            result.modified += e.details.get('nModified', 0)
+            result.failed += len(write_errors)
+            logger.warning(f"[BULK_EDIT] {len(batch)}개 중 {len(write_errors)}개 수정 실패")
+        if reindex:
+            # 바뀐 메타데이터로 검색 토큰 다시 계산 (배치의 아이템만)
+            await refresh_search_tokens(collection, {"_id": {"$in": batch}})
+        if rekey:
+            await refresh_dedup_keys(collection, {"_id": {"$in": batch}}, mapping)
+
+    await _run_batches(collection, query, batch_size, write, result, on_batch)
+    logger.info(
+        f"[BULK_EDIT] {collection.name}: {result.matched}개 대상, {result.modified}개 수정 "
+        f"({result.elapsed:.2f}초, {result.rate:.0f}개/초)"
+    )
+    return result
+
+
+async def bulk_set_fields(
+    collection,
+    query: Dict[str, Any],
+    changes: Dict[str, Any],
+    dry_run: bool = True,
+    batch_size: int = BULK_EDIT_BATCH_SIZE,
+    on_batch: Optional[Callable[[BulkEditResult], Awaitable[None]]] = None,
+    mapping: Optional[Dict[str, str]] = None,
+) -> BulkEditResult:
+    """조건에 맞는 아이템의 메타데이터 필드를 일괄 변경 (changes: {메타데이터 필드: 새 값})"""
+    values = {field_path(field): value for field, value in changes.items()}
+    return await bulk_update(collection, query, values, dry_run, batch_size, on_batch, mapping)
+
+
+async def bulk_delete(
+    collection,
+    query: Dict[str, Any],
+    dry_run: bool = True,
+    batch_size: int = BULK_EDIT_BATCH_SIZE,
+    on_batch: Optional[Callable[[BulkEditResult], Awaitable[None]]] = None,
+) -> BulkEditResult:
+    """조건에 맞는 아이템을 batch_size개씩 delete_many로 삭제"""
+    result = BulkEditResult(dry_run)
+    if dry_run:
+        result.matched = await collection.count_documents(query)
+        return result.finish()
+
+    async def write(batch: List[Any]) -> None:
+        deleted = await collection.delete_many({"_id": {"$in": batch}})
+        result.deleted += deleted.deleted_count
+
+    await _run_batches(collection, query, batch_size, write, result, on_batch)
+    logger.info(f"[BULK_EDIT] {collection.name}: {result.matched}개 대상, {result.deleted}개 삭제 ({result.elapsed:.2f}초)")
+    return result
+
+
+async def _run_batches(
+    collection,
+    query: Dict[str, Any],
+    batch_size: int,
+    write: Callable[[List[Any]], Awaitable[None]],
+    result: BulkEditResult,
+    on_batch: Optional[Callable[[BulkEditResult], Awaitable[None]]],
+) -> None:
+    """대상 _id를 _id 순서의 커서로 읽어 batch_size개씩 write 호출"""
+    batch: List[Any] = []
+
+    async def flush() -> None:
+        await write(batch)
+        result.batches += 1
+        if on_batch:
+            await on_batch(result)
+
+    async for doc in collection.find(query, {"_id": 1}).sort("_id", 1):
+        result.matched += 1
+        batch.append(doc["_id"])
+        if len(batch) >= max(1, batch_size):
+            await flush()
+            batch = []
+    if batch:
+        await flush()
+    result.finish()
@@ -0,0 +1,220 @@
+"""
+아이템 일괄 수정 API 서비스
+ID 목록 또는 목록 조회와 같은 필터로 대상을 정하고 필드 설정/공개 여부 변경/삭제를
+update_many/delete_many 한 번으로 실행 (대상이 많으면 배치 작업으로 실행하고 진행 상황 기록)
+메타데이터를 바꾸는 필드 설정은 검색 토큰/중복 감지 키를 대상 아이템만 다시 계산하도록 배치로 실행
+"""
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+
+from bson import ObjectId
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from backend.app.db.mongodb import get_database
+from backend.app.schemas.item import ItemBulkRequest
+from backend.app.services.item import bulk_edit, duplicate_keys, search
+from backend.app.services.item.count_cache import invalidate_item_counts
+from backend.app.services.item.item_service import get_item_collection, build_item_query
+
+logger = logging.getLogger(__name__)
+
+# 일괄 작업 종류
+SET_FIELDS = "set_fields"  # 메타데이터 필드 설정
+SET_PUBLIC = "set_public"  # 공개 여부 변경
+DELETE = "delete"  # 삭제
+BULK_OPERATIONS = (SET_FIELDS, SET_PUBLIC, DELETE)
+
+# 작업 상태
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+JOBS_COLLECTION = "item_bulk_jobs"
+JOB_RETENTION_DAYS = 7
+
+# 실행 중인 작업 (가비지 컬렉션 방지용 참조)
+_running_tasks: set = set()
+
+
+def _jobs():
+    return get_database()[JOBS_COLLECTION]
+
+
+def job_summary(job: Dict[str, Any]) -> Dict[str, Any]:
+    """API 응답용 작업 정보"""
+    return {
+        "job_id": job["_id"],
+        "operation": job["operation"],
+        "status": job["status"],
+        "dry_run": False,
+        "matched": job.get("matched", 0),
+        "modified": job.get("modified", 0),
+        "deleted": job.get("deleted", 0),
+        "elapsed_seconds": job.get("elapsed_seconds"),
+        "error": job.get("error"),
+    }
+
+
+async def ensure_bulk_job_indexes() -> None:
+    """작업 보관 기간 TTL 인덱스 생성"""
+    try:
+        await _jobs().create_index(
+            "created_at", expireAfterSeconds=JOB_RETENTION_DAYS * 24 * 3600, name="created_at_ttl"
+        )
+    except Exception as e:
+        logger.warning(f"일괄 수정 작업 인덱스 생성 실패: {e}")
+
+
+def build_bulk_query(request: ItemBulkRequest) -> Dict[str, Any]:
+    """요청의 ids/filter를 MongoDB 조건으로 변환 (잘못된 요청이면 400)"""
+    if not request.ids and request.filter is None:
+        raise HTTPException(status_code=400, detail="ids 또는 filter가 필요합니다.")
+
+    clauses = []
+    if request.ids:
+        if not all(ObjectId.is_valid(item_id) for item_id in request.ids):
+            raise HTTPException(status_code=400, detail="Invalid item ID")
+        clauses.append({"_id": {"$in": [ObjectId(item_id) for item_id in request.ids]}})
+    if request.filter is not None:
+        base = build_item_query(True, request.filter.search_query, request.filter.search_field)
+        conditions = [(c.field, c.operator, c.value) for c in request.filter.conditions]
+        try:
+            clauses.append(bulk_edit.build_filter(conditions, base=base))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    clauses = [clause for clause in clauses if clause]
+    if not clauses:
+        return {}
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+
+def build_bulk_values(request: ItemBulkRequest) -> Dict[str, Any]:
+    """작업별 $set 값 (삭제는 빈 dict)"""
+    if request.operation == SET_FIELDS:
+        if not request.fields:
+            raise HTTPException(status_code=400, detail="set_fields에는 fields가 필요합니다.")
+        try:
+            return {bulk_edit.field_path(field): value for field, value in request.fields.items()}
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    if request.operation == SET_PUBLIC:
+        if request.is_public is None:
+            raise HTTPException(status_code=400, detail="set_public에는 is_public이 필요합니다.")
+        return {"is_public": request.is_public}
+    if request.operation == DELETE:
+        return {}
+    raise HTTPException(status_code=400, detail=f"operation은 {', '.join(BULK_OPERATIONS)} 중 하나여야 합니다.")
+
+
+async def bulk_edit_items(request: ItemBulkRequest, db: Session) -> Dict[str, Any]:
+    """
+    아이템 일괄 수정
+
+    - 기본: update_many/delete_many 한 번으로 실행하고 결과 반환
+      (검색 토큰/중복 감지 키의 원본이 바뀌면 bulk_update로 배치마다 대상 아이템의 토큰/키 재계산)
+    - dry_run: 대상 수만 반환
+    - background: 작업을 만들고 즉시 반환 (배치 단위로 실행하며 진행 상황은 get_bulk_job으로 확인)
+    """
+    values = build_bulk_values(request)
+    query = build_bulk_query(request)
+    item_collection = await get_item_collection(request.collection_id, db)
+    mongo_collection_name = item_collection.mongo_collection
+    collection = get_database()[mongo_collection_name]
+    mapping = duplicate_keys.collection_mapping(item_collection)
+
+    if request.dry_run:
+        result = bulk_edit.BulkEditResult(dry_run=True)
+        result.matched = await collection.count_documents(query)
+        return {"operation": request.operation, "status": COMPLETED, **result.finish().to_dict()}
+
+    if request.background:
+        job = await _create_job(request.collection_id, mongo_collection_name, request.operation)
+        task = asyncio.create_task(_run_job(job["_id"], collection, request.operation, query, values, mapping))
+        _running_tasks.add(task)
+        task.add_done_callback(_running_tasks.discard)
+        return job_summary(job)
+
+    result = bulk_edit.BulkEditResult(dry_run=False)
+    if request.operation == DELETE:
+        deleted = await collection.delete_many(query)
+        result.matched = result.deleted = deleted.deleted_count
+    elif search.search_tokens_changed(values) or duplicate_keys.dedup_keys_changed(values, mapping):
+        result = await bulk_edit.bulk_update(collection, query, values, dry_run=False, mapping=mapping)
+    else:
+        updated = await collection.update_many(query, {"$set": {**values, "updated_at": datetime.now(timezone.utc)}})
+        result.matched = updated.matched_count
+        result.modified = updated.modified_count
+    invalidate_item_counts(mongo_collection_name)
+    result.finish()
+    logger.info(f"[BULK_EDIT] {mongo_collection_name} {request.operation}: {result.to_dict()}")
+    return {"operation": request.operation, "status": COMPLETED, **result.to_dict()}
+
+
+async def get_bulk_job(job_id: str) -> Optional[Dict[str, Any]]:
+    return await _jobs().find_one({"_id": job_id})
+
+
+async def _create_job(collection_id: int, mongo_collection_name: str, operation: str) -> Dict[str, Any]:
+    job = {
+        "_id": str(uuid.uuid4()),
+        "collection_id": collection_id,
+        "mongo_collection": mongo_collection_name,
+        "operation": operation,
+        "status": QUEUED,
+        "matched": 0,
+        "modified": 0,
+        "deleted": 0,
+        "created_at": datetime.utcnow(),
+    }
+    await _jobs().insert_one(job)
+    return job
+
+
+async def _run_job(
+    job_id: str,
+    collection,
+    operation: str,
+    query: Dict[str, Any],
+    values: Dict[str, Any],
+    mapping: Dict[str, str],
+) -> None:
+    """배치 단위로 일괄 수정을 실행하며 배치마다 진행 상황 기록 (API 프로세스에서 실행)"""
+    await _jobs().update_one({"_id": job_id}, {"$set": {"status": RUNNING, "started_at": datetime.utcnow()}})
+
+    async def report(progress: bulk_edit.BulkEditResult) -> None:
+        invalidate_item_counts(collection.name)
+        await _jobs().update_one({"_id": job_id}, {"$set": {
+            "matched": progress.matched,
+            "modified": progress.modified,
+            "deleted": progress.deleted,
+        }})
+
+    try:
+        if operation == DELETE:
+            result = await bulk_edit.bulk_delete(collection, query, dry_run=False, on_batch=report)
+        else:
+            result = await bulk_edit.bulk_update(
+                collection, query, values, dry_run=False, on_batch=report, mapping=mapping
+            )
+        invalidate_item_counts(collection.name)
+        await _jobs().update_one({"_id": job_id}, {"$set": {
+            "status": COMPLETED,
+            "matched": result.matched,
+            "modified": result.modified,
+            "deleted": result.deleted,
+            "elapsed_seconds": round(result.elapsed, 3),
+            "finished_at": datetime.utcnow(),
+        }})
+    except Exception as e:
+        logger.exception(f"[BULK_EDIT] 작업 실패 {job_id}")
+        await _jobs().update_one({"_id": job_id}, {"$set": {
+            "status": FAILED,
+            "error": str(e),
+            "finished_at": datetime.utcnow(),
+        }})
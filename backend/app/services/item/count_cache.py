@@ -0,0 +1,94 @@
+"""
+아이템 목록 전체 개수 캐시
+같은 조건(컬렉션, 공개 여부 + 검색 조건)으로 페이지를 넘길 때마다 count_documents를 다시 실행하지 않도록
+개수를 짧게 캐시하고, 이 프로세스에서 아이템을 쓰면(생성/수정/삭제/일괄 저장) 해당 컬렉션의 캐시를 무효화
+
+- 조건이 없는 목록(Owner 전체 목록)은 컬렉션 메타데이터의 estimated_document_count 사용 (캐시 불필요)
+- 공개 목록은 검색어가 없어도 is_public 조건이 있어 estimated_document_count(컬렉션 전체 문서 수)를 쓸 수 없으므로
+  count_documents 결과를 다른 조건과 같이 캐시 (TTL 동안 페이지 이동/재방문은 캐시에서 응답)
+- 다른 프로세스(별도 워커, 스크립트)의 쓰기는 무효화되지 않으므로 ITEM_COUNT_CACHE_TTL_SECONDS 안에서만 오차 허용
+"""
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from bson import json_util
+
+from backend.app.core.config import settings
+
+
+class ItemCountCache:
+    """(컬렉션, 정규화한 조건) → 개수 (LRU + TTL, 컬렉션별 세대 번호로 무효화)"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[Tuple[str, int, str], Tuple[int, float]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def _key(self, collection_name: str, query: Dict[str, Any]) -> Tuple[str, int, str]:
+        # 키 순서와 관계없이 같은 조건이면 같은 키 (정규식/ObjectId 등도 Extended JSON으로 구분)
+        normalized = json_util.dumps(query, sort_keys=True)
+        return collection_name, self._generations.get(collection_name, 0), normalized
+
+    async def count(self, collection, query: Dict[str, Any]) -> int:
+        """조건에 맞는 아이템 수 (캐시 우선)"""
+        if not query:
+            return await collection.estimated_document_count()
+        if not self.enabled:
+            return await collection.count_documents(query)
+
+        key = self._key(collection.name, query)
+        now = time.monotonic()
+        cached = self._entries.get(key)
+        if cached is not None and cached[1] > now:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached[0]
+
+        self.misses += 1
+        total = await collection.count_documents(query)
+        # count_documents를 기다리는 동안 쓰기가 있었으면 저장하지 않음
+        if key[1] == self._generations.get(collection.name, 0):
+            self._entries[key] = (total, now + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return total
+
+    def invalidate(self, collection_name: str) -> None:
+        """컬렉션의 캐시 무효화 (이전 세대 항목은 LRU로 밀려나며 정리)"""
+        self._generations[collection_name] = self._generations.get(collection_name, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_count_cache: Optional[ItemCountCache] = None
+
+
+def get_item_count_cache() -> ItemCountCache:
+    """공용 개수 캐시 반환 (최초 호출 시 설정값으로 생성)"""
+    global _count_cache
+    if _count_cache is None:
+        _count_cache = ItemCountCache(
+            ttl_seconds=settings.ITEM_COUNT_CACHE_TTL_SECONDS,
+            max_entries=settings.ITEM_COUNT_CACHE_MAX_ENTRIES,
+        )
+    return _count_cache
+
+
+def invalidate_item_counts(collection_name: str) -> None:
+    """아이템 쓰기 후 호출 (해당 MongoDB 컬렉션의 캐시된 개수 무효화)"""
+    get_item_count_cache().invalidate(collection_name)
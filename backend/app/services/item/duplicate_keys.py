@@ -0,0 +1,254 @@
+"""
+아이템 중복 감지 키 (dedup.source, dedup.isbn)
+메타데이터의 출처 URL과 ISBN을 정규화한 키를 아이템을 저장/수정할 때 함께 저장하고
+컬렉션별 unique 인덱스로 조회 (CSV 일괄 등록의 DuplicateChecker가 이 키로 기존 아이템을 찾음)
+
+- 같은 키는 먼저 저장된 아이템이 가짐 (다른 아이템이 가진 키는 저장하지 않음)
+- 키가 없는 기존 아이템(키 저장 이전에 등록된 아이템)은 서버 시작 시 백그라운드로 한 번 채움
+"""
+import asyncio
+import logging
+import re
+from typing import Dict, List, Any, Iterable, Optional, Set, Tuple
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
+from sqlalchemy import select
+
+from backend.app.core.config import settings
+from backend.app.db.base import SessionLocal
+from backend.app.db.mongodb import get_database
+from backend.app.models import Collection
+from backend.app.services.scraper.field_mapper import parse_mapping_config
+from backend.app.services.scraper.scrape_cache import source_key
+
+logger = logging.getLogger(__name__)
+
+DEDUP_FIELD = "dedup"
+DEDUP_FIELDS = ("source", "isbn")
+SOURCE_KEY = "source_url"
+ISBN_KEYS = ("isbn", "ISBN")
+
+# 키를 다시 계산할 때 한 번에 조회/갱신하는 아이템 수
+BACKFILL_BATCH_SIZE = 500
+
+_NON_ISBN_CHARS = re.compile(r'[^0-9X]')
+
+_backfill_task: Optional[asyncio.Task] = None
+
+
+def normalize_isbn(value: Any) -> Optional[str]:
+    """ISBN을 하이픈/공백 없는 ISBN-13으로 정규화 (ISBN-10은 978 접두어로 변환, 형식이 아니면 None)"""
+    if not value:
+        return None
+    chars = _NON_ISBN_CHARS.sub('', str(value).upper())
+    if len(chars) == 13 and chars.isdigit():
+        return chars
+    if len(chars) == 10 and chars[:9].isdigit():
+        core = '978' + chars[:9]
+        check = (10 - sum(int(d) * (3 if i % 2 else 1) for i, d in enumerate(core)) % 10) % 10
+        return core + str(check)
+    return None
+
+
+def find_isbn(data: Dict[str, Any], mapping: Optional[Dict[str, str]] = None) -> Optional[str]:
+    """메타데이터/CSV 추가 데이터에서 ISBN 찾기 (매핑된 키 포함)"""
+    keys = list(ISBN_KEYS)
+    if mapping and mapping.get('isbn'):
+        keys.append(mapping['isbn'])
+    for key in keys:
+        isbn = normalize_isbn(data.get(key))
+        if isbn:
+            return isbn
+    return None
+
+
+def dedup_keys(url: Optional[str], isbn: Optional[str]) -> Dict[str, str]:
+    """중복 감지 키 {'source': ..., 'isbn': ...} (값이 없는 키는 제외)"""
+    keys = {}
+    if url:
+        keys['source'] = source_key(url)
+    if isbn:
+        keys['isbn'] = isbn
+    return keys
+
+
+def _source_fields(mapping: Optional[Dict[str, str]]) -> Set[str]:
+    """출처 URL/ISBN이 들어 있는 메타데이터 키 (매핑으로 이름이 바뀐 키 포함)"""
+    fields = {SOURCE_KEY, *ISBN_KEYS}
+    for source in (SOURCE_KEY, 'isbn'):
+        if mapping and mapping.get(source):
+            fields.add(mapping[source])
+    return fields
+
+
+def item_dedup_keys(metadata: Optional[Dict[str, Any]], mapping: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """아이템 메타데이터 → 중복 감지 키 (mapping: 출처 URL/ISBN 키 이름을 바꾼 컬렉션의 필드 매핑)"""
+    metadata = metadata or {}
+    url = metadata.get((mapping or {}).get(SOURCE_KEY) or SOURCE_KEY)
+    return dedup_keys(url if isinstance(url, str) else None, find_isbn(metadata, mapping))
+
+
+def dedup_keys_changed(values: Dict[str, Any], mapping: Optional[Dict[str, str]] = None) -> bool:
+    """$set 값이 중복 감지 키의 원본(출처 URL, ISBN)을 바꾸는지"""
+    fields = _source_fields(mapping)
+    return any(
+        path == "metadata" or (path.startswith("metadata.") and path[len("metadata."):] in fields)
+        for path in values
+    )
+
+
+def collection_mapping(collection: Collection) -> Dict[str, str]:
+    """컬렉션의 필드 매핑 (키 이름만 사용)"""
+    return parse_mapping_config(collection.field_mapping)[0]
+
+
+async def ensure_dedup_indexes(collection) -> None:
+    """dedup 필드별 unique 인덱스 생성 (문자열 값만, 이미 있으면 그대로)"""
+    for field in DEDUP_FIELDS:
+        path = f"{DEDUP_FIELD}.{field}"
+        try:
+            await collection.create_index(
+                path, unique=True, name=f"dedup_{field}_unique",
+                partialFilterExpression={path: {"$type": "string"}},
+            )
+        except OperationFailure as e:
+            # 기존 데이터 충돌 등: 조회용 일반 인덱스로 대체 (중복 감지는 계속 동작)
+            logger.warning(f"[DEDUP] unique 인덱스 생성 실패 ({collection.name}.{path}): {e}")
+            await collection.create_index(path, name=f"dedup_{field}")
+
+
+async def taken_keys(
+    collection,
+    keys: Iterable[Tuple[str, str]],
+    exclude_ids: Iterable[Any] = (),
+) -> Set[Tuple[str, str]]:
+    """(필드, 값) 중 다른 아이템이 이미 가진 키 (필드별 $in 한 번의 조회)"""
+    values: Dict[str, Set[str]] = {}
+    for field, value in keys:
+        values.setdefault(field, set()).add(value)
+    if not values:
+        return set()
+    query: Dict[str, Any] = {"$or": [
+        {f"{DEDUP_FIELD}.{field}": {"$in": sorted(field_values)}} for field, field_values in values.items()
+    ]}
+    exclude_ids = list(exclude_ids)
+    if exclude_ids:
+        query["_id"] = {"$nin": exclude_ids}
+    taken = set()
+    async for doc in collection.find(query, {DEDUP_FIELD: 1}):
+        for field, value in (doc.get(DEDUP_FIELD) or {}).items():
+            if value in values.get(field, ()):
+                taken.add((field, value))
+    return taken
+
+
+async def assign_available_keys(collection, documents: List[Dict[str, Any]]) -> None:
+    """
+    문서들의 dedup 키 중 다른 아이템이 가진 키를 제외 (문서 목록 순서대로 먼저 나온 문서가 키를 가짐)
+
+    _id가 있는 문서(수정)는 자신이 가진 키를 그대로 유지
+    """
+    wanted = [
+        (field, value) for document in documents for field, value in (document.get(DEDUP_FIELD) or {}).items()
+    ]
+    assigned = await taken_keys(collection, wanted, [document["_id"] for document in documents if "_id" in document])
+    for document in documents:
+        keys = {}
+        for field, value in (document.get(DEDUP_FIELD) or {}).items():
+            if (field, value) in assigned:
+                continue
+            assigned.add((field, value))
+            keys[field] = value
+        document[DEDUP_FIELD] = keys
+
+
+async def _write_keys(collection, documents: List[Dict[str, Any]], retry: bool = True) -> int:
+    """
+    dedup 키 저장 (갱신한 수 반환)
+
+    같은 배치 안에서 키를 넘겨받는 아이템이 먼저 저장되어 충돌하면 한 번 더 시도하고,
+    그래도 충돌하면(그 사이 다른 아이템이 같은 키를 저장) 해당 아이템은 키 없이 표시
+    """
+    try:
+        result = await collection.bulk_write(
+            [UpdateOne({"_id": document["_id"]}, {"$set": {DEDUP_FIELD: document[DEDUP_FIELD]}}) for document in documents],
+            ordered=False,
+        )
+        return result.modified_count
+    except BulkWriteError as e:
+        modified = e.details.get('nModified', 0)
+        failed = [documents[err['index']] for err in e.details.get('writeErrors', [])]
+    if retry:
+        return modified + await _write_keys(collection, failed, retry=False)
+    for document in failed:
+        await collection.update_one({"_id": document["_id"]}, {"$set": {DEDUP_FIELD: {}}})
+    return modified + len(failed)
+
+
+async def refresh_dedup_keys(
+    collection,
+    query: Dict[str, Any],
+    mapping: Optional[Dict[str, str]] = None,
+    batch_size: int = BACKFILL_BATCH_SIZE,
+) -> int:
+    """조건에 맞는 아이템의 dedup 키를 메타데이터로 다시 계산하여 저장 (갱신한 수 반환)"""
+    updated = 0
+    batch: List[Dict[str, Any]] = []
+    async for item in collection.find(query, {"metadata": 1}).sort("_id", 1):
+        batch.append({"_id": item["_id"], DEDUP_FIELD: item_dedup_keys(item.get("metadata"), mapping)})
+        if len(batch) >= batch_size:
+            await assign_available_keys(collection, batch)
+            updated += await _write_keys(collection, batch)
+            batch = []
+    if batch:
+        await assign_available_keys(collection, batch)
+        updated += await _write_keys(collection, batch)
+    return updated
+
+
+async def refresh_missing_dedup_keys(collection, mapping: Optional[Dict[str, str]] = None) -> int:
+    """dedup 필드가 없는 아이템(키 저장 이전에 등록된 아이템)에 키 저장"""
+    return await refresh_dedup_keys(collection, {DEDUP_FIELD: {"$exists": False}}, mapping)
+
+
+async def backfill_dedup_keys() -> None:
+    """모든 아이템 컬렉션에 dedup 인덱스를 만들고 키가 없는 아이템을 채움"""
+    db = SessionLocal()
+    try:
+        targets = [
+            (collection.mongo_collection, collection_mapping(collection))
+            for collection in db.execute(select(Collection)).scalars().all()
+            if collection.mongo_collection
+        ]
+    finally:
+        db.close()
+
+    mongo_db = get_database()
+    for name, mapping in targets:
+        try:
+            await ensure_dedup_indexes(mongo_db[name])
+            updated = await refresh_missing_dedup_keys(mongo_db[name], mapping)
+            if updated:
+                logger.info(f"[DEDUP] {name}: 기존 아이템 {updated}개에 중복 감지 키 추가")
+        except Exception as e:
+            logger.warning(f"[DEDUP] {name} 중복 감지 키 채우기 실패: {e}")
+
+
+async def start_dedup_backfill() -> None:
+    """중복 감지 키 채우기를 백그라운드로 시작 (ITEM_DEDUP_BACKFILL_ON_STARTUP)"""
+    global _backfill_task
+    if settings.ITEM_DEDUP_BACKFILL_ON_STARTUP and _backfill_task is None:
+        _backfill_task = asyncio.create_task(backfill_dedup_keys())
+
+
+async def stop_dedup_backfill() -> None:
+    """진행 중인 중복 감지 키 채우기 중단 (다음 시작 시 남은 아이템부터 이어서 처리)"""
+    global _backfill_task
+    if _backfill_task is not None:
+        _backfill_task.cancel()
+        try:
+            await _backfill_task
+        except (asyncio.CancelledError, Exception):
+            pass
+        _backfill_task = None
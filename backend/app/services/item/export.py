@@ -0,0 +1,294 @@
+"""
+아이템 내보내기 (CSV / JSONL / Parquet)
+컬렉션을 MongoDB 커서 하나로 _id 순서로 읽어 배치마다 바로 출력하므로 아이템 수와 관계없이 메모리 사용량이 일정
+
+- csv: metadata를 열로 펼침 (field_definitions 순서, 정의에 없는 키는 뒤에), 시스템 열은 _ 접두어
+- jsonl: 한 줄에 아이템 하나 ({"_id", "title", "is_public", "metadata", "created_at", "updated_at"})
+- parquet: csv와 같은 열 구성 (pyarrow 필요)
+"""
+import csv
+import io
+import json
+import logging
+from datetime import datetime
+from typing import Dict, List, Any, AsyncIterator, Optional, Tuple
+
+from bson import ObjectId
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from backend.app.db.mongodb import get_database
+from backend.app.services.collection import get_collection_by_id
+from backend.app.services.item.item_service import build_item_query
+
+logger = logging.getLogger(__name__)
+
+# 형식 → (media type, 확장자)
+EXPORT_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "jsonl": ("application/x-ndjson", "jsonl"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+# 커서에서 한 번에 가져오는 문서 수 (= CSV/JSONL 출력 단위)
+EXPORT_BATCH_SIZE = 1000
+# Parquet row group 크기 (row group 하나만큼 메모리에 모았다가 출력)
+PARQUET_ROW_GROUP_SIZE = 10000
+
+# CSV/Parquet 시스템 열 (metadata 키와 겹치지 않도록 _ 접두어, 다시 가져올 때 metadata에서 제외)
+SYSTEM_COLUMNS = ("_id", "_is_public", "_created_at", "_updated_at")
+
+
+def check_format(fmt: str) -> None:
+    """지원 형식인지, Parquet이면 pyarrow가 설치되어 있는지 확인 (ValueError)"""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"format은 {', '.join(EXPORT_FORMATS)} 중 하나여야 합니다.")
+    if fmt == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ValueError("Parquet 내보내기에는 pyarrow가 필요합니다. (pip install pyarrow)")
+
+
+def definition_keys(field_definitions: Optional[Dict[str, Any]]) -> List[str]:
+    """field_definitions의 필드 키 (정의 순서)"""
+    fields = (field_definitions or {}).get("fields") or []
+    return [field["key"] for field in fields if isinstance(field, dict) and field.get("key")]
+
+
+async def metadata_keys(collection, query: Dict[str, Any]) -> List[str]:
+    """조건에 맞는 아이템의 metadata 키 목록 (처음 나온 아이템 순서, 서버에서 집계)"""
+    pipeline = [
+        {"$match": query},
+        {"$project": {"keys": {"$map": {
+            "input": {"$objectToArray": {"$ifNull": ["$metadata", {}]}},
+            "in": "$$this.k",
+        }}}},
+        {"$unwind": "$keys"},
+        {"$group": {"_id": "$keys", "first": {"$min": "$_id"}}},
+        {"$sort": {"first": 1, "_id": 1}},
+    ]
+    return [doc["_id"] async for doc in collection.aggregate(pipeline, allowDiskUse=True)]
+
+
+def export_columns(field_definitions: Optional[Dict[str, Any]], keys: List[str]) -> List[str]:
+    """열 순서: field_definitions 순서 → 정의에 없는 metadata 키 → 시스템 열"""
+    columns = definition_keys(field_definitions)
+    defined = set(columns)
+    columns += [key for key in keys if key not in defined]
+    return columns + list(SYSTEM_COLUMNS)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"{type(value).__name__}는 JSON으로 변환할 수 없습니다.")
+
+
+def _cell(value: Any) -> str:
+    """CSV/Parquet 셀 값 (목록/객체는 JSON 문자열)"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False, default=_json_default)
+    return str(value)
+
+
+def flatten_item(item: Dict[str, Any], columns: List[str]) -> List[str]:
+    """아이템 문서 → 열 순서대로 펼친 값"""
+    metadata = item.get("metadata") or {}
+    system = {
+        "_id": item["_id"],
+        "_is_public": item.get("is_public", True),
+        "_created_at": item.get("created_at"),
+        "_updated_at": item.get("updated_at"),
+    }
+    if not metadata.get("title"):
+        metadata = {**metadata, "title": item.get("title")}
+    return [_cell(system[column] if column in system else metadata.get(column)) for column in columns]
+
+
+def item_record(item: Dict[str, Any]) -> Dict[str, Any]:
+    """JSONL 한 줄 (아이템 생성 요청과 같은 구조 + _id/시각)"""
+    return {
+        "_id": str(item["_id"]),
+        "title": item.get("title"),
+        "is_public": item.get("is_public", True),
+        "metadata": item.get("metadata") or {},
+        "created_at": item.get("created_at"),
+        "updated_at": item.get("updated_at"),
+    }
+
+
+class _ChunkSink(io.RawIOBase):
+    """ParquetWriter 출력을 받아 두었다가 꺼내 가는 버퍼 (tell은 전체 기록량)"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class ItemExporter:
+    """
+    컬렉션 하나의 내보내기
+
+    stream()이 출력 바이트를 배치 단위로 생성하며, exported에 지금까지 내보낸 아이템 수를 기록합니다.
+    """
+
+    def __init__(
+        self,
+        collection,
+        fmt: str,
+        query: Optional[Dict[str, Any]] = None,
+        field_definitions: Optional[Dict[str, Any]] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ):
+        check_format(fmt)
+        self.collection = collection
+        self.fmt = fmt
+        self.query = query or {}
+        self.field_definitions = field_definitions
+        self.batch_size = max(1, batch_size)
+        self.exported = 0
+
+    @property
+    def media_type(self) -> str:
+        return EXPORT_FORMATS[self.fmt][0]
+
+    def filename(self, name: str) -> str:
+        return f"{name}.{EXPORT_FORMATS[self.fmt][1]}"
+
+    async def _batches(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        cursor = self.collection.find(self.query).sort("_id", 1).batch_size(self.batch_size)
+        batch = []
+        async for item in cursor:
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        if self.fmt == "jsonl":
+            stream = self._stream_jsonl()
+        elif self.fmt == "parquet":
+            stream = self._stream_parquet()
+        else:
+            stream = self._stream_csv()
+        async for chunk in stream:
+            yield chunk
+        logger.info(f"[EXPORT] {self.collection.name}: {self.exported}개 ({self.fmt})")
+
+    async def _columns(self) -> List[str]:
+        return export_columns(self.field_definitions, await metadata_keys(self.collection, self.query))
+
+    async def _stream_csv(self) -> AsyncIterator[bytes]:
+        columns = await self._columns()
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        # BOM: 엑셀에서 한글이 깨지지 않도록 (CSV 일괄 등록은 BOM 유무와 관계없이 읽음)
+        yield "\ufeff".encode("utf-8") + buffer.getvalue().encode("utf-8")
+        async for batch in self._batches():
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(flatten_item(item, columns) for item in batch)
+            self.exported += len(batch)
+            yield buffer.getvalue().encode("utf-8")
+
+    async def _stream_jsonl(self) -> AsyncIterator[bytes]:
+        async for batch in self._batches():
+            lines = [json.dumps(item_record(item), ensure_ascii=False, default=_json_default) for item in batch]
+            self.exported += len(batch)
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+
+    async def _stream_parquet(self) -> AsyncIterator[bytes]:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        columns = await self._columns()
+        schema = pa.schema([
+            pa.field(column, pa.bool_() if column == "_is_public" else pa.string()) for column in columns
+        ])
+        sink = _ChunkSink()
+        writer = pq.ParquetWriter(sink, schema)
+        rows: List[List[Any]] = []
+
+        def write_row_group() -> None:
+            values = list(zip(*rows))
+            arrays = [
+                pa.array([value == "true" for value in values[i]] if column == "_is_public" else list(values[i]),
+                         type=schema.field(i).type)
+                for i, column in enumerate(columns)
+            ]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+        try:
+            async for batch in self._batches():
+                rows.extend(flatten_item(item, columns) for item in batch)
+                self.exported += len(batch)
+                if len(rows) >= PARQUET_ROW_GROUP_SIZE:
+                    write_row_group()
+                    rows = []
+                    yield sink.drain()
+            if rows:
+                write_row_group()
+        finally:
+            writer.close()
+        yield sink.drain()
+
+
+async def create_item_exporter(
+    collection_id: int,
+    db: Session,
+    fmt: str = "csv",
+    is_owner: bool = False,
+    search_query: Optional[str] = None,
+    search_field: Optional[str] = None,
+) -> Tuple[ItemExporter, str]:
+    """
+    API용 내보내기 준비 (목록 조회와 같은 공개 여부/검색 조건)
+
+    Returns:
+        (ItemExporter, 다운로드 파일명)
+    """
+    try:
+        check_format(fmt)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    collection = await get_collection_by_id(collection_id, db)
+    if not collection.mongo_collection:
+        raise HTTPException(status_code=500, detail="MongoDB collection not configured")
+
+    exporter = ItemExporter(
+        get_database()[collection.mongo_collection],
+        fmt,
+        query=build_item_query(is_owner, search_query, search_field),
+        field_definitions=collection.field_definitions,
+    )
+    return exporter, exporter.filename(collection.slug)
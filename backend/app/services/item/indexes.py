@@ -0,0 +1,247 @@
+"""
+아이템 컬렉션 MongoDB 인덱스 관리
+컬렉션의 field_definitions(sortable/filterable)에서 필요한 인덱스 목록을 만들고
+실제 items_* 컬렉션의 인덱스와 비교하여 없는 인덱스는 생성, 더 이상 필요 없는 관리 인덱스는 삭제
+
+- 기본: 목록 기본 정렬(등록일) 인덱스 + 검색 토큰 인덱스
+- sortable 필드 (title은 항상): (is_public, metadata.<key>, _id) 공개 목록용 + (metadata.<key>, _id) Owner 목록용, 한국어 collation
+- filterable 필드: metadata.<key> 일치 조건용 (collation 없음)
+- 서버 시작 시 모든 컬렉션, 컬렉션의 field_definitions가 바뀔 때 해당 컬렉션을 백그라운드로 맞춤
+- 관리 대상이 아닌 인덱스(중복 감지 등)는 삭제하지 않고 보고만 함
+"""
+import asyncio
+import logging
+from typing import Dict, List, Any, Optional, Tuple
+
+from sqlalchemy import select
+
+from backend.app.core.config import settings
+from backend.app.db.base import SessionLocal
+from backend.app.db.mongodb import get_database
+from backend.app.models import Collection
+from backend.app.services.item.pagination import LIST_INDEXES, sort_field
+from backend.app.services.item.search import SEARCH_INDEX, RELEVANCE
+
+logger = logging.getLogger(__name__)
+
+# 메타데이터 필드 정렬용 collation (한국어 정렬 + '2권' < '10권' 숫자 정렬)
+# 인덱스와 조회의 collation이 같아야 인덱스로 정렬하므로 목록 조회도 list_collation()으로 같은 값 사용
+KOREAN_COLLATION = {"locale": "ko", "numericOrdering": True}
+
+# 관리 인덱스 이름 접두어 (field_definitions에서 빠지면 삭제 대상)
+SORT_PREFIX = "sort_"
+PUBLIC_SORT_PREFIX = "public_sort_"
+FILTER_PREFIX = "filter_"
+MANAGED_PREFIXES = (SORT_PREFIX, PUBLIC_SORT_PREFIX, FILTER_PREFIX)
+
+# title은 field_definitions와 관계없이 항상 정렬 가능 (목록 화면 기본 정렬 옵션)
+ALWAYS_SORTABLE = ("title",)
+
+_reconcile_task: Optional[asyncio.Task] = None
+_running_tasks: set = set()
+
+
+def _valid_key(key: Any) -> bool:
+    return isinstance(key, str) and bool(key) and not key.startswith("$") and "." not in key
+
+
+def _field_keys(field_definitions: Optional[Dict[str, Any]], flag: str) -> List[str]:
+    fields = (field_definitions or {}).get("fields") or []
+    return [
+        field["key"] for field in fields
+        if isinstance(field, dict) and field.get(flag) and _valid_key(field.get("key"))
+    ]
+
+
+def desired_indexes(field_definitions: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """field_definitions → 있어야 하는 인덱스 목록 ({"name", "keys", "collation"})"""
+    indexes: List[Dict[str, Any]] = [
+        {"name": None, "keys": keys, "collation": None} for keys in LIST_INDEXES
+    ]
+    indexes.append({"name": None, "keys": SEARCH_INDEX, "collation": None})
+
+    sortable = list(dict.fromkeys([*ALWAYS_SORTABLE, *_field_keys(field_definitions, "sortable")]))
+    for key in sortable:
+        path = sort_field(key)
+        indexes.append({
+            "name": f"{PUBLIC_SORT_PREFIX}{key}",
+            "keys": [("is_public", 1), (path, 1), ("_id", 1)],
+            "collation": KOREAN_COLLATION,
+        })
+        indexes.append({
+            "name": f"{SORT_PREFIX}{key}",
+            "keys": [(path, 1), ("_id", 1)],
+            "collation": KOREAN_COLLATION,
+        })
+    for key in _field_keys(field_definitions, "filterable"):
+        indexes.append({"name": f"{FILTER_PREFIX}{key}", "keys": [(sort_field(key), 1)], "collation": None})
+    return indexes
+
+
+def list_collation(sort_key: str, search_query: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    목록 조회에 사용할 collation (메타데이터 필드 정렬일 때만 KOREAN_COLLATION)
+
+    검색 중에는 collation 없이 조회하여 검색 토큰 인덱스로 후보를 좁힘
+    (한글 음절은 코드 순서도 가나다순이므로 검색 결과 정렬은 대소문자/숫자 정렬만 다름)
+    """
+    if sort_key in ("created_at", RELEVANCE) or search_query:
+        return None
+    return KOREAN_COLLATION
+
+
+def _signature(keys: Any, collation: Optional[Dict[str, Any]]) -> Tuple:
+    """인덱스 비교 기준 (키 순서/방향 + collation 로케일/숫자 정렬)"""
+    normalized_keys = tuple(
+        (field, int(direction) if isinstance(direction, (int, float)) else direction) for field, direction in keys
+    )
+    if not collation or collation.get("locale", "simple") == "simple":
+        return normalized_keys, None
+    return normalized_keys, (collation.get("locale"), bool(collation.get("numericOrdering", False)))
+
+
+def _display_name(index: Dict[str, Any]) -> str:
+    return index["name"] or "_".join(f"{field}_{direction}" for field, direction in index["keys"])
+
+
+async def _unused_indexes(collection) -> List[str]:
+    """서버 시작 후 한 번도 사용되지 않은 인덱스 ($indexStats, 권한이 없으면 빈 목록)"""
+    try:
+        stats = await collection.aggregate([{"$indexStats": {}}]).to_list(None)
+    except Exception as e:
+        logger.debug(f"[INDEX] {collection.name} $indexStats 조회 실패: {e}")
+        return []
+    return sorted(
+        stat["name"] for stat in stats
+        if stat["name"] != "_id_" and not (stat.get("accesses") or {}).get("ops")
+    )
+
+
+async def reconcile_indexes(
+    collection,
+    field_definitions: Optional[Dict[str, Any]],
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """
+    아이템 컬렉션의 인덱스를 field_definitions에 맞춤
+
+    Returns:
+        {"collection", "created", "dropped", "missing", "stale", "unmanaged", "unused", "failed"}
+        (dry_run이면 created/dropped 대신 missing/stale에 할 일만 기록)
+    """
+    existing = await collection.index_information()
+    existing_by_signature = {
+        _signature(info["key"], info.get("collation")): name for name, info in existing.items()
+    }
+
+    report: Dict[str, Any] = {
+        "collection": collection.name,
+        "created": [],
+        "dropped": [],
+        "missing": [],
+        "stale": [],
+        "unmanaged": [],
+        "unused": [],
+        "failed": [],
+    }
+
+    matched = set()
+    missing: List[Dict[str, Any]] = []
+    for index in desired_indexes(field_definitions):
+        name = existing_by_signature.get(_signature(index["keys"], index["collation"]))
+        if name is None:
+            missing.append(index)
+        else:
+            matched.add(name)
+
+    # 필요 없는 관리 인덱스를 먼저 삭제 (같은 이름으로 다시 만드는 경우 충돌 방지)
+    for name in sorted(existing):
+        if name == "_id_" or name in matched:
+            continue
+        if not name.startswith(MANAGED_PREFIXES):
+            report["unmanaged"].append(name)
+        elif dry_run:
+            report["stale"].append(name)
+        else:
+            try:
+                await collection.drop_index(name)
+                report["dropped"].append(name)
+            except Exception as e:
+                logger.warning(f"[INDEX] {collection.name} 인덱스 삭제 실패 ({name}): {e}")
+                report["failed"].append({"name": name, "error": str(e)})
+
+    for index in missing:
+        display_name = _display_name(index)
+        if dry_run:
+            report["missing"].append(display_name)
+            continue
+        options: Dict[str, Any] = {}
+        if index["name"]:
+            options["name"] = index["name"]
+        if index["collation"]:
+            options["collation"] = index["collation"]
+        try:
+            await collection.create_index(index["keys"], **options)
+            report["created"].append(display_name)
+        except Exception as e:
+            logger.warning(f"[INDEX] {collection.name} 인덱스 생성 실패 ({display_name}): {e}")
+            report["failed"].append({"name": display_name, "error": str(e)})
+
+    report["unused"] = await _unused_indexes(collection)
+    if report["created"] or report["dropped"]:
+        logger.info(f"[INDEX] {collection.name}: 생성 {report['created']}, 삭제 {report['dropped']}")
+    return report
+
+
+async def reconcile_all_indexes() -> None:
+    """모든 아이템 컬렉션의 인덱스를 field_definitions에 맞춤 (서버 시작 시)"""
+    db = SessionLocal()
+    try:
+        targets = [
+            (collection.mongo_collection, collection.field_definitions)
+            for collection in db.execute(select(Collection)).scalars().all()
+            if collection.mongo_collection
+        ]
+    finally:
+        db.close()
+
+    mongo_db = get_database()
+    for name, field_definitions in targets:
+        try:
+            report = await reconcile_indexes(mongo_db[name], field_definitions)
+            if report["unmanaged"]:
+                logger.info(f"[INDEX] {name}: 관리 대상이 아닌 인덱스 {report['unmanaged']}")
+        except Exception as e:
+            logger.warning(f"[INDEX] {name} 인덱스 맞추기 실패: {e}")
+
+
+def schedule_reconcile(mongo_collection_name: str, field_definitions: Optional[Dict[str, Any]]) -> None:
+    """필드 정의 변경 후 해당 컬렉션의 인덱스를 백그라운드로 맞춤 (큰 컬렉션의 인덱스 생성을 요청에서 기다리지 않음)"""
+    async def run() -> None:
+        try:
+            await reconcile_indexes(get_database()[mongo_collection_name], field_definitions)
+        except Exception as e:
+            logger.warning(f"[INDEX] {mongo_collection_name} 인덱스 맞추기 실패: {e}")
+
+    task = asyncio.create_task(run())
+    _running_tasks.add(task)
+    task.add_done_callback(_running_tasks.discard)
+
+
+async def start_index_reconcile() -> None:
+    """모든 컬렉션 인덱스 맞추기를 백그라운드로 시작 (ITEM_INDEX_RECONCILE_ON_STARTUP)"""
+    global _reconcile_task
+    if settings.ITEM_INDEX_RECONCILE_ON_STARTUP and _reconcile_task is None:
+        _reconcile_task = asyncio.create_task(reconcile_all_indexes())
+
+
+async def stop_index_reconcile() -> None:
+    """진행 중인 인덱스 맞추기 중단 (이미 시작한 인덱스 생성은 MongoDB에서 계속 진행)"""
+    global _reconcile_task
+    if _reconcile_task is not None:
+        _reconcile_task.cancel()
+        try:
+            await _reconcile_task
+        except (asyncio.CancelledError, Exception):
+            pass
+        _reconcile_task = None
@@ -0,0 +1,336 @@
+"""
+아이템 직접 가져오기 (스크래핑 없이 JSONL / CSV)
+이미 메타데이터가 있는 행(이전 스프레드시트, 내보내기 파일 등)을 field_definitions로 검증하고
+저장된 field_mapping(매핑 시 number/date 값 변환 포함)을 배치마다 한 번에 적용한 뒤 큰 배치의 insert_many로 저장
+
+- jsonl: 한 줄에 객체 하나. {"metadata": {...}, "title", "is_public", "_id", "created_at"} 형식(내보내기 파일)이거나
+  메타데이터 객체 자체
+- csv: 열 = 메타데이터 필드, _ 접두어 열은 시스템 열 (_id, _is_public, _created_at)
+- 유효한 _id가 있으면 그대로 사용하므로 같은 파일을 다시 가져오면 이미 있는 아이템은 건너뜀 (skipped)
+- field_mapping은 apply_mapping=True일 때만 적용 (내보내기 파일은 이미 매핑된 키이므로 적용하지 않음)
+"""
+import codecs
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Dict, List, Any, AsyncGenerator, Optional, Tuple
+
+from bson import ObjectId
+from fastapi import UploadFile
+from pydantic import ValidationError
+
+from backend.app.core.config import settings
+from backend.app.models.collection import Collection
+from backend.app.schemas.item import ItemCreate
+from backend.app.services.item import duplicate_keys
+from backend.app.services.item.item_service import build_item_document
+from backend.app.services.scraper.csv_processor import iter_csv_records, CSV_READ_CHUNK_SIZE
+from backend.app.services.scraper.item_writer import ItemBatchWriter, DUPLICATE_KEY_ERROR, ORDERED_ABORTED
+from backend.app.services.scraper.field_mapper import compiled_mapping_for
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ("jsonl", "csv")
+
+# 개별 error_item 이벤트를 보내는 최대 수 (이후 실패는 개수만 집계)
+MAX_ERROR_EVENTS = 100
+
+# (행 번호, 레코드, 읽기 오류)
+ImportRecord = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+async def iter_jsonl_records(file: UploadFile) -> AsyncGenerator[ImportRecord, None]:
+    """업로드된 JSONL을 청크 단위로 읽으며 (줄 번호, 객체, 오류) 생성 (빈 줄은 건너뜀)"""
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    partial = ''
+    line_number = 0
+
+    while True:
+        chunk = await file.read(CSV_READ_CHUNK_SIZE)
+        final = not chunk
+        try:
+            text = partial + decoder.decode(chunk, final=final)
+        except UnicodeDecodeError:
+            raise ValueError("JSONL 파일 인코딩 오류 (UTF-8 형식이어야 합니다)")
+
+        lines = text.split('\n')
+        partial = '' if final else lines.pop()
+        for line in lines:
+            line_number += 1
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, None, f"JSON 형식 오류 ({e.msg})"
+                continue
+            if not isinstance(record, dict):
+                yield line_number, None, "JSON 객체가 아닙니다"
+                continue
+            yield line_number, record, None
+
+        if final:
+            break
+
+
+async def iter_csv_import_records(file: UploadFile) -> AsyncGenerator[ImportRecord, None]:
+    """업로드된 CSV를 (행 번호, row, None)으로 생성 (행 번호는 헤더 다음 줄부터 2)"""
+    row_number = 1
+    async for row in iter_csv_records(file):
+        row_number += 1
+        yield row_number, row, None
+
+
+def _parse_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() not in ("false", "0", "no", "n", "비공개")
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def split_record(record: Dict[str, Any], fmt: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    레코드 → (메타데이터, 시스템 값 {'_id', 'title', 'is_public', 'created_at'})
+
+    CSV 값은 앞뒤 공백을 제거하고 빈 값은 제외
+    """
+    if fmt == "jsonl" and isinstance(record.get("metadata"), dict):
+        system = {key: record.get(key) for key in ("_id", "title", "is_public", "created_at")}
+        return dict(record["metadata"]), system
+
+    metadata = {}
+    system = {}
+    for key, value in record.items():
+        if key is None:
+            continue  # 헤더보다 많은 열
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                continue
+        if key.startswith("_"):
+            system[key[1:] if key != "_id" else key] = value
+        else:
+            metadata[key] = value
+    return metadata, system
+
+
+class FieldValidator:
+    """
+    field_definitions 기반 메타데이터 검증 (컬렉션마다 한 번 생성)
+
+    - required 필드 누락
+    - number 필드: 숫자 문자열은 int/float로 변환, 숫자가 아니면 오류
+      (매핑을 적용하면 '12,000원' 같은 값은 매핑 단계에서 이미 변환됨)
+    - select 필드: options에 없는 값이면 오류
+    """
+
+    def __init__(self, field_definitions: Optional[Dict[str, Any]]):
+        fields = [field for field in (field_definitions or {}).get("fields") or [] if isinstance(field, dict)]
+        self.required = [field["key"] for field in fields if field.get("required") and field.get("key")]
+        self.numbers = [field["key"] for field in fields if field.get("type") == "number" and field.get("key")]
+        self.options = {
+            field["key"]: set(field["options"])
+            for field in fields
+            if field.get("type") == "select" and field.get("options") and field.get("key")
+        }
+
+    def validate(self, metadata: Dict[str, Any]) -> Optional[str]:
+        """검증 오류 메시지 (정상이면 None, number 필드는 metadata에서 변환)"""
+        for key in self.required:
+            if metadata.get(key) in (None, ""):
+                return f"필수 필드 누락: {key}"
+        for key in self.numbers:
+            value = metadata.get(key)
+            if isinstance(value, str):
+                try:
+                    number = float(value.replace(",", ""))
+                except ValueError:
+                    return f"숫자가 아닙니다: {key}={value!r}"
+                metadata[key] = int(number) if number.is_integer() else number
+        for key, options in self.options.items():
+            value = metadata.get(key)
+            if value not in (None, "") and value not in options:
+                return f"선택할 수 없는 값입니다: {key}={value!r}"
+        return None
+
+
+class ItemImporter:
+    """
+    컬렉션 하나에 대한 직접 가져오기
+
+    events(file)이 진행 이벤트(dict)를 생성합니다:
+        - start: {'format', 'batch_size', 'ordered'}
+        - error_item: 읽기/검증/저장 실패 행 (최대 MAX_ERROR_EVENTS개)
+        - progress: 배치 저장마다 {'processed', 'imported', 'failed', 'skipped', 'rate'}
+        - complete: 최종 개수 + 소요 시간, ordered 모드에서 실패로 멈췄으면 stopped=True
+        - error: 파일 형식 오류 등으로 중단
+    """
+
+    def __init__(
+        self,
+        collection: Collection,
+        fmt: str,
+        apply_mapping: bool = False,
+        ordered: bool = False,
+        batch_size: Optional[int] = None,
+    ):
+        if fmt not in IMPORT_FORMATS:
+            raise ValueError(f"format은 {', '.join(IMPORT_FORMATS)} 중 하나여야 합니다.")
+        if not collection.mongo_collection:
+            raise ValueError("MongoDB 컬렉션이 설정되지 않았습니다.")
+        self.collection = collection
+        self.fmt = fmt
+        self.ordered = ordered
+        self.batch_size = max(1, batch_size or settings.ITEM_IMPORT_BATCH_SIZE)
+        self.validator = FieldValidator(collection.field_definitions)
+
+        self.mapper = compiled_mapping_for(collection, apply_mapping)
+        # 매핑을 적용하면 출처 URL/ISBN도 매핑된 키에서 찾음 (중복 감지 키)
+        self.dedup_mapping = duplicate_keys.collection_mapping(collection) if apply_mapping else None
+
+        self.imported = 0
+        self.failed = 0
+        self.skipped = 0
+        self.stopped = False
+        self._error_events = 0
+        self._started_at = 0.0
+
+    @property
+    def processed(self) -> int:
+        return self.imported + self.failed + self.skipped
+
+    def _records(self, file: UploadFile) -> AsyncGenerator[ImportRecord, None]:
+        return iter_jsonl_records(file) if self.fmt == "jsonl" else iter_csv_import_records(file)
+
+    def _counts(self) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self._started_at
+        return {
+            'processed': self.processed,
+            'imported': self.imported,
+            'failed': self.failed,
+            'skipped': self.skipped,
+            'elapsed_seconds': round(elapsed, 3),
+            'rate': round(self.processed / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+
+    def _error_event(self, row_number: int, message: str) -> Optional[Dict[str, Any]]:
+        self.failed += 1
+        self._error_events += 1
+        if self._error_events > MAX_ERROR_EVENTS:
+            return None
+        return {'type': 'error_item', 'index': row_number, 'message': f"행 {row_number}: {message}"}
+
+    def _prepare_batch(self, batch: List[ImportRecord]) -> Tuple[List[Tuple[int, Dict[str, Any]]], List[Tuple[int, str]]]:
+        """
+        배치의 레코드를 아이템 문서로 변환 (매핑/값 변환은 배치 단위로 적용)
+
+        Returns:
+            (저장할 (행 번호, 문서) 목록, (행 번호, 오류) 목록)
+            ordered 모드에서는 첫 오류 행 앞까지만 저장 대상
+        """
+        split = [
+            (row_number, *split_record(record, self.fmt)) for row_number, record, error in batch if error is None
+        ]
+        errors = [(row_number, error) for row_number, _, error in batch if error is not None]
+
+        mapped = self.mapper.apply_many([metadata for _, metadata, _ in split])
+        split = [(row_number, metadata, system) for (row_number, _, system), metadata in zip(split, mapped)]
+
+        documents = []
+        for row_number, metadata, system in split:
+            error = self.validator.validate(metadata)
+            if error is None:
+                try:
+                    item_data = ItemCreate(
+                        collection_id=self.collection.id,
+                        title=system.get("title") or None,
+                        is_public=_parse_bool(system["is_public"]) if system.get("is_public") is not None else True,
+                        metadata=metadata,
+                    )
+                except ValidationError as e:
+                    error = f"형식 오류 ({e.errors()[0].get('msg')})"
+            if error is not None:
+                errors.append((row_number, error))
+                continue
+            document = build_item_document(item_data, self.dedup_mapping)
+            if ObjectId.is_valid(str(system.get("_id") or "")):
+                document["_id"] = ObjectId(str(system["_id"]))
+            created_at = _parse_datetime(system.get("created_at"))
+            if created_at:
+                document["created_at"] = created_at
+            documents.append((row_number, document))
+
+        if self.ordered and errors:
+            first_error = min(row_number for row_number, _ in errors)
+            documents = [(row_number, document) for row_number, document in documents if row_number < first_error]
+            errors = [min(errors)]
+        return documents, sorted(errors)
+
+    async def _write_batch(self, writer: ItemBatchWriter, batch: List[ImportRecord]) -> List[Dict[str, Any]]:
+        documents, errors = self._prepare_batch(batch)
+        # 다른 아이템(또는 배치의 앞선 행)이 가진 중복 감지 키는 저장하지 않음 (배치마다 한 번 조회)
+        await duplicate_keys.assign_available_keys(writer.collection, [document for _, document in documents])
+        for row_number, document in documents:
+            writer.add(row_number, document)
+
+        write_errors = []
+        write_failed = False
+        for row_number, item, error, code in await writer.flush():
+            if item is not None:
+                self.imported += 1
+                continue
+            write_failed = True
+            if code == DUPLICATE_KEY_ERROR:
+                self.skipped += 1  # 같은 _id(이미 가져온 아이템) 또는 중복 감지 키
+            elif error != ORDERED_ABORTED:
+                write_errors.append((row_number, f"저장 실패 ({error})"))
+
+        if self.ordered and write_failed:
+            # 저장이 멈춘 행 뒤의 검증 오류 행은 처리하지 않은 것으로 봄
+            errors = write_errors
+        else:
+            errors = sorted(errors + write_errors)
+        if self.ordered and (errors or write_failed):
+            self.stopped = True
+
+        events = [event for event in (self._error_event(*error) for error in errors) if event]
+        events.append({'type': 'progress', **self._counts()})
+        return events
+
+    async def events(self, file: UploadFile) -> AsyncGenerator[Dict[str, Any], None]:
+        self._started_at = time.perf_counter()
+        writer = ItemBatchWriter(self.collection.mongo_collection, self.batch_size, 0.0, ordered=self.ordered)
+        yield {'type': 'start', 'format': self.fmt, 'batch_size': self.batch_size, 'ordered': self.ordered}
+
+        batch: List[ImportRecord] = []
+        try:
+            async for record in self._records(file):
+                batch.append(record)
+                if len(batch) < self.batch_size:
+                    continue
+                for event in await self._write_batch(writer, batch):
+                    yield event
+                batch = []
+                if self.stopped:
+                    break
+            if batch and not self.stopped:
+                for event in await self._write_batch(writer, batch):
+                    yield event
+        except ValueError as e:
+            yield {'type': 'error', 'message': str(e), **self._counts()}
+            return
+
+        counts = self._counts()
+        logger.info(f"[IMPORT] {self.collection.mongo_collection} ({self.fmt}): {counts}")
+        yield {'type': 'complete', 'stopped': self.stopped, **counts}
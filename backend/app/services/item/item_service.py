@@ -2,23 +2,32 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 from fastapi import HTTPException
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+import re
 from bson import ObjectId
 from datetime import datetime, timezone
+from pymongo.errors import DuplicateKeyError
 
 from backend.app.models import Collection
 from backend.app.schemas.item import ItemCreate, ItemUpdate
 from backend.app.db.mongodb import get_database
+from backend.app.services.item import pagination, search, indexes, projection, duplicate_keys
+from backend.app.services.item.count_cache import get_item_count_cache, invalidate_item_counts
+
+
+# 응답에서 제외하는 내부 필드 (검색 토큰)
+ITEM_PROJECTION = {search.SEARCH_TOKENS_FIELD: 0}
 
 
 def item_helper(item: dict) -> dict:
     """MongoDB 문서를 Pydantic 모델로 변환"""
     item["_id"] = str(item["_id"])
+    item.pop(search.SEARCH_TOKENS_FIELD, None)
     return item
 
 
-async def get_mongo_collection_name(collection_id: int, db: Session) -> str:
-    """PostgreSQL에서 검증된 MongoDB 컬렉션명 조회 (SQL Injection 방지)"""
+async def get_item_collection(collection_id: int, db: Session) -> Collection:
+    """MongoDB 컬렉션이 설정된 컬렉션 조회 (field_definitions 등이 필요할 때)"""
     collection = db.execute(
         select(Collection).filter(Collection.id == collection_id)
     ).scalar_one_or_none()
@@ -29,9 +38,36 @@ async def get_mongo_collection_name(collection_id: int, db: Session) -> str:
     if not collection.mongo_collection:
         raise HTTPException(status_code=500, detail="MongoDB collection not configured")
 
+    return collection
+
+
+async def get_mongo_collection_name(collection_id: int, db: Session) -> str:
+    """PostgreSQL에서 검증된 MongoDB 컬렉션명 조회 (SQL Injection 방지)"""
+    collection = await get_item_collection(collection_id, db)
     return collection.mongo_collection
 
 
+def build_item_query(
+    is_owner: bool = False,
+    search_query: Optional[str] = None,
+    search_field: Optional[str] = None
+) -> Dict[str, Any]:
+    """목록 조회 조건 (공개 여부 + 검색) - 일괄 수정 필터와 공유"""
+    query = {} if is_owner else {"is_public": True}
+
+    # 검색 조건 추가 (search_tokens n-gram 인덱스 조회)
+    if search_query and search_field:
+        condition = search.build_search_condition(search_query, search_field)
+        if condition is not None:
+            query.update(condition)
+        else:
+            # 단어가 없는 검색어(기호만 입력 등)는 글자 그대로 부분 일치
+            path = "metadata.title" if search_field == "all" else f"metadata.{search_field}"
+            query[path] = {"$regex": re.escape(search_query), "$options": "i"}
+
+    return query
+
+
 async def get_all_items(
     collection_id: int,
     db: Session,
@@ -41,43 +77,97 @@ async def get_all_items(
     search_query: Optional[str] = None,
     search_field: Optional[str] = None,
     sort_key: str = "created_at",
-    sort_order: str = "desc"
+    sort_order: str = "desc",
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    view: str = projection.FULL,
+    fields: Optional[List[str]] = None
 ) -> Dict[str, Any]:
-    """아이템 목록 조회 (페이지네이션, 검색, 정렬)"""
-    mongo_collection_name = await get_mongo_collection_name(collection_id, db)
+    """
+    아이템 목록 조회 (페이지네이션, 검색, 정렬)
+
+    - cursor가 None이면 페이지 번호 방식 (skip/limit)
+    - cursor가 있으면 커서 방식: 빈 문자열은 첫 페이지, 이후는 응답의 next_cursor (페이지 깊이와 관계없이 비용 동일)
+    - include_total=False면 전체 개수를 세지 않음 (total/total_pages는 None)
+    - sort_key="relevance": 검색어가 제목에 많이 들어 있는 순 (검색어가 없으면 등록일순, 페이지 번호 방식만 지원)
+    - view="summary" 또는 fields: 목록에 필요한 필드만 조회 (field_definitions 기준, projection 참고)
+    """
+    collection = await get_item_collection(collection_id, db)
+    mongo_collection_name = collection.mongo_collection
 
     mongo_db = get_database()
-    query = {} if is_owner else {"is_public": True}
-
-    # 검색 조건 추가
-    if search_query and search_field:
-        if search_field == "all":
-            # 전체 검색: metadata의 모든 값에서 검색 (정규식 사용)
-            query["$or"] = [
-                {f"metadata.{key}": {"$regex": search_query, "$options": "i"}}
-                for key in ["title", "author", "publisher", "category"]  # 주요 필드만
-            ]
-        else:
-            # 특정 필드 검색
-            query[f"metadata.{search_field}"] = {"$regex": search_query, "$options": "i"}
-
-    # 전체 개수 조회
-    total = await mongo_db[mongo_collection_name].count_documents(query)
-
-    # 정렬 설정
-    sort_direction = -1 if sort_order == "desc" else 1
-    if sort_key == "created_at":
-        sort_by = [("created_at", sort_direction)]
-    else:
-        # 메타데이터 필드로 정렬
-        sort_by = [(f"metadata.{sort_key}", sort_direction)]
+    query = build_item_query(is_owner, search_query, search_field)
+
+    # 전체 개수 조회 (같은 조건은 캐시, 아이템 쓰기 시 무효화)
+    total = total_pages = None
+    if include_total:
+        total = await get_item_count_cache().count(mongo_db[mongo_collection_name], query)
+        total_pages = (total + page_size - 1) // page_size  # 올림 계산
+
+    if sort_key == search.RELEVANCE:
+        if cursor is not None:
+            raise HTTPException(status_code=400, detail="관련도 정렬은 커서 방식 페이지네이션을 지원하지 않습니다.")
+        if not search_query:
+            sort_key, sort_order = "created_at", "desc"
+
+    # 정렬 설정 (정렬 값이 같은 아이템은 _id 순서로 고정, 메타데이터 필드는 정렬 인덱스와 같은 한국어 collation)
+    sort_by = pagination.sort_spec(sort_key, sort_order) if sort_key != search.RELEVANCE else None
+    collation = indexes.list_collation(sort_key, search_query)
+
+    # 응답 필드 (커서를 만들 수 있도록 정렬 필드는 항상 포함)
+    try:
+        fields_projection = projection.build_projection(
+            view, fields or (), collection.field_definitions,
+            extra_paths=[pagination.sort_field(sort_key)] if sort_by is not None else (),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    find_projection = fields_projection or ITEM_PROJECTION
+
+    if cursor is not None:
+        condition = None
+        if cursor:
+            try:
+                value, last_id = pagination.decode_cursor(cursor, sort_key, sort_order)
+                condition = pagination.keyset_condition(sort_key, sort_order, value, last_id)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+        # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+        items = await mongo_db[mongo_collection_name].find(
+            pagination.combine(query, condition), find_projection, collation=collation
+        ).sort(sort_by).limit(page_size + 1).to_list(page_size + 1)
+        has_more = len(items) > page_size
+        items = items[:page_size]
+
+        return {
+            "items": [item_helper(item) for item in items],
+            "total": total,
+            "page": None,
+            "page_size": page_size,
+            "total_pages": total_pages,
+            "next_cursor": pagination.encode_cursor(sort_key, sort_order, items[-1]) if has_more else None,
+        }
 
     # 페이지네이션 계산
     skip = (page - 1) * page_size
-    total_pages = (total + page_size - 1) // page_size  # 올림 계산
 
     # 아이템 조회
-    items = await mongo_db[mongo_collection_name].find(query).sort(sort_by).skip(skip).limit(page_size).to_list(page_size)
+    if sort_by is None:
+        # 관련도 점수 → 최신순 (점수는 조건에 맞은 후보에서만 계산)
+        pipeline = [
+            {"$match": query},
+            *search.relevance_stages(search_query),
+            {"$sort": {"_score": -1, "created_at": -1, "_id": -1}},
+            {"$skip": skip},
+            {"$limit": page_size},
+            {"$project": fields_projection or {**ITEM_PROJECTION, "_score": 0}},
+        ]
+        items = await mongo_db[mongo_collection_name].aggregate(pipeline).to_list(page_size)
+    else:
+        items = await mongo_db[mongo_collection_name].find(
+            query, find_projection, collation=collation
+        ).sort(sort_by).skip(skip).limit(page_size).to_list(page_size)
 
     return {
         "items": [item_helper(item) for item in items],
@@ -104,7 +194,7 @@ async def get_item_by_id(
     query = {"_id": ObjectId(item_id)}
     if not is_owner:
         query["is_public"] = True
-    item = await mongo_db[mongo_collection_name].find_one(query)
+    item = await mongo_db[mongo_collection_name].find_one(query, ITEM_PROJECTION)
 
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
@@ -112,11 +202,14 @@ async def get_item_by_id(
     return item_helper(item)
 
 
-async def create_item(item_data: ItemCreate, db: Session) -> Dict[str, Any]:
-    """아이템 생성"""
-    mongo_collection_name = await get_mongo_collection_name(item_data.collection_id, db)
+def build_item_document(item_data: ItemCreate, mapping: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    저장할 아이템 문서 생성 (title 자동 추출, 생성 시각, 검색 토큰, 중복 감지 키 설정)
 
-    mongo_db = get_database()
+    mapping: 출처 URL/ISBN 키 이름을 바꾼 컬렉션의 필드 매핑 (중복 감지 키 계산용)
+    중복 감지 키는 다른 아이템이 가진 키인지 확인하지 않으므로 저장 전에
+    duplicate_keys.assign_available_keys로 걸러야 함 (CSV 일괄 등록은 DuplicateChecker.claim)
+    """
     item_dict = item_data.model_dump()
 
     # title이 없으면 metadata에서 첫 번째 값을 사용 (또는 기본값)
@@ -136,8 +229,28 @@ async def create_item(item_data: ItemCreate, db: Session) -> Dict[str, Any]:
 
     item_dict["created_at"] = datetime.now(timezone.utc)
     item_dict["updated_at"] = None
+    item_dict[search.SEARCH_TOKENS_FIELD] = search.search_tokens(item_dict)
+    item_dict[duplicate_keys.DEDUP_FIELD] = duplicate_keys.item_dedup_keys(item_dict.get("metadata"), mapping)
+    return item_dict
+
 
-    result = await mongo_db[mongo_collection_name].insert_one(item_dict)
+async def create_item(item_data: ItemCreate, db: Session) -> Dict[str, Any]:
+    """아이템 생성"""
+    collection = await get_item_collection(item_data.collection_id, db)
+    mongo_collection_name = collection.mongo_collection
+
+    mongo_db = get_database()
+    item_dict = build_item_document(item_data, duplicate_keys.collection_mapping(collection))
+    await duplicate_keys.assign_available_keys(mongo_db[mongo_collection_name], [item_dict])
+
+    try:
+        result = await mongo_db[mongo_collection_name].insert_one(item_dict)
+    except DuplicateKeyError:
+        # 확인 후 다른 아이템이 같은 키를 먼저 저장한 경우: 키 없이 저장
+        item_dict.pop("_id", None)
+        item_dict[duplicate_keys.DEDUP_FIELD] = {}
+        result = await mongo_db[mongo_collection_name].insert_one(item_dict)
+    invalidate_item_counts(mongo_collection_name)
     created_item = await mongo_db[mongo_collection_name].find_one({"_id": result.inserted_id})
 
     return item_helper(created_item)
@@ -150,7 +263,8 @@ async def update_item(
     db: Session
 ) -> Dict[str, Any]:
     """아이템 수정"""
-    mongo_collection_name = await get_mongo_collection_name(collection_id, db)
+    collection = await get_item_collection(collection_id, db)
+    mongo_collection_name = collection.mongo_collection
 
     if not ObjectId.is_valid(item_id):
         raise HTTPException(status_code=400, detail="Invalid item ID")
@@ -165,11 +279,30 @@ async def update_item(
     # 업데이트할 필드만 추출
     update_data = {k: v for k, v in item_data.model_dump(exclude_unset=True).items()}
     if update_data:
+        if search.search_tokens_changed(update_data):
+            update_data[search.SEARCH_TOKENS_FIELD] = search.search_tokens({**existing, **update_data})
+        mapping = duplicate_keys.collection_mapping(collection)
+        if duplicate_keys.dedup_keys_changed(update_data, mapping):
+            keys = {
+                "_id": existing["_id"],
+                duplicate_keys.DEDUP_FIELD: duplicate_keys.item_dedup_keys(update_data.get("metadata"), mapping),
+            }
+            await duplicate_keys.assign_available_keys(mongo_db[mongo_collection_name], [keys])
+            update_data[duplicate_keys.DEDUP_FIELD] = keys[duplicate_keys.DEDUP_FIELD]
         update_data["updated_at"] = datetime.now(timezone.utc)
-        await mongo_db[mongo_collection_name].update_one(
-            {"_id": ObjectId(item_id)},
-            {"$set": update_data}
-        )
+        try:
+            await mongo_db[mongo_collection_name].update_one(
+                {"_id": ObjectId(item_id)},
+                {"$set": update_data}
+            )
+        except DuplicateKeyError:
+            # 확인 후 다른 아이템이 같은 키를 먼저 저장한 경우: 키 없이 저장
+            update_data[duplicate_keys.DEDUP_FIELD] = {}
+            await mongo_db[mongo_collection_name].update_one(
+                {"_id": ObjectId(item_id)},
+                {"$set": update_data}
+            )
+        invalidate_item_counts(mongo_collection_name)
 
     updated_item = await mongo_db[mongo_collection_name].find_one({"_id": ObjectId(item_id)})
     return item_helper(updated_item)
@@ -184,6 +317,7 @@ async def delete_item(collection_id: int, item_id: str, db: Session) -> None:
 
     mongo_db = get_database()
     result = await mongo_db[mongo_collection_name].delete_one({"_id": ObjectId(item_id)})
+    invalidate_item_counts(mongo_collection_name)
 
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Item not found")
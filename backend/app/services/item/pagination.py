@@ -0,0 +1,143 @@
+"""
+아이템 목록 커서(keyset) 페이지네이션
+정렬 값과 _id를 담은 커서로 "마지막으로 본 아이템 다음"을 범위 조건으로 조회하여
+skip 없이 (정렬 필드, _id) 인덱스만 따라가므로 몇 번째 페이지든 비용이 같음
+
+- 정렬은 항상 (정렬 필드, _id) 순서 (정렬 값이 같은 아이템도 페이지 사이에서 순서 고정)
+- 커서는 (정렬 키, 정렬 순서, 정렬 값, _id)를 Extended JSON으로 인코딩한 불투명 문자열
+- 정렬 필드 값의 타입이 섞여 있어도 MongoDB 정렬 순서(null → 숫자 → 문자열 → ... → 날짜)대로 이어짐
+"""
+import base64
+import binascii
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+
+from bson import ObjectId, json_util
+from bson.decimal128 import Decimal128
+from bson.errors import BSONError
+
+# MongoDB 정렬 순서의 타입 그룹 (null/필드 없음은 모든 그룹보다 앞)
+_TYPE_GROUPS = [
+    ["double", "int", "long", "decimal"],
+    ["string", "symbol"],
+    ["object"],
+    ["array"],
+    ["binData"],
+    ["objectId"],
+    ["bool"],
+    ["date"],
+]
+
+# 목록 조회 기본 정렬(등록일)용 인덱스 (공개 목록 / Owner 목록, 생성은 indexes.reconcile_indexes)
+LIST_INDEXES = [
+    [("is_public", 1), ("created_at", -1), ("_id", -1)],
+    [("created_at", -1), ("_id", -1)],
+]
+
+
+def sort_field(sort_key: str) -> str:
+    """정렬 키 → 문서 필드 경로 (created_at 외에는 메타데이터 필드)"""
+    return "created_at" if sort_key == "created_at" else f"metadata.{sort_key}"
+
+
+def sort_spec(sort_key: str, sort_order: str) -> List[Tuple[str, int]]:
+    """(정렬 필드, _id) 정렬 조건"""
+    direction = -1 if sort_order == "desc" else 1
+    return [(sort_field(sort_key), direction), ("_id", direction)]
+
+
+def field_value(item: Dict[str, Any], path: str) -> Any:
+    """문서에서 점 경로의 값 (없으면 None)"""
+    value: Any = item
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _type_group(value: Any) -> int:
+    if isinstance(value, bool):
+        return 6
+    if isinstance(value, (int, float, Decimal128)):
+        return 0
+    if isinstance(value, str):
+        return 1
+    if isinstance(value, dict):
+        return 2
+    if isinstance(value, list):
+        return 3
+    if isinstance(value, bytes):
+        return 4
+    if isinstance(value, ObjectId):
+        return 5
+    if isinstance(value, datetime):
+        return 7
+    raise ValueError(f"커서로 사용할 수 없는 정렬 값입니다: {type(value).__name__}")
+
+
+def encode_cursor(sort_key: str, sort_order: str, item: Dict[str, Any]) -> str:
+    """목록의 마지막 아이템 → 다음 페이지 커서"""
+    payload = {
+        "k": sort_key,
+        "o": sort_order,
+        "v": field_value(item, sort_field(sort_key)),
+        "id": item["_id"],
+    }
+    raw = json_util.dumps(payload, json_options=json_util.CANONICAL_JSON_OPTIONS)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: str, sort_order: str) -> Tuple[Any, ObjectId]:
+    """
+    커서 → (정렬 값, _id)
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 다른 정렬 조건으로 만든 커서
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json_util.loads(raw.decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, BSONError) as e:
+        raise ValueError("잘못된 커서입니다.") from e
+    if not isinstance(payload, dict) or not isinstance(payload.get("id"), ObjectId):
+        raise ValueError("잘못된 커서입니다.")
+    if payload.get("k") != sort_key or payload.get("o") != sort_order:
+        raise ValueError("다른 정렬 조건의 커서입니다. 첫 페이지부터 다시 조회하세요.")
+    return payload.get("v"), payload["id"]
+
+
+def keyset_condition(sort_key: str, sort_order: str, value: Any, item_id: ObjectId) -> Dict[str, Any]:
+    """(value, item_id) 다음 아이템 조건 (sort_spec 순서 기준)"""
+    field = sort_field(sort_key)
+    desc = sort_order == "desc"
+    after = "$lt" if desc else "$gt"
+
+    if value is None:
+        # null/필드 없음은 오름차순에서 맨 앞, 내림차순에서 맨 뒤
+        same = {field: None, "_id": {after: item_id}}
+        return same if desc else {"$or": [same, {field: {"$ne": None}}]}
+
+    group = _type_group(value)
+    clauses: List[Dict[str, Any]] = [
+        {field: {after: value}},
+        {field: value, "_id": {after: item_id}},
+    ]
+    # 범위 비교는 같은 타입끼리만 되므로 정렬 순서상 뒤에 오는 타입 그룹을 따로 추가
+    groups = _TYPE_GROUPS[:group] if desc else _TYPE_GROUPS[group + 1:]
+    types = [name for names in groups for name in names]
+    if types:
+        clauses.append({field: {"$type": types}})
+    if desc:
+        clauses.append({field: None})
+    return {"$or": clauses}
+
+
+def combine(query: Dict[str, Any], condition: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """목록 조건 + 커서 조건"""
+    if not condition:
+        return query
+    if not query:
+        return condition
+    return {"$and": [query, condition]}
+
@@ -0,0 +1,82 @@
+"""
+아이템 목록 응답 필드 선택 (MongoDB projection)
+목록 화면에 필요한 필드만 조회하여 긴 메타데이터(스크래핑한 책 소개 등)를 응답/BSON 디코딩에서 제외
+
+- view=full: 전체 문서 (기본값, 검색 토큰만 제외)
+- view=summary: 제목/공개 여부/등록일 + field_definitions의 짧은 필드(text, number, date, select) + 제목/이미지 필드
+- fields=a,b: 지정한 메타데이터 필드만 (view보다 우선)
+"""
+from typing import Dict, List, Any, Iterable, Optional
+
+FULL = "full"
+SUMMARY = "summary"
+VIEWS = (FULL, SUMMARY)
+
+# 요약/필드 선택 응답에 항상 포함하는 문서 필드 (ItemSummaryResponse)
+SUMMARY_DOCUMENT_FIELDS = ("title", "is_public", "created_at")
+# 요약에 포함하는 field_definitions 타입 (textarea, url 등 긴 값은 제외)
+SUMMARY_FIELD_TYPES = ("text", "number", "date", "select")
+# 목록 카드/행이 제목과 썸네일로 찾는 메타데이터 키 (field_definitions에 없어도 포함)
+TITLE_KEYS = ("title", "제목", "name", "이름")
+IMAGE_KEYS = ("image_url", "image", "이미지", "표지", "cover", "thumbnail")
+
+
+def _valid_key(key: Any) -> bool:
+    return isinstance(key, str) and bool(key) and not key.startswith("$") and "." not in key
+
+
+def _metadata_path(key: Any) -> str:
+    """메타데이터 키 → 경로 (잘못된 키는 ValueError)"""
+    if not _valid_key(key):
+        raise ValueError(f"잘못된 필드명입니다: {key!r}")
+    return f"metadata.{key}"
+
+
+def summary_keys(field_definitions: Optional[Dict[str, Any]]) -> List[str]:
+    """요약 보기에 포함할 메타데이터 키 (제목/이미지 키 + 짧은 타입의 정의된 필드)"""
+    fields = (field_definitions or {}).get("fields") or []
+    defined = [
+        field["key"] for field in fields
+        if isinstance(field, dict) and field.get("type") in SUMMARY_FIELD_TYPES and _valid_key(field.get("key"))
+    ]
+    return list(dict.fromkeys([*TITLE_KEYS, *IMAGE_KEYS, *defined]))
+
+
+def parse_fields(fields: Optional[str]) -> List[str]:
+    """'title,author' → ['title', 'author'] (빈 값 무시)"""
+    if not fields:
+        return []
+    return [key.strip() for key in fields.split(",") if key.strip()]
+
+
+def build_projection(
+    view: str = FULL,
+    fields: Iterable[str] = (),
+    field_definitions: Optional[Dict[str, Any]] = None,
+    extra_paths: Iterable[str] = (),
+) -> Optional[Dict[str, int]]:
+    """
+    목록 조회 projection (전체 문서면 None)
+
+    Args:
+        view: full 또는 summary
+        fields: 포함할 메타데이터 키 (지정하면 view 무시)
+        extra_paths: 항상 포함할 문서 경로 (커서를 만들 정렬 필드 등)
+
+    Raises:
+        ValueError: 알 수 없는 view 또는 잘못된 필드명
+    """
+    if view not in VIEWS:
+        raise ValueError(f"view는 {', '.join(VIEWS)} 중 하나여야 합니다.")
+    keys = list(fields)
+    if not keys:
+        if view == FULL:
+            return None
+        keys = summary_keys(field_definitions)
+
+    projection = {path: 1 for path in SUMMARY_DOCUMENT_FIELDS}
+    for key in keys:
+        projection[_metadata_path(key)] = 1
+    for path in extra_paths:
+        projection[path] = 1
+    return projection
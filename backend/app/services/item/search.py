@@ -0,0 +1,234 @@
+"""
+아이템 전문 검색 (한글 n-gram 색인)
+아이템을 저장할 때 메타데이터 문자열 값을 글자 단위 n-gram(1글자 + 2글자)으로 나눠 search_tokens 배열에 저장하고,
+검색어도 같은 방식으로 나눠 {"search_tokens": {"$all": [...]}} 멀티키 인덱스 조회로 찾음
+
+- 형태소 분석기 없이도 한글 부분 검색이 됨 ('해리포터' → 해리/리포/포터, '포터'로 검색 가능)
+- 전체 검색용 토큰('포터')과 필드별 토큰('title:포터')을 함께 저장 (특정 필드 검색도 같은 인덱스 사용)
+- n-gram은 순서/필드를 모르므로 인덱스로 좁힌 후보에서 각 단어가 한 필드 값 안에 실제로 있는지 다시 확인
+- 정규식 전체 스캔과 달리 인덱스에서 후보를 찾으므로 컬렉션 크기에 비례하지 않음
+- 관련도 정렬: 검색어 토큰이 제목에 많이 들어 있을수록 앞
+"""
+import asyncio
+import logging
+import re
+import unicodedata
+from typing import Dict, List, Any, Iterable, Optional, Set, Tuple
+
+from pymongo import UpdateOne
+from sqlalchemy import select
+
+from backend.app.core.config import settings
+from backend.app.db.base import SessionLocal
+from backend.app.db.mongodb import get_database
+from backend.app.models import Collection
+
+logger = logging.getLogger(__name__)
+
+SEARCH_TOKENS_FIELD = "search_tokens"
+SEARCH_INDEX = [(SEARCH_TOKENS_FIELD, 1)]  # 생성은 indexes.reconcile_indexes
+
+# 관련도 정렬 키 (검색어가 있을 때만 의미 있음)
+RELEVANCE = "relevance"
+
+# 색인하지 않는 메타데이터 필드 (긴 본문, 링크) - 숫자/날짜 등 문자열이 아닌 값도 제외
+EXCLUDED_KEYS = {"description", "url", "image", "image_url", "source_url"}
+# 이보다 긴 문자열 값은 본문으로 보고 색인하지 않음
+MAX_VALUE_LENGTH = 200
+# 한 번의 bulk_write로 보내는 토큰 갱신 수
+BACKFILL_BATCH_SIZE = 500
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+_backfill_task: Optional[asyncio.Task] = None
+
+
+def normalize(text: str) -> str:
+    """전각/호환 문자 통일 + 소문자 (NFKC는 한글 음절을 그대로 유지)"""
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def word_grams(word: str) -> Set[str]:
+    """단어 → 1글자 + 2글자 n-gram"""
+    grams = set(word)
+    grams.update(word[i:i + 2] for i in range(len(word) - 1))
+    return grams
+
+
+def query_grams(word: str) -> List[str]:
+    """검색어 단어 → 조회할 n-gram (1글자 단어는 그 글자, 그 외에는 2글자 n-gram)"""
+    if len(word) == 1:
+        return [word]
+    return list(dict.fromkeys(word[i:i + 2] for i in range(len(word) - 1)))
+
+
+def words(text: str) -> List[str]:
+    return _WORD_PATTERN.findall(normalize(text))
+
+
+def is_indexed_key(key: str) -> bool:
+    """검색 토큰을 저장하는 메타데이터 필드인지 (긴 본문/링크 필드는 제외)"""
+    return key not in EXCLUDED_KEYS and not key.endswith("_url")
+
+
+def _indexed_values(item: Dict[str, Any]) -> Iterable[Tuple[str, str]]:
+    """색인할 (필드 key, 문자열 값) 목록"""
+    metadata = item.get("metadata") or {}
+    for key, value in metadata.items():
+        if not is_indexed_key(key):
+            continue
+        values = value if isinstance(value, list) else [value]
+        for v in values:
+            if isinstance(v, str) and v and len(v) <= MAX_VALUE_LENGTH:
+                yield key, v
+    # 메타데이터에 title이 없으면 자동 추출된 최상위 title 사용
+    if "title" not in metadata and isinstance(item.get("title"), str):
+        yield "title", item["title"]
+
+
+def search_tokens(item: Dict[str, Any]) -> List[str]:
+    """아이템 문서 → search_tokens 값 (전체 검색용 n-gram + 'key:n-gram')"""
+    tokens: Set[str] = set()
+    for key, value in _indexed_values(item):
+        for word in words(value):
+            grams = word_grams(word)
+            tokens.update(grams)
+            tokens.update(f"{key}:{gram}" for gram in grams)
+    return sorted(tokens)
+
+
+def search_tokens_changed(values: Dict[str, Any]) -> bool:
+    """$set 값이 색인 대상(title, metadata)을 바꾸는지"""
+    return any(path == "title" or path == "metadata" or path.startswith("metadata.") for path in values)
+
+
+def _indexed_values_expr() -> Dict[str, Any]:
+    """전체 검색 재확인 대상 값 목록 식 (_indexed_values와 같은 필드: 제외 키를 뺀 메타데이터 값, 배열은 펼침, 최상위 title)"""
+    return {"$reduce": {
+        "input": {"$objectToArray": {"$ifNull": ["$metadata", {}]}},
+        "initialValue": [{"$ifNull": ["$title", ""]}],
+        "in": {"$cond": [
+            {"$or": [
+                {"$in": ["$$this.k", sorted(EXCLUDED_KEYS)]},
+                {"$regexMatch": {"input": "$$this.k", "regex": "_url$"}},
+            ]},
+            "$$value",
+            {"$concatArrays": ["$$value", {"$cond": [{"$isArray": "$$this.v"}, "$$this.v", ["$$this.v"]]}]},
+        ]},
+    }}
+
+
+def _any_value_contains(word: str) -> Dict[str, Any]:
+    """$$values 중 하나의 문자열 값에 단어가 들어 있는지 (문자열이 아닌 값은 건너뜀)"""
+    return {"$anyElementTrue": [{"$map": {
+        "input": "$$values",
+        "as": "value",
+        "in": {"$regexMatch": {
+            "input": {"$cond": [{"$eq": [{"$type": "$$value"}, "string"]}, "$$value", ""]},
+            "regex": re.escape(word),
+            "options": "i",
+        }},
+    }}]}
+
+
+def _field_contains(search_field: str, query_words: List[str]) -> List[Dict[str, Any]]:
+    """필드 값에 각 단어가 들어 있는지 확인하는 조건 목록"""
+    return [
+        {f"metadata.{search_field}": {"$regex": re.escape(word), "$options": "i"}}
+        for word in query_words
+    ]
+
+
+def build_search_condition(search_query: str, search_field: str) -> Optional[Dict[str, Any]]:
+    """
+    검색어 → MongoDB 조건 (검색어에 단어가 없으면 None)
+
+    - all: 모든 단어의 n-gram으로 후보를 찾고 각 단어가 한 필드 값 안에 들어 있는지 확인
+      (n-gram만 보면 '해리포터'가 제목 '해리 x' + 저자 '리포터'처럼 여러 필드에 나뉜 아이템과도 일치)
+    - 특정 필드: 해당 필드 n-gram으로 후보를 찾고 필드 값에 각 단어가 실제로 들어 있는지 확인
+      (토큰을 저장하지 않는 필드(description, *_url)는 토큰 없이 정규식으로만 확인)
+    """
+    query_words = words(search_query)
+    if not query_words:
+        return None
+    if search_field != "all" and not is_indexed_key(search_field):
+        return {"$and": _field_contains(search_field, query_words)}
+    prefix = "" if search_field == "all" else f"{search_field}:"
+    grams = list(dict.fromkeys(f"{prefix}{gram}" for word in query_words for gram in query_grams(word)))
+    condition: Dict[str, Any] = {SEARCH_TOKENS_FIELD: {"$all": grams}}
+    if prefix:
+        # n-gram은 순서를 모르므로 같은 필드 안에서 단어 단위로 다시 확인 (인덱스로 좁힌 후보만 검사)
+        condition["$and"] = _field_contains(search_field, query_words)
+    else:
+        condition["$expr"] = {"$let": {
+            "vars": {"values": _indexed_values_expr()},
+            "in": {"$and": [_any_value_contains(word) for word in query_words]},
+        }}
+    return condition
+
+
+def relevance_stages(search_query: str) -> List[Dict[str, Any]]:
+    """관련도 점수(_score: 검색어 n-gram 중 제목에 있는 수) 계산 단계"""
+    title_grams = list(dict.fromkeys(
+        f"title:{gram}" for word in words(search_query) for gram in query_grams(word)
+    ))
+    return [{"$addFields": {"_score": {"$size": {"$setIntersection": [
+        {"$ifNull": [f"${SEARCH_TOKENS_FIELD}", []]},
+        title_grams,
+    ]}}}}]
+
+
+async def refresh_search_tokens(collection, query: Dict[str, Any], batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    """조건에 맞는 아이템의 search_tokens를 다시 계산하여 저장 (갱신한 수 반환)"""
+    updated = 0
+    batch: List[UpdateOne] = []
+    async for item in collection.find(query, {"title": 1, "metadata": 1}):
+        batch.append(UpdateOne({"_id": item["_id"]}, {"$set": {SEARCH_TOKENS_FIELD: search_tokens(item)}}))
+        if len(batch) >= batch_size:
+            updated += (await collection.bulk_write(batch, ordered=False)).modified_count
+            batch = []
+    if batch:
+        updated += (await collection.bulk_write(batch, ordered=False)).modified_count
+    return updated
+
+
+async def refresh_missing_search_tokens(collection) -> int:
+    """search_tokens가 없는 아이템(토큰 저장 이전에 등록된 아이템)에 토큰 저장"""
+    return await refresh_search_tokens(collection, {SEARCH_TOKENS_FIELD: {"$exists": False}})
+
+
+async def backfill_search_tokens() -> None:
+    """모든 아이템 컬렉션에서 토큰이 없는 아이템을 채움"""
+    db = SessionLocal()
+    try:
+        names = [name for name in db.execute(select(Collection.mongo_collection)).scalars().all() if name]
+    finally:
+        db.close()
+
+    mongo_db = get_database()
+    for name in names:
+        try:
+            updated = await refresh_missing_search_tokens(mongo_db[name])
+            if updated:
+                logger.info(f"[SEARCH] {name}: 아이템 {updated}개 검색 토큰 생성")
+        except Exception as e:
+            logger.warning(f"[SEARCH] {name} 검색 토큰 채우기 실패: {e}")
+
+
+async def start_search_backfill() -> None:
+    """검색 토큰 채우기를 백그라운드로 시작 (ITEM_SEARCH_BACKFILL_ON_STARTUP)"""
+    global _backfill_task
+    if settings.ITEM_SEARCH_BACKFILL_ON_STARTUP and _backfill_task is None:
+        _backfill_task = asyncio.create_task(backfill_search_tokens())
+
+
+async def stop_search_backfill() -> None:
+    """진행 중인 검색 토큰 채우기 중단 (다음 시작 시 남은 아이템부터 이어서 처리)"""
+    global _backfill_task
+    if _backfill_task is not None:
+        _backfill_task.cancel()
+        try:
+            await _backfill_task
+        except (asyncio.CancelledError, Exception):
+            pass
+        _backfill_task = None
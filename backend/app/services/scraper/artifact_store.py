@@ -0,0 +1,298 @@
+"""
+다운로드용 임시 파일 저장소 (차단 시 남은 URL CSV 등)
+토큰으로 조회하며, 만료 시간(TTL)과 전체 크기 제한이 있고 백그라운드에서 만료된 파일을 정리
+
+- memory: 프로세스 메모리 (LRU + TTL, 단일 프로세스용)
+- gridfs: MongoDB GridFS (여러 uvicorn 워커/별도 작업 워커와 공유, 재시작 후에도 유지)
+"""
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Any, AsyncIterable, AsyncIterator, Optional
+
+from gridfs.errors import NoFile
+from motor.motor_asyncio import AsyncIOMotorGridFSBucket
+
+from backend.app.core.config import settings
+from backend.app.db.mongodb import get_mongodb_client, get_database
+
+logger = logging.getLogger(__name__)
+
+GRIDFS_BUCKET = "artifacts"
+
+# 다운로드 스트리밍 단위
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class Artifact:
+    """저장된 파일 정보 + 내용 스트림"""
+
+    def __init__(self, token: str, filename: str, media_type: str, size: int, chunks: AsyncIterator[bytes]):
+        self.token = token
+        self.filename = filename
+        self.media_type = media_type
+        self.size = size
+        self.chunks = chunks
+
+
+class ArtifactStore:
+    """임시 파일 저장소 인터페이스"""
+
+    backend = ""
+
+    def __init__(self, ttl_seconds: float, max_bytes: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max(1, max_bytes)
+
+    @staticmethod
+    def new_token() -> str:
+        return str(uuid.uuid4())
+
+    async def put(self, content: bytes, filename: str, media_type: str) -> str:
+        """파일 저장 후 다운로드 토큰 반환 (크기 제한을 넘으면 오래된 파일부터 삭제)"""
+        raise NotImplementedError
+
+    async def put_stream(self, chunks: AsyncIterable[bytes], filename: str, media_type: str) -> str:
+        """내용을 조각 단위로 받아 저장 후 다운로드 토큰 반환 (큰 파일을 메모리에 모으지 않음)"""
+        raise NotImplementedError
+
+    async def open(self, token: str) -> Optional[Artifact]:
+        """토큰으로 파일 조회 (없거나 만료됐으면 None)"""
+        raise NotImplementedError
+
+    async def delete(self, token: str) -> None:
+        raise NotImplementedError
+
+    async def purge_expired(self) -> int:
+        """만료된 파일 삭제 후 삭제한 개수 반환"""
+        raise NotImplementedError
+
+    async def stats(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+
+class MemoryArtifactStore(ArtifactStore):
+    """
+    프로세스 메모리 저장소 (LRU + TTL)
+
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 파일부터 삭제합니다.
+    프로세스 간 공유되지 않으므로 uvicorn 워커가 하나이고 작업 워커를 API 서버 안에서 실행할 때만 사용하세요.
+    """
+
+    backend = "memory"
+
+    def __init__(self, ttl_seconds: float, max_bytes: int):
+        super().__init__(ttl_seconds, max_bytes)
+        # token → (내용, 만료 시각(monotonic), 파일명, media type)
+        self._items: "OrderedDict[str, tuple[bytes, float, str, str]]" = OrderedDict()
+        self._size = 0
+
+    def _remove(self, token: str) -> None:
+        content = self._items.pop(token)[0]
+        self._size -= len(content)
+
+    async def put(self, content: bytes, filename: str, media_type: str) -> str:
+        await self.purge_expired()
+        token = self.new_token()
+        self._items[token] = (content, time.monotonic() + self.ttl_seconds, filename, media_type)
+        self._size += len(content)
+        # 방금 저장한 파일은 크기 제한을 넘더라도 유지
+        while self._size > self.max_bytes and len(self._items) > 1:
+            oldest = next(iter(self._items))
+            self._remove(oldest)
+            logger.info(f"[ARTIFACT] 크기 제한으로 삭제: {oldest}")
+        return token
+
+    async def put_stream(self, chunks: AsyncIterable[bytes], filename: str, media_type: str) -> str:
+        # 메모리 저장소는 내용 전체를 보관하므로 조각을 합쳐 저장
+        return await self.put(b"".join([chunk async for chunk in chunks]), filename, media_type)
+
+    async def open(self, token: str) -> Optional[Artifact]:
+        entry = self._items.get(token)
+        if entry is None:
+            return None
+        content, expires_at, filename, media_type = entry
+        if expires_at <= time.monotonic():
+            self._remove(token)
+            return None
+        self._items.move_to_end(token)  # 최근 사용
+
+        async def chunks() -> AsyncIterator[bytes]:
+            for start in range(0, len(content), STREAM_CHUNK_SIZE):
+                yield content[start:start + STREAM_CHUNK_SIZE]
+
+        return Artifact(token, filename, media_type, len(content), chunks())
+
+    async def delete(self, token: str) -> None:
+        if token in self._items:
+            self._remove(token)
+
+    async def purge_expired(self) -> int:
+        now = time.monotonic()
+        expired = [token for token, entry in self._items.items() if entry[1] <= now]
+        for token in expired:
+            self._remove(token)
+        return len(expired)
+
+    async def stats(self) -> Dict[str, Any]:
+        return {"backend": self.backend, "count": len(self._items), "bytes": self._size, "max_bytes": self.max_bytes}
+
+
+class GridFSArtifactStore(ArtifactStore):
+    """
+    MongoDB GridFS 저장소
+
+    토큰을 GridFS 파일 ID로 사용하고 metadata.expires_at에 만료 시각을 저장합니다.
+    (TTL 인덱스는 files 문서만 지우고 chunks는 남기므로 만료 파일은 purge_expired에서 직접 삭제)
+    """
+
+    backend = "gridfs"
+
+    def _bucket(self):
+        return AsyncIOMotorGridFSBucket(get_database(), bucket_name=GRIDFS_BUCKET)
+
+    def _files(self):
+        return get_database()[f"{GRIDFS_BUCKET}.files"]
+
+    async def ensure_indexes(self) -> None:
+        try:
+            await self._files().create_index("metadata.expires_at")
+        except Exception as e:
+            logger.warning(f"임시 파일 저장소 인덱스 생성 실패: {e}")
+
+    def _metadata(self, media_type: str) -> Dict[str, Any]:
+        return {
+            "media_type": media_type,
+            "expires_at": datetime.utcnow() + timedelta(seconds=self.ttl_seconds),
+        }
+
+    async def put(self, content: bytes, filename: str, media_type: str) -> str:
+        token = self.new_token()
+        await self._bucket().upload_from_stream_with_id(token, filename, content, metadata=self._metadata(media_type))
+        await self._enforce_size_limit(keep=token)
+        return token
+
+    async def put_stream(self, chunks: AsyncIterable[bytes], filename: str, media_type: str) -> str:
+        token = self.new_token()
+        stream = self._bucket().open_upload_stream_with_id(token, filename, metadata=self._metadata(media_type))
+        try:
+            async for chunk in chunks:
+                await stream.write(chunk)
+        except BaseException:
+            await stream.abort()
+            raise
+        await stream.close()
+        await self._enforce_size_limit(keep=token)
+        return token
+
+    async def open(self, token: str) -> Optional[Artifact]:
+        try:
+            stream = await self._bucket().open_download_stream(token)
+        except NoFile:
+            return None
+        metadata = stream.metadata or {}
+        expires_at = metadata.get("expires_at")
+        if expires_at is not None and expires_at <= datetime.utcnow():
+            return None
+
+        async def chunks() -> AsyncIterator[bytes]:
+            while True:
+                chunk = await stream.readchunk()
+                if not chunk:
+                    break
+                yield chunk
+
+        return Artifact(token, stream.filename, metadata.get("media_type", "application/octet-stream"), stream.length, chunks())
+
+    async def delete(self, token: str) -> None:
+        try:
+            await self._bucket().delete(token)
+        except NoFile:
+            pass
+
+    async def purge_expired(self) -> int:
+        cursor = self._files().find({"metadata.expires_at": {"$lte": datetime.utcnow()}}, {"_id": 1})
+        expired = [doc["_id"] async for doc in cursor]
+        for token in expired:
+            await self.delete(token)
+        return len(expired)
+
+    async def _enforce_size_limit(self, keep: str) -> None:
+        """전체 크기가 max_bytes를 넘으면 오래된 파일부터 삭제 (keep은 제외)"""
+        total = await self._total_size()
+        if total <= self.max_bytes:
+            return
+        cursor = self._files().find({"_id": {"$ne": keep}}, {"length": 1}).sort("uploadDate", 1)
+        async for doc in cursor:
+            if total <= self.max_bytes:
+                break
+            await self.delete(doc["_id"])
+            total -= doc["length"]
+            logger.info(f"[ARTIFACT] 크기 제한으로 삭제: {doc['_id']}")
+
+    async def _total_size(self) -> int:
+        result = await self._files().aggregate([{"$group": {"_id": None, "bytes": {"$sum": "$length"}}}]).to_list(1)
+        return result[0]["bytes"] if result else 0
+
+    async def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "count": await self._files().estimated_document_count(),
+            "bytes": await self._total_size(),
+            "max_bytes": self.max_bytes,
+        }
+
+
+# 애플리케이션 공용 임시 파일 저장소
+_artifact_store: Optional[ArtifactStore] = None
+_purge_task: Optional[asyncio.Task] = None
+
+
+def get_artifact_store() -> ArtifactStore:
+    """
+    공용 저장소 반환 (최초 호출 시 SCRAPER_ARTIFACT_BACKEND로 생성)
+
+    MongoDB 연결이 없으면(스크립트 실행 등) gridfs 설정이어도 메모리 저장소 사용
+    """
+    global _artifact_store
+    if _artifact_store is None:
+        ttl_seconds = settings.SCRAPER_ARTIFACT_TTL_HOURS * 3600
+        if settings.SCRAPER_ARTIFACT_BACKEND == "gridfs" and get_mongodb_client() is not None:
+            _artifact_store = GridFSArtifactStore(ttl_seconds, settings.SCRAPER_ARTIFACT_MAX_BYTES)
+        else:
+            _artifact_store = MemoryArtifactStore(ttl_seconds, settings.SCRAPER_ARTIFACT_MAX_BYTES)
+    return _artifact_store
+
+
+async def _purge_loop(store: ArtifactStore, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            deleted = await store.purge_expired()
+            if deleted:
+                logger.info(f"[ARTIFACT] 만료된 임시 파일 {deleted}개 삭제")
+        except Exception as e:
+            logger.warning(f"임시 파일 정리 실패: {e}")
+
+
+async def start_artifact_store() -> None:
+    """공용 저장소 생성 + 만료 파일 정리 작업 시작"""
+    global _purge_task
+    store = get_artifact_store()
+    if isinstance(store, GridFSArtifactStore):
+        await store.ensure_indexes()
+    if _purge_task is None:
+        _purge_task = asyncio.create_task(_purge_loop(store, settings.SCRAPER_ARTIFACT_PURGE_SECONDS))
+    logger.info(f"임시 파일 저장소 시작 ({store.backend})")
+
+
+async def stop_artifact_store() -> None:
+    """만료 파일 정리 작업 종료"""
+    global _purge_task
+    if _purge_task:
+        _purge_task.cancel()
+        await asyncio.gather(_purge_task, return_exceptions=True)
+        _purge_task = None
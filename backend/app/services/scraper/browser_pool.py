@@ -0,0 +1,213 @@
+"""
+Playwright 브라우저 풀
+애플리케이션 수명 동안 Chromium을 재사용하고, 스크래핑마다 격리된 BrowserContext를 제공
+"""
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List, AsyncIterator
+from playwright.async_api import async_playwright, Playwright, Browser, BrowserContext
+
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class _BrowserHandle:
+    """풀이 관리하는 Chromium 인스턴스 (세대 단위로 교체됨)"""
+
+    def __init__(self, browser: Browser, generation: int):
+        self.browser = browser
+        self.generation = generation
+        self.pages_served = 0
+        self.active_contexts = 0
+        self.retired = False
+
+    @property
+    def is_healthy(self) -> bool:
+        """교체 대상이 아니고 브라우저 프로세스가 살아있는지"""
+        return not self.retired and self.browser.is_connected()
+
+
+class BrowserPool:
+    """
+    장기 실행 Chromium 브라우저 풀
+
+    - 브라우저는 한 번만 띄우고, 요청마다 새 BrowserContext(쿠키/캐시 격리)를 발급
+    - 동시에 발급 가능한 컨텍스트 수는 size로 제한
+    - N 페이지 처리 후 또는 크래시 감지 시 새 브라우저로 교체 (사용 중인 컨텍스트는 끝까지 유지)
+    """
+
+    def __init__(self, size: int, max_pages_per_browser: int, headless: bool = True):
+        self.size = max(1, size)
+        self.max_pages_per_browser = max(1, max_pages_per_browser)
+        self.headless = headless
+        self._playwright: Optional[Playwright] = None
+        self._current: Optional[_BrowserHandle] = None
+        self._retired: List[_BrowserHandle] = []
+        self._semaphore = asyncio.Semaphore(self.size)
+        self._lock = asyncio.Lock()
+        self._generation = 0
+        self._recycle_count = 0
+        self._running = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    async def start(self) -> None:
+        """Playwright 시작 및 첫 브라우저 실행"""
+        if self._running:
+            return
+        self._playwright = await async_playwright().start()
+        self._running = True
+        try:
+            async with self._lock:
+                await self._launch()
+        except Exception:
+            self._running = False
+            await self._playwright.stop()
+            self._playwright = None
+            raise
+        logger.info(f"브라우저 풀 시작 (size={self.size}, max_pages={self.max_pages_per_browser})")
+
+    async def stop(self) -> None:
+        """모든 브라우저 종료 후 Playwright 정지"""
+        if not self._running:
+            return
+        self._running = False
+        async with self._lock:
+            handles = list(self._retired)
+            if self._current:
+                handles.append(self._current)
+            self._current = None
+            self._retired = []
+        for handle in handles:
+            await self._close_browser(handle)
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+        logger.info("브라우저 풀 종료")
+
+    @asynccontextmanager
+    async def context(self, **context_options: Any) -> AsyncIterator[BrowserContext]:
+        """
+        격리된 BrowserContext 발급
+
+        Args:
+            context_options: browser.new_context()에 전달할 옵션
+
+        Yields:
+            BrowserContext (블록 종료 시 자동으로 닫힘)
+        """
+        async with self._semaphore:
+            handle = await self._acquire_browser()
+            browser_context: Optional[BrowserContext] = None
+            try:
+                browser_context = await handle.browser.new_context(**context_options)
+                yield browser_context
+            finally:
+                if browser_context is not None:
+                    try:
+                        await browser_context.close()
+                    except Exception:
+                        pass  # 크래시된 브라우저의 컨텍스트는 닫기 실패 가능
+                await self._release_browser(handle)
+
+    def stats(self) -> Dict[str, Any]:
+        """헬스 체크용 풀 상태"""
+        current = self._current
+        return {
+            "running": self._running,
+            "size": self.size,
+            "available": self._semaphore._value,
+            "generation": current.generation if current else None,
+            "pages_served": current.pages_served if current else 0,
+            "connected": current.browser.is_connected() if current else False,
+            "retired_browsers": len(self._retired),
+            "recycle_count": self._recycle_count,
+        }
+
+    async def _launch(self) -> _BrowserHandle:
+        """새 브라우저 세대 실행 (lock 보유 상태에서 호출)"""
+        self._generation += 1
+        browser = await self._playwright.chromium.launch(headless=self.headless)
+        generation = self._generation
+        browser.on("disconnected", lambda _: logger.warning(f"브라우저 연결 끊김 (generation={generation})"))
+        self._current = _BrowserHandle(browser, generation)
+        return self._current
+
+    async def _acquire_browser(self) -> _BrowserHandle:
+        """건강한 브라우저 반환 (필요 시 교체)"""
+        async with self._lock:
+            if not self._running:
+                raise RuntimeError("브라우저 풀이 시작되지 않았습니다.")
+
+            current = self._current
+            if current is None or not current.is_healthy or current.pages_served >= self.max_pages_per_browser:
+                if current is not None:
+                    reason = "크래시" if not current.browser.is_connected() else f"{current.pages_served}페이지 처리"
+                    logger.info(f"브라우저 교체 (generation={current.generation}, 사유: {reason})")
+                    self._retire(current)
+                    self._recycle_count += 1
+                    if current.active_contexts == 0:
+                        self._retired.remove(current)
+                        await self._close_browser(current)
+                current = await self._launch()
+
+            current.pages_served += 1
+            current.active_contexts += 1
+            return current
+
+    async def _release_browser(self, handle: _BrowserHandle) -> None:
+        """컨텍스트 반환, 교체된 브라우저는 마지막 컨텍스트가 끝나면 종료"""
+        handle.active_contexts -= 1
+        if not handle.browser.is_connected() and not handle.retired:
+            async with self._lock:
+                if self._current is handle:
+                    self._current = None
+                self._retire(handle)
+                self._recycle_count += 1
+        if handle.retired and handle.active_contexts == 0 and handle in self._retired:
+            self._retired.remove(handle)
+            await self._close_browser(handle)
+
+    def _retire(self, handle: _BrowserHandle) -> None:
+        handle.retired = True
+        if handle not in self._retired:
+            self._retired.append(handle)
+
+    async def _close_browser(self, handle: _BrowserHandle) -> None:
+        try:
+            await handle.browser.close()
+        except Exception as e:
+            logger.debug(f"브라우저 종료 실패 (generation={handle.generation}): {e}")
+
+
+# 애플리케이션 공용 브라우저 풀
+browser_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> Optional[BrowserPool]:
+    """공용 브라우저 풀 반환 (시작 전이면 None)"""
+    return browser_pool
+
+
+async def start_browser_pool() -> None:
+    """공용 브라우저 풀 시작 (실행에 실패하면 공용 풀 없이 예외 전달)"""
+    global browser_pool
+    pool = BrowserPool(
+        size=settings.SCRAPER_BROWSER_POOL_SIZE,
+        max_pages_per_browser=settings.SCRAPER_BROWSER_MAX_PAGES,
+    )
+    await pool.start()
+    # 시작에 성공한 풀만 공용으로 등록 (실행되지 않은 풀이 남아 있지 않도록)
+    browser_pool = pool
+
+
+async def stop_browser_pool() -> None:
+    """공용 브라우저 풀 종료"""
+    global browser_pool
+    if browser_pool:
+        await browser_pool.stop()
+        browser_pool = None
@@ -1,28 +1,177 @@
 """CSV 처리 및 일괄 스크래핑 서비스"""
+import asyncio
+import codecs
 import csv
 import io
 import json
 import logging
-import uuid
-from typing import Dict, List, Any, AsyncGenerator
+from collections import defaultdict, deque
+from typing import Dict, List, Any, AsyncGenerator, AsyncIterable, Callable, Optional, Union
+from urllib.parse import urlparse
 from fastapi import UploadFile
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
+from backend.app.core.config import settings
 from backend.app.models.collection import Collection
 from backend.app.schemas.item import ItemCreate
-from backend.app.services.item.item_service import create_item as create_item_service
-from backend.app.services.scraper.web_scraper import scrape_url, apply_field_mapping
+from backend.app.services.item.item_service import build_item_document, get_mongo_collection_name
+from backend.app.services.item.duplicate_keys import dedup_keys, find_isbn
+from backend.app.services.scraper.artifact_store import Artifact, get_artifact_store
+from backend.app.services.scraper.dedup import DuplicateChecker, SKIP, INSERT
+from backend.app.services.scraper.item_writer import ItemBatchWriter, DUPLICATE_KEY_ERROR
+from backend.app.services.scraper.field_mapper import CompiledMapping, get_compiled_mapping, parse_mapping_config
+from backend.app.services.scraper.web_scraper import scrape_page, SoftBlockError, ScrapeResult
+from backend.app.services.scraper.rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
-# 임시 저장소 (메모리)
-_temp_csv_storage: Dict[str, str] = {}
+# CSV 업로드 읽기 단위 및 인코딩 (한국 서점 내보내기 파일은 CP949/EUC-KR인 경우가 많음)
+CSV_READ_CHUNK_SIZE = 64 * 1024
+CSV_FALLBACK_ENCODING = 'cp949'  # EUC-KR 상위 호환
+REMAINING_CSV_FILENAME = 'remaining_urls.csv'
+REMAINING_CSV_WRITE_CHUNK_SIZE = 64 * 1024
+
+# skipped 이벤트 메시지용 중복 사유
+_DUPLICATE_REASONS = {'source': '출처 URL', 'isbn': 'ISBN', 'index': '출처 URL 또는 ISBN'}
+_URL_COLUMNS = ('url', 'link', '주소')
+
+CsvRow = tuple[str, Dict[str, Any], Dict[str, Any]]
+# (0-based 행 번호, CSV 행) - bulk_scrape_events 입력
+IndexedCsvRow = tuple[int, CsvRow]
+
+
+class _RecordFeed:
+    """csv.DictReader에 완성된 레코드 줄만 넘겨주는 큐 (비면 StopIteration, 이후 다시 채워서 이어서 읽기)"""
+
+    def __init__(self):
+        self.lines: deque[str] = deque()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        if not self.lines:
+            raise StopIteration
+        return self.lines.popleft()
+
+
+def _parse_csv_row(row: Dict[str, Any]) -> Optional[CsvRow]:
+    """CSV row에서 (url, 추가 데이터, 원본 row) 추출 (URL이 없으면 None)"""
+    # URL 찾기
+    url = None
+    for key in row.keys():
+        if key and key.lower() in _URL_COLUMNS:
+            url = (row[key] or '').strip()
+            break
+
+    if not url:
+        return None
+
+    # 메타데이터에 병합할 추가 데이터 (title 제외)
+    extra = {}
+    for key, value in row.items():
+        if key is None or not isinstance(value, str):
+            continue  # 헤더보다 많은 열, 모자란 열
+        if key.lower() not in [*_URL_COLUMNS, 'title'] and value.strip():
+            extra[key] = value.strip()
+
+    return url, extra, row
+
+
+async def iter_csv_rows(file: UploadFile) -> AsyncGenerator[CsvRow, None]:
+    """
+    업로드된 CSV를 읽으며 URL이 있는 row를 하나씩 생성 (iter_csv_records 참고)
+
+    Yields:
+        (url, additional_data, original_row) 튜플
+        - additional_data: purchase_date 등 메타데이터에 병합할 데이터
+        - original_row: 원본 CSV row (CSV 재생성용)
+
+    Raises:
+        ValueError: 인코딩 오류, CSV에 URL이 없는 경우
+    """
+    found = False
+    async for row in iter_csv_records(file):
+        parsed = _parse_csv_row(row)
+        if parsed:
+            found = True
+            yield parsed
+
+    if not found:
+        raise ValueError("CSV 파일에 URL이 없습니다.")
+
+
+async def iter_csv_records(file: UploadFile) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    업로드된 CSV를 CSV_READ_CHUNK_SIZE 단위로 읽으며 row(dict)를 하나씩 생성 (파일 전체를 메모리에 올리지 않음)
+
+    인코딩: UTF-8(BOM 유무 무관), 첫 청크가 UTF-8로 읽히지 않으면 CP949(EUC-KR).
+    앞부분이 ASCII뿐이라 UTF-8로 시작했더라도 이후 UTF-8이 아닌 바이트가 나오면 CP949로 전환합니다.
+
+    Raises:
+        ValueError: 인코딩 오류
+    """
+    decoder = None
+    encoding = 'utf-8-sig'  # BOM이 있으면 제거
+    ascii_only = True  # 지금까지 읽은 내용이 ASCII뿐인지 (CP949로 전환 가능 여부)
+    feed = _RecordFeed()
+    reader = csv.DictReader(feed)
+    partial = ''  # 아직 줄바꿈이 오지 않은 마지막 줄
+    record: List[str] = []  # 따옴표 안의 줄바꿈으로 이어지는 레코드의 줄들
+    quotes = 0
+
+    while True:
+        chunk = await file.read(CSV_READ_CHUNK_SIZE)
+        final = not chunk
+
+        if decoder is None:
+            try:
+                codecs.getincrementaldecoder(encoding)().decode(chunk, final=final)
+            except UnicodeDecodeError:
+                encoding = CSV_FALLBACK_ENCODING
+            decoder = codecs.getincrementaldecoder(encoding)()
+
+        try:
+            text = decoder.decode(chunk, final=final)
+        except UnicodeDecodeError:
+            if not (ascii_only and encoding != CSV_FALLBACK_ENCODING):
+                raise ValueError("CSV 파일 인코딩 오류 (UTF-8 또는 CP949/EUC-KR 형식이어야 합니다)")
+            # 앞부분은 ASCII였으므로 남은 바이트부터 CP949로 다시 읽음
+            buffered, _ = decoder.getstate()
+            encoding = CSV_FALLBACK_ENCODING
+            decoder = codecs.getincrementaldecoder(encoding)()
+            try:
+                text = decoder.decode(buffered + chunk, final=final)
+            except UnicodeDecodeError:
+                raise ValueError("CSV 파일 인코딩 오류 (UTF-8 또는 CP949/EUC-KR 형식이어야 합니다)")
+        if ascii_only and not text.isascii():
+            ascii_only = False
+
+        # 완성된 레코드(따옴표가 짝이 맞는 줄)만 csv 파서에 전달
+        lines = list(io.StringIO(partial + text, newline=''))
+        partial = ''
+        if lines and not final and not lines[-1].endswith('\n'):
+            partial = lines.pop()  # 줄이 다음 청크로 이어짐 (\r 다음에 \n이 올 수도 있음)
+        for line in lines:
+            record.append(line)
+            quotes += line.count('"')
+            if quotes % 2 == 0:
+                feed.lines.extend(record)
+                record, quotes = [], 0
+        if final:
+            feed.lines.extend(record)
+
+        for row in reader:
+            yield row
+
+        if final:
+            break
 
 
 async def process_csv_file(file: UploadFile) -> tuple[List[str], List[Dict[str, Any]], List[Dict[str, Any]]]:
     """
-    CSV 파일을 읽어서 URL 목록과 추가 데이터, 원본 row를 반환
+    CSV 파일을 읽어서 URL 목록과 추가 데이터, 원본 row를 반환 (iter_csv_rows 결과를 목록으로 모음)
 
     Args:
         file: 업로드된 CSV 파일
@@ -36,41 +185,14 @@ async def process_csv_file(file: UploadFile) -> tuple[List[str], List[Dict[str,
     Raises:
         ValueError: CSV에 URL이 없거나 형식이 잘못된 경우
     """
-    try:
-        contents = await file.read()
-        decoded = contents.decode('utf-8')
-    except UnicodeDecodeError:
-        raise ValueError("CSV 파일 인코딩 오류 (UTF-8 형식이어야 합니다)")
-
-    csv_reader = csv.DictReader(io.StringIO(decoded))
-
     urls = []
     additional_data = []
     original_rows = []
 
-    for row in csv_reader:
-        # URL 찾기
-        url = None
-        for key in row.keys():
-            if key.lower() in ['url', 'link', '주소']:
-                url = row[key].strip()
-                break
-
-        if url:
-            urls.append(url)
-
-            # 메타데이터에 병합할 추가 데이터 (title 제외)
-            extra = {}
-            for key, value in row.items():
-                if key.lower() not in ['url', 'link', '주소', 'title'] and value.strip():
-                    extra[key] = value.strip()
-            additional_data.append(extra)
-
-            # 원본 row 저장 (CSV 재생성용)
-            original_rows.append(row)
-
-    if not urls:
-        raise ValueError("CSV 파일에 URL이 없습니다.")
+    async for url, extra, row in iter_csv_rows(file):
+        urls.append(url)
+        additional_data.append(extra)
+        original_rows.append(row)
 
     return urls, additional_data, original_rows
 
@@ -93,274 +215,515 @@ async def get_collection_mapping(collection_id: int, db: Session) -> tuple[Dict[
     if not collection:
         raise ValueError(f"컬렉션 ID {collection_id}를 찾을 수 없습니다.")
 
-    mapping = {}
-    ignore_unmapped = False
+    return parse_mapping_config(collection.field_mapping)
 
-    if collection.field_mapping:
-        mapping_config = collection.field_mapping
-        if isinstance(mapping_config, dict):
-            mapping = mapping_config.get("mapping", {})
-            ignore_unmapped = mapping_config.get("ignore_unmapped", False)
-
-    return mapping, ignore_unmapped
 
+async def store_remaining_csv(rows: AsyncIterable[IndexedCsvRow]) -> tuple[str, int]:
+    """
+    남은 행을 CSV로 임시 파일 저장소에 저장하고 (토큰, 행 수) 반환 (SCRAPER_ARTIFACT_TTL_HOURS 후 만료)
 
-def generate_remaining_csv(remaining_urls: List[Dict[str, Any]]) -> str:
+    행을 모으지 않고 REMAINING_CSV_WRITE_CHUNK_SIZE 단위로 인코딩하여 저장소에 스트리밍
+    (헤더는 첫 행의 original_row 키, original_row가 없는 행은 URL 열만 채움, UTF-8 BOM 포함)
     """
-    남은 URL 목록을 CSV 문자열로 변환
+    count = 0
+
+    async def chunks() -> AsyncGenerator[bytes, None]:
+        nonlocal count
+        output = io.StringIO()
+        output.write('\ufeff')
+        writer: Optional[csv.DictWriter] = None
+        headers: List[str] = []
+        async for _, (url, _, original_row) in rows:
+            if writer is None:
+                headers = list(original_row.keys()) if original_row else ['URL']
+                writer = csv.DictWriter(output, fieldnames=headers)
+                writer.writeheader()
+            if original_row:
+                writer.writerow(original_row)
+            else:
+                writer.writerow({header: url if header.lower() in _URL_COLUMNS else '' for header in headers})
+            count += 1
+            if output.tell() >= REMAINING_CSV_WRITE_CHUNK_SIZE:
+                yield output.getvalue().encode('utf-8')
+                output.seek(0)
+                output.truncate()
+        if writer is not None:
+            yield output.getvalue().encode('utf-8')
+
+    token = await get_artifact_store().put_stream(
+        chunks(),
+        filename=REMAINING_CSV_FILENAME,
+        media_type='text/csv; charset=utf-8',
+    )
+    return token, count
+
+
+async def open_remaining_csv(token: str) -> Optional[Artifact]:
+    """
+    토큰으로 남은 URL CSV 조회 (만료 전까지 여러 번 다운로드 가능)
 
     Args:
-        remaining_urls: 남은 URL 목록 (original_row 포함)
+        token: 다운로드 토큰
 
     Returns:
-        CSV 문자열 (UTF-8 BOM 포함)
+        Artifact (chunks로 스트리밍) 또는 None
     """
-    if not remaining_urls:
-        return ""
+    return await get_artifact_store().open(token)
 
-    # 헤더 추출 (첫 번째 항목의 original_row에서)
-    first_row = remaining_urls[0].get('original_row', {})
-    headers = list(first_row.keys()) if first_row else ['URL']
 
-    # CSV 생성
-    output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=headers)
-    writer.writeheader()
+def _sse(data: Dict[str, Any]) -> str:
+    """Server-Sent Events 형식으로 변환"""
+    return f"data: {json.dumps(data)}\n\n"
 
-    for item in remaining_urls:
-        if item.get('original_row'):
-            writer.writerow(item['original_row'])
-        else:
-            # original_row가 없으면 URL만 사용
-            row_data = {header: '' for header in headers}
-            for header in headers:
-                if header.lower() in ['url', 'link', '주소']:
-                    row_data[header] = item['url']
-            writer.writerow(row_data)
 
-    # UTF-8 BOM 추가
-    csv_content = '\ufeff' + output.getvalue()
-    return csv_content
+def _is_blocked_error(error: Exception) -> bool:
+    """Block 감지: 재시도 후에도 남은 "제목을 찾을 수 없습니다" 또는 429/503 응답만 차단으로 간주"""
+    if isinstance(error, SoftBlockError):
+        return error.retryable
+    return '제목을 찾을 수 없습니다' in str(error)
 
 
-def store_remaining_csv(csv_content: str) -> str:
+async def _scrape_with_retry(url: str, force_refresh: bool = False) -> ScrapeResult:
     """
-    CSV 내용을 임시 저장소에 저장하고 토큰 반환
-
-    Args:
-        csv_content: CSV 문자열
+    차단 의심 신호가 나오면 속도 제한기가 속도를 낮춘 상태로 재시도
 
-    Returns:
-        다운로드 토큰
+    SCRAPER_BLOCK_RETRIES번 재시도 후에도 실패하면 마지막 예외를 그대로 전달
     """
-    token = str(uuid.uuid4())
-    _temp_csv_storage[token] = csv_content
-    return token
+    for attempt in range(settings.SCRAPER_BLOCK_RETRIES + 1):
+        try:
+            return await scrape_page(url, force_refresh=force_refresh)
+        except SoftBlockError as e:
+            if not e.retryable or attempt >= settings.SCRAPER_BLOCK_RETRIES:
+                raise
+            logger.info(f"[RETRY] 차단 의심 ({e.reason}) - {attempt + 1}회 재시도: {url}")
 
 
-def get_remaining_csv(token: str) -> str | None:
-    """
-    토큰으로 CSV 내용 조회
+def _resolve_worker_count(workers: Optional[int]) -> int:
+    """요청된 동시 처리 수를 설정 범위(1 ~ SCRAPER_BULK_MAX_WORKERS)로 제한"""
+    if workers is None:
+        workers = settings.SCRAPER_BULK_WORKERS
+    return max(1, min(workers, settings.SCRAPER_BULK_MAX_WORKERS))
 
-    Args:
-        token: 다운로드 토큰
 
-    Returns:
-        CSV 문자열 또는 None
+async def _process_row(
+    idx: int,
+    row: CsvRow,
+    collection_id: int,
+    mapping: Dict[str, str],
+    mapper: CompiledMapping,
+    dedup: DuplicateChecker,
+    force_refresh: bool = False
+) -> Dict[str, Any]:
     """
-    return _temp_csv_storage.pop(token, None)
-
+    CSV 한 행 처리 (중복 확인 → 스크래핑 → 병합 → 매핑 → 아이템 문서 준비, 저장은 ItemBatchWriter가 담당)
+
+    예외를 던지지 않고 결과를 반환:
+        - {'status': 'success', 'document': ..., 'tier': 'cache' | 'http' | 'browser'}
+        - {'status': 'updated', 'item': ..., 'tier': ...}  (on_duplicate=update, 기존 아이템 갱신)
+        - {'status': 'skipped', 'duplicate': {...}}  (on_duplicate=skip, 스크래핑하지 않음)
+        - {'status': 'blocked', 'error': ...}
+        - {'status': 'fallback', 'document': ..., 'error': ...}  (CSV 데이터로 아이템 생성)
+        - {'status': 'failed', 'error': ...}  (fallback도 실패)
+    """
+    url, extra, original_row = row
+    csv_isbn = find_isbn(extra, mapping)
+    csv_keys = keys = dedup_keys(url, csv_isbn)
+    duplicate = None
+    try:
+        # 출처 URL / CSV의 ISBN으로 먼저 확인 (이미 있는 항목은 스크래핑 생략, 없으면 이 행이 키를 예약)
+        if dedup.mode != INSERT:
+            duplicate = await dedup.find(idx, csv_keys)
+            if duplicate and dedup.mode == SKIP:
+                return {'status': 'skipped', 'duplicate': duplicate}
+    except Exception as e:
+        dedup.release(idx, csv_keys)
+        return {'status': 'failed', 'error': f"중복 확인 실패: {e}"}
 
-async def bulk_scrape_csv_stream(
+    try:
+        # 스크래핑 (차단 의심 시 속도를 낮춰 재시도)
+        result = await _scrape_with_retry(url, force_refresh=force_refresh)
+        metadata = result.metadata
+        keys = dedup_keys(url, find_isbn(metadata) or csv_isbn)
+
+        # 스크래핑으로 알게 된 ISBN으로 다시 확인
+        if duplicate is None and dedup.mode != INSERT:
+            duplicate = await dedup.find(idx, keys)
+            if duplicate and dedup.mode == SKIP:
+                return {'status': 'skipped', 'duplicate': duplicate}
+
+        # CSV 추가 데이터 병합
+        metadata.update(extra)
+
+        # 매핑 적용
+        metadata = mapper.apply(metadata)
+
+        # 아이템 문서 준비
+        item_data = ItemCreate(
+            collection_id=collection_id,
+            metadata=metadata
+        )
+        document = build_item_document(item_data)
+
+        if duplicate:
+            # update 모드: 기존 아이템 갱신 (같은 작업의 앞선 행과 겹치면 건너뜀)
+            item = await dedup.update_existing(duplicate['item_id'], document, keys) if 'item_id' in duplicate else None
+            if item is None:
+                return {'status': 'skipped', 'duplicate': duplicate}
+            return {'status': 'updated', 'item': item, 'tier': result.tier}
+
+        document['dedup'] = await dedup.claim(idx, keys)
+        return {'status': 'success', 'document': document, 'tier': result.tier}
+
+    except Exception as e:
+        error = e
+        error_str = str(e)
+
+    if _is_blocked_error(error):
+        dedup.release(idx, csv_keys, keys)
+        return {'status': 'blocked', 'error': error_str}
+
+    # 스크래핑 실패 시 fallback: CSV 데이터만으로 아이템 생성 (차단이 아닌 일반 에러만)
+    try:
+        # CSV 데이터만 사용 (원본 row에서 추출)
+        fallback_metadata = {}
+        # URL 제외한 모든 CSV 데이터 사용
+        for key, value in (original_row or {}).items():
+            if key.lower() not in ['url', 'link', '주소'] and value.strip():
+                fallback_metadata[key] = value.strip()
+
+        # source_url 추가
+        fallback_metadata['source_url'] = url
+
+        # 매핑 적용
+        fallback_metadata = mapper.apply(fallback_metadata)
+
+        # 아이템 문서 준비
+        item_data = ItemCreate(
+            collection_id=collection_id,
+            metadata=fallback_metadata
+        )
+        document = build_item_document(item_data)
+        document['dedup'] = await dedup.claim(idx, csv_keys)
+        # 스크래핑 중 알게 된 키(CSV에 없는 ISBN)는 이 행이 저장하지 않으므로 해제
+        dedup.release(idx, {field: value for field, value in keys.items() if csv_keys.get(field) != value})
+        return {'status': 'fallback', 'document': document, 'error': error_str}
+
+    except Exception as fallback_error:
+        dedup.release(idx, csv_keys, keys)
+        return {'status': 'failed', 'error': str(fallback_error)}
+
+
+async def indexed_rows(
     urls: List[str],
     additional_data: List[Dict[str, Any]],
     original_rows: List[Dict[str, Any]],
+) -> AsyncGenerator[IndexedCsvRow, None]:
+    """목록으로 모은 CSV 행 → bulk_scrape_events 입력 (process_csv_file 결과용)"""
+    for idx, url in enumerate(urls):
+        extra = additional_data[idx] if idx < len(additional_data) else {}
+        original_row = original_rows[idx] if idx < len(original_rows) else {}
+        yield idx, (url, extra, original_row)
+
+
+async def bulk_scrape_events(
+    rows: AsyncIterable[IndexedCsvRow],
+    total: Union[int, Callable[[], int]],
     collection_id: int,
     mapping: Dict[str, str],
     ignore_unmapped: bool,
-    db: Session
-) -> AsyncGenerator[str, None]:
+    db: Session,
+    workers: Optional[int] = None,
+    force_refresh: bool = False,
+    start_success: int = 0,
+    start_failed: int = 0,
+    on_duplicate: Optional[str] = None,
+    start_skipped: int = 0
+) -> AsyncGenerator[Dict[str, Any], None]:
     """
-    CSV URL 목록을 하나씩 스크래핑하여 스트리밍으로 결과 전송
+    CSV 행을 스크래핑하여 진행 이벤트(dict)를 순서대로 생성
+
+    rows는 빈 슬롯이 생길 때마다 하나씩 읽으므로 처리 중인 행만 메모리에 둡니다
+    (작업 큐는 저장된 행을 페이지 단위로 읽어서 전달).
+    workers개의 행을 동시에 처리하며 (도메인별 SCRAPER_PER_DOMAIN_CONCURRENCY 제한),
+    workers=1이면 기존과 같이 순차 처리합니다.
+    차단이 감지되면 새 행 배정을 중단하고, 처리 중인 행이 끝나길 기다린 뒤
+    끝나지 않은 모든 행을 남은 CSV로 저장합니다.
+
+    성공/대체(fallback) 행의 아이템은 SCRAPER_BULK_INSERT_BATCH_SIZE개 또는
+    SCRAPER_BULK_INSERT_FLUSH_SECONDS초마다 insert_many로 모아서 저장하며,
+    progress/error_item 이벤트는 해당 아이템이 저장된 뒤 전송합니다 (저장 실패 행은 error_item).
+
+    요청 속도는 호스트별 속도 제한기가 조절하며 (차단 의심 시 감속 후 재시도),
+    progress/error_item 이벤트의 rate에 해당 호스트의 현재 속도(요청/초)를,
+    progress 이벤트의 tier에 처리 단계('cache', 'http' 또는 'browser')를 포함합니다.
+    이미 스크래핑한 URL은 캐시에서 바로 가져옵니다 (force_refresh=True면 다시 가져옴).
+
+    컬렉션에 이미 있는 항목(정규화한 출처 URL 또는 ISBN이 같은 아이템)과 같은 CSV 안의 중복 행은
+    on_duplicate에 따라 처리합니다:
+        - skip: 스크래핑하지 않고 skipped 이벤트 전송 (ISBN은 스크래핑 후에야 알 수 있으면 스크래핑 후 확인)
+        - update: 다시 스크래핑하여 기존 아이템 갱신 (progress 이벤트, action='updated')
+        - insert: 중복이어도 새 아이템으로 등록
 
     Args:
-        urls: URL 목록
-        additional_data: 각 URL에 대한 추가 데이터
-        original_rows: 원본 CSV row 데이터
+        rows: 처리할 (0-based 행 번호, (url, 추가 데이터, 원본 row)) - 행 번호 순서
+        total: 전체 행 수 (행을 저장하는 중에 시작한 작업은 현재 저장된 행 수를 돌려주는 함수)
         collection_id: 컬렉션 ID
         mapping: 필드 매핑
         ignore_unmapped: 매핑되지 않은 필드 무시 여부
         db: DB 세션
+        workers: 동시 처리 수 (None이면 SCRAPER_BULK_WORKERS)
+        force_refresh: True면 스크래핑 캐시 무시
+        start_success: 이미 처리된 성공 수 (재개 시 진행률 계산용)
+        start_failed: 이미 처리된 실패 수
+        on_duplicate: 중복 처리 방식 (None이면 SCRAPER_IMPORT_ON_DUPLICATE)
+        start_skipped: 이미 건너뛴 중복 행 수
 
     Yields:
-        Server-Sent Events 형식의 진행 상황 데이터
+        이벤트 딕셔너리 (type: start/progress/error_item/skipped/blocked/complete)
     """
-    total = len(urls)
-    success_count = 0
-    failed_count = 0
-    remaining_urls = []
-    blocked = False  # 차단 여부 플래그
-
-    # 시작 이벤트
-    yield f"data: {json.dumps({'type': 'start', 'total': total})}\n\n"
-
-    # 하나씩 처리
-    for idx, url in enumerate(urls):
-        scraping_failed = False
-        try:
-            # 스크래핑
-            metadata = await scrape_url(url)
-
-            # CSV 추가 데이터 병합
-            if idx < len(additional_data):
-                metadata.update(additional_data[idx])
-
-            # 매핑 적용
-            if mapping:
-                metadata = apply_field_mapping(metadata, mapping, ignore_unmapped)
-
-            # 아이템 생성
-            item_data = ItemCreate(
-                collection_id=collection_id,
-                metadata=metadata
+    current_total = total if callable(total) else (lambda: total)
+    source = aiter(rows)
+    exhausted = False
+    rows_by_idx: Dict[int, CsvRow] = {}  # 처리 중이거나 차단된 행 (결과를 보내면 제거)
+    worker_count = _resolve_worker_count(workers)
+    rate_limiter = get_rate_limiter()
+    success_count = start_success
+    failed_count = start_failed
+    skipped_count = start_skipped
+    completed_count = start_success + start_failed + start_skipped
+    blocked_indices: List[int] = []  # 차단된 행 (0-based)
+
+    # 컬렉션은 한 번만 조회하고, 준비된 아이템은 모아서 저장
+    mongo_collection_name = await get_mongo_collection_name(collection_id, db)
+    writer = ItemBatchWriter(
+        mongo_collection_name,
+        batch_size=settings.SCRAPER_BULK_INSERT_BATCH_SIZE,
+        flush_seconds=settings.SCRAPER_BULK_INSERT_FLUSH_SECONDS,
+    )
+    dedup = DuplicateChecker(mongo_collection_name, on_duplicate or settings.SCRAPER_IMPORT_ON_DUPLICATE)
+    await dedup.prepare()
+    # 매핑은 작업 시작 시 한 번 컴파일 (매핑이 있을 때만 field_definitions의 number/date 값 변환)
+    collection = db.execute(select(Collection).where(Collection.id == collection_id)).scalar_one_or_none()
+    mapper = get_compiled_mapping(mapping, ignore_unmapped, collection.field_definitions if collection else None)
+    buffered: Dict[int, Dict[str, Any]] = {}  # 저장 대기 중인 행의 결과
+
+    domain_semaphores: Dict[str, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(max(1, settings.SCRAPER_PER_DOMAIN_CONCURRENCY))
+    )
+
+    async def run_row(idx: int, row: CsvRow) -> tuple[int, Dict[str, Any]]:
+        domain = urlparse(row[0]).hostname or ''
+        async with domain_semaphores[domain]:
+            outcome = await _process_row(
+                idx, row, collection_id, mapping, mapper, dedup, force_refresh
             )
-            item = await create_item_service(item_data, db)
+        return idx, outcome
+
+    async def flush_buffered() -> List[tuple[int, Dict[str, Any]]]:
+        """저장 대기 중인 아이템을 저장하고 행별 최종 결과 반환 (저장 실패 행은 failed, 다른 작업과 겹친 중복은 skipped)"""
+        flushed = []
+        for idx, item, error, code in await writer.flush():
+            outcome = buffered.pop(idx)
+            if code == DUPLICATE_KEY_ERROR:
+                outcome = {'status': 'skipped', 'duplicate': {'reason': 'index'}}
+            elif error:
+                outcome = {'status': 'failed', 'error': f"아이템 저장 실패: {error}"}
+            else:
+                outcome['item'] = item
+            flushed.append((idx, outcome))
+        return flushed
+
+    def make_event(idx: int, outcome: Dict[str, Any]) -> Dict[str, Any]:
+        nonlocal success_count, failed_count, skipped_count, completed_count
+        status = outcome['status']
+        completed_count += 1
+        row_total = max(current_total(), completed_count)
+        event = {
+            'index': idx + 1,
+            'current': completed_count,
+            'total': row_total,
+            'progress': round((completed_count / row_total) * 100, 2),
+            'rate': rate_limiter.current_rate(rows_by_idx.pop(idx)[0]),
+        }
+
+        if status in ('success', 'updated'):
             success_count += 1
-
-            # 진행 상황 전송
-            progress = {
+            event.update({
                 'type': 'progress',
-                'current': idx + 1,
-                'total': total,
+                'action': 'updated' if status == 'updated' else 'created',
+                'tier': outcome['tier'],
                 'success': success_count,
                 'failed': failed_count,
-                'progress': round(((idx + 1) / total) * 100, 2),
+                'skipped': skipped_count,
                 'item': {
-                    'id': str(item['_id']),
-                    'metadata': item['metadata']
+                    'id': str(outcome['item']['_id']),
+                    'metadata': outcome['item']['metadata']
                 }
-            }
-            yield f"data: {json.dumps(progress)}\n\n"
-
-        except Exception as e:
-            # 스크래핑 실패 플래그 설정
-            scraping_failed = True
-            error_str = str(e)
-
-            # Block 감지: "제목을 찾을 수 없습니다" 에러만 차단으로 간주
-            is_blocked = '제목을 찾을 수 없습니다' in error_str
-
-            if is_blocked:
-                # 현재 실패한 것 + 남은 URL 모두 수집 (원본 row 데이터 포함)
-                for remaining_idx in range(idx, len(urls)):
-                    remaining_data = {
-                        'row': remaining_idx + 1,
-                        'url': urls[remaining_idx]
-                    }
-                    # 원본 row 데이터가 있으면 포함
-                    if remaining_idx < len(original_rows):
-                        remaining_data['original_row'] = original_rows[remaining_idx]
-                    remaining_urls.append(remaining_data)
-
-                logger.info(f"[BLOCKED] 차단 감지 - 전체: {total}, 성공: {success_count}, 실패: {failed_count}, 남은 URL: {len(remaining_urls)}개")
-
-                # CSV 생성 및 저장
-                csv_content = generate_remaining_csv(remaining_urls)
-                download_token = store_remaining_csv(csv_content)
-                logger.info(f"[BLOCKED] CSV 생성 완료 - 토큰: {download_token}, 크기: {len(csv_content)} bytes")
-
-                # Block 알림 (토큰만 전송)
-                block_data = {
-                    'type': 'blocked',
-                    'index': idx + 1,
-                    'message': f'차단 또는 페이지 로딩 실패 감지 (행 {idx + 1}). 남은 {len(remaining_urls)}개 URL은 처리되지 않았습니다.',
-                    'total': total,
-                    'success': success_count,
-                    'failed': failed_count,
-                    'remaining_count': len(remaining_urls),
-                    'download_token': download_token
-                }
-                yield f"data: {json.dumps(block_data)}\n\n"
-
-                # 차단 시에도 complete 이벤트 전송 (프론트엔드에서 최종 상태 확인용)
-                complete_data = {
-                    'type': 'complete',
-                    'total': total,
-                    'success': success_count,
-                    'failed': failed_count,
-                    'blocked': True
+            })
+        elif status == 'fallback':
+            failed_count += 1  # 실패로 카운트 (아이템은 생성됨)
+            event.update({
+                'type': 'error_item',
+                'message': f"행 {idx + 1}: 스크래핑 실패 ({outcome['error']}). CSV 데이터로 아이템 생성됨.",
+                'success': success_count,
+                'failed': failed_count,
+                'skipped': skipped_count,
+                'item': {
+                    'id': str(outcome['item']['_id']),
+                    'metadata': outcome['item']['metadata']
                 }
-                yield f"data: {json.dumps(complete_data)}\n\n"
+            })
+        elif status == 'skipped':
+            skipped_count += 1
+            duplicate = outcome['duplicate']
+            if 'row' in duplicate:
+                reason = f"CSV 행 {duplicate['row']}과 중복"
+            else:
+                reason = f"이미 등록된 항목 ({_DUPLICATE_REASONS.get(duplicate['reason'], duplicate['reason'])} 일치)"
+            event.update({
+                'type': 'skipped',
+                'message': f"행 {idx + 1}: {reason}. 건너뜀.",
+                'reason': duplicate['reason'],
+                'existing_id': duplicate.get('item_id'),
+                'duplicate_of_row': duplicate.get('row'),
+                'success': success_count,
+                'failed': failed_count,
+                'skipped': skipped_count,
+            })
+        else:
+            failed_count += 1
+            event.update({
+                'type': 'error_item',
+                'message': f"행 {idx + 1}: 스크래핑 및 CSV 저장 실패 ({outcome['error']})",
+                'success': success_count,
+                'failed': failed_count,
+                'skipped': skipped_count,
+            })
+        return event
 
-                return  # 즉시 종료
+    # 시작 이벤트
+    yield {'type': 'start', 'total': current_total(), 'workers': worker_count}
 
-        # 스크래핑 실패 시 fallback: CSV 데이터만으로 아이템 생성 (차단이 아닌 일반 에러만)
-        if scraping_failed and not blocked:
-            try:
-                # CSV 데이터만 사용 (원본 row에서 추출)
-                fallback_metadata = {}
-                if idx < len(original_rows):
-                    row = original_rows[idx]
-                    # URL 제외한 모든 CSV 데이터 사용
-                    for key, value in row.items():
-                        if key.lower() not in ['url', 'link', '주소'] and value.strip():
-                            fallback_metadata[key] = value.strip()
-
-                # source_url 추가
-                fallback_metadata['source_url'] = url
-
-                # 매핑 적용
-                if mapping:
-                    fallback_metadata = apply_field_mapping(fallback_metadata, mapping, ignore_unmapped)
-
-                # 아이템 생성
-                item_data = ItemCreate(
-                    collection_id=collection_id,
-                    metadata=fallback_metadata
-                )
-                item = await create_item_service(item_data, db)
-                failed_count += 1  # 실패로 카운트
-
-                # 실패로 표시하되 아이템은 생성됨
-                error_data = {
-                    'type': 'error_item',
-                    'index': idx + 1,
-                    'message': f"행 {idx + 1}: 스크래핑 실패 ({error_str}). CSV 데이터로 아이템 생성됨.",
-                    'current': idx + 1,
-                    'total': total,
-                    'success': success_count,
-                    'failed': failed_count,
-                    'progress': round(((idx + 1) / total) * 100, 2),
-                    'item': {
-                        'id': str(item['_id']),
-                        'metadata': item['metadata']
-                    }
-                }
-                yield f"data: {json.dumps(error_data)}\n\n"
-
-            except Exception as fallback_error:
-                # fallback도 실패한 경우 (일반 에러 처리)
-                failed_count += 1
-                error_msg = f"행 {idx + 1}: 스크래핑 및 CSV 저장 실패 ({str(fallback_error)})"
-
-                # 에러 전송
-                error_data = {
-                    'type': 'error_item',
-                    'index': idx + 1,
-                    'message': error_msg,
-                    'current': idx + 1,
-                    'total': total,
-                    'success': success_count,
-                    'failed': failed_count,
-                    'progress': round(((idx + 1) / total) * 100, 2)
-                }
-                yield f"data: {json.dumps(error_data)}\n\n"
+    in_flight: set[asyncio.Task] = set()
+
+    try:
+        while True:
+            # 차단 전까지 빈 슬롯에 다음 행 배정 (CSV 순서대로)
+            while not blocked_indices and not exhausted and len(in_flight) < worker_count:
+                next_row = await anext(source, None)
+                if next_row is None:
+                    exhausted = True
+                    break
+                idx, row = next_row
+                rows_by_idx[idx] = row
+                in_flight.add(asyncio.create_task(run_row(idx, row)))
+
+            if not in_flight:
+                break
+
+            # 저장 대기 중인 아이템이 있으면 flush 시각까지만 대기
+            done, _ = await asyncio.wait(
+                in_flight, timeout=writer.time_until_flush(), return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in sorted(done, key=lambda t: t.result()[0]):
+                in_flight.discard(task)
+                idx, outcome = task.result()
+
+                if outcome['status'] == 'blocked':
+                    blocked_indices.append(idx)
+                elif outcome['status'] in ('success', 'fallback'):
+                    buffered[idx] = outcome
+                    writer.add(idx, outcome.pop('document'))
+                else:
+                    yield make_event(idx, outcome)
+
+            if writer.should_flush():
+                for idx, outcome in await flush_buffered():
+                    yield make_event(idx, outcome)
+
+        # 남은 아이템 저장
+        for idx, outcome in await flush_buffered():
+            yield make_event(idx, outcome)
+    finally:
+        # 클라이언트 연결이 끊긴 경우 등 처리 중인 작업 정리
+        # (저장 전인 아이템은 버려지며, 작업 재개 시 해당 행은 다시 처리됨)
+        for task in in_flight:
+            task.cancel()
+
+    if blocked_indices:
+        # 차단된 행 + 배정되지 않은 행(rows에 남은 행)을 읽는 대로 CSV로 저장 (원본 row 데이터 포함)
+        async def unfinished_rows() -> AsyncGenerator[IndexedCsvRow, None]:
+            for blocked_idx in sorted(blocked_indices):
+                yield blocked_idx, rows_by_idx[blocked_idx]
+            if not exhausted:
+                async for remaining_row in source:
+                    yield remaining_row
+
+        download_token, remaining_count = await store_remaining_csv(unfinished_rows())
+        first_blocked = min(blocked_indices) + 1
+        logger.info(
+            f"[BLOCKED] 차단 감지 - 전체: {current_total()}, 성공: {success_count}, 실패: {failed_count}, "
+            f"남은 URL: {remaining_count}개, CSV 토큰: {download_token}"
+        )
+
+        # Block 알림 (토큰만 전송)
+        yield {
+            'type': 'blocked',
+            'index': first_blocked,
+            'message': f'차단 또는 페이지 로딩 실패 감지 (행 {first_blocked}). 남은 {remaining_count}개 URL은 처리되지 않았습니다.',
+            'total': current_total(),
+            'success': success_count,
+            'failed': failed_count,
+            'skipped': skipped_count,
+            'remaining_count': remaining_count,
+            'download_token': download_token,
+            'rate': rate_limiter.current_rate(rows_by_idx[first_blocked - 1][0])
+        }
+
+        # 차단 시에도 complete 이벤트 전송 (프론트엔드에서 최종 상태 확인용)
+        yield {
+            'type': 'complete',
+            'total': current_total(),
+            'success': success_count,
+            'failed': failed_count,
+            'skipped': skipped_count,
+            'blocked': True
+        }
+        return
 
     # 완료 (정상 완료 시)
-    complete_data = {
+    yield {
         'type': 'complete',
-        'total': total,
+        'total': current_total(),
         'success': success_count,
-        'failed': failed_count
+        'failed': failed_count,
+        'skipped': skipped_count
     }
-    yield f"data: {json.dumps(complete_data)}\n\n"
+
+
+async def bulk_scrape_csv_stream(
+    urls: List[str],
+    additional_data: List[Dict[str, Any]],
+    original_rows: List[Dict[str, Any]],
+    collection_id: int,
+    mapping: Dict[str, str],
+    ignore_unmapped: bool,
+    db: Session,
+    workers: Optional[int] = None,
+    force_refresh: bool = False,
+    on_duplicate: Optional[str] = None
+) -> AsyncGenerator[str, None]:
+    """
+    CSV URL 목록을 요청 안에서 바로 스크래핑하여 SSE로 전송 (작업 큐 없이 실행, 스크립트/테스트용)
+
+    이벤트 형식은 bulk_scrape_events 참고
+
+    Yields:
+        Server-Sent Events 형식의 진행 상황 데이터
+    """
+    async for event in bulk_scrape_events(
+        indexed_rows(urls, additional_data, original_rows), len(urls),
+        collection_id, mapping, ignore_unmapped, db,
+        workers=workers, force_refresh=force_refresh, on_duplicate=on_duplicate
+    ):
+        yield _sse(event)
@@ -0,0 +1,134 @@
+"""
+CSV 일괄 등록 중복 감지
+아이템에 저장된 정규화한 ISBN/출처 키(dedup.isbn, dedup.source, item.duplicate_keys 참고)를
+컬렉션별 unique 인덱스로 조회하여 이미 등록된 항목은 스크래핑 전에 건너뛰거나(skip) 기존 아이템을 갱신(update)
+"""
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+
+from backend.app.db.mongodb import get_database
+from backend.app.services.item.item_service import item_helper
+from backend.app.services.item.count_cache import invalidate_item_counts
+from backend.app.services.item.duplicate_keys import DEDUP_FIELD, ensure_dedup_indexes, taken_keys
+from backend.app.services.item.search import SEARCH_TOKENS_FIELD, search_tokens
+
+logger = logging.getLogger(__name__)
+
+# 중복 처리 방식
+SKIP = "skip"  # 스크래핑하지 않고 건너뜀
+UPDATE = "update"  # 다시 스크래핑하여 기존 아이템 갱신
+INSERT = "insert"  # 중복이어도 새 아이템으로 등록 (이미 다른 아이템이 가진 키는 저장하지 않음)
+DUPLICATE_MODES = (SKIP, UPDATE, INSERT)
+
+
+class DuplicateChecker:
+    """
+    작업 하나의 중복 감지기
+
+    - 컬렉션의 기존 아이템(dedup 인덱스)과 같은 작업 안에서 먼저 처리된 행을 함께 확인
+    - find()가 확인과 동시에 키를 예약하므로 같은 키를 가진 행이 동시에 스크래핑돼도 먼저 확인한 행만 처리하고
+      나머지는 같은 작업의 중복 행이 됨 (insert 모드는 claim()에서 예약하여 한 행만 키를 가짐)
+    - 실패/차단된 행의 예약은 release()로 해제
+    """
+
+    def __init__(self, mongo_collection_name: str, mode: str):
+        if mode not in DUPLICATE_MODES:
+            raise ValueError(f"중복 처리 방식은 {', '.join(DUPLICATE_MODES)} 중 하나여야 합니다.")
+        self.collection = get_database()[mongo_collection_name]
+        self.mode = mode
+        self._claimed: Dict[tuple[str, str], int] = {}  # (필드, 값) → 행 번호 (0-based)
+
+    async def prepare(self) -> None:
+        """
+        dedup 인덱스 확인 (작업 시작 시 호출)
+
+        키는 아이템을 저장/수정할 때 함께 저장되며, 키 저장 이전의 아이템은 서버 시작 시 한 번 채움
+        (duplicate_keys.start_dedup_backfill)
+        """
+        await ensure_dedup_indexes(self.collection)
+
+    async def find(self, idx: int, keys: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """
+        중복 확인 + 키 예약 (skip/update 모드, 스크래핑 전후에 호출)
+
+        다른 행이 예약하지 않은 키는 DB 조회 전에 이 행으로 예약하여
+        동시에 처리 중인 같은 키의 행이 둘 다 중복이 아닌 것으로 판단되지 않게 함
+
+        Returns:
+            None 또는 {'reason': 'source' | 'isbn', 'item_id': 기존 아이템 ID} /
+            {'reason': ..., 'row': 같은 작업에서 먼저 처리된 행 번호 (1-based)}
+        """
+        for field, value in keys.items():
+            other = self._claimed.get((field, value))
+            if other is not None and other != idx:
+                return {'reason': field, 'row': other + 1}
+        if not keys:
+            return None
+        for field, value in keys.items():
+            self._claimed[(field, value)] = idx
+        existing = await self.collection.find_one(
+            {"$or": [{f"dedup.{field}": value} for field, value in keys.items()]},
+            {"dedup": 1},
+        )
+        if existing is None:
+            return None
+        dedup = existing.get("dedup") or {}
+        reason = next((field for field, value in keys.items() if dedup.get(field) == value), 'source')
+        return {'reason': reason, 'item_id': str(existing["_id"])}
+
+    async def claim(self, idx: int, keys: Dict[str, str]) -> Dict[str, str]:
+        """
+        행이 저장할 키 예약 후 반환
+
+        다른 행이 예약했거나 (insert 모드에서) 기존 아이템이 가진 키는 제외
+        """
+        candidates = {
+            field: value for field, value in keys.items()
+            if self._claimed.get((field, value)) in (None, idx)
+        }
+        taken = await taken_keys(self.collection, candidates.items()) if self.mode == INSERT else set()
+        claimed = {}
+        for field, value in candidates.items():
+            if (field, value) in taken:
+                continue
+            self._claimed[(field, value)] = idx
+            claimed[field] = value
+        return claimed
+
+    def release(self, idx: int, *key_sets: Dict[str, str]) -> None:
+        """행이 예약한 키 해제 (실패/차단된 행: 같은 키의 다른 행이 처리될 수 있게)"""
+        for keys in key_sets:
+            for field, value in keys.items():
+                if self._claimed.get((field, value)) == idx:
+                    del self._claimed[(field, value)]
+
+    async def update_existing(
+        self,
+        item_id: str,
+        document: Dict[str, Any],
+        keys: Dict[str, str],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        기존 아이템의 제목/메타데이터를 새로 스크래핑한 내용으로 갱신 (공개 여부, 생성 시각은 유지)
+
+        중복 감지 키도 이번 행의 키로 바꿈 (다른 아이템이 가진 키는 제외)
+        """
+        object_id = ObjectId(item_id)
+        taken = await taken_keys(self.collection, keys.items(), [object_id])
+        item = await self.collection.find_one_and_update(
+            {"_id": object_id},
+            {"$set": {
+                "title": document["title"],
+                "metadata": document["metadata"],
+                SEARCH_TOKENS_FIELD: search_tokens(document),
+                DEDUP_FIELD: {field: value for field, value in keys.items() if (field, value) not in taken},
+                "updated_at": datetime.now(timezone.utc),
+            }},
+            return_document=ReturnDocument.AFTER,
+        )
+        invalidate_item_counts(self.collection.name)
+        return item_helper(item) if item else None
@@ -0,0 +1,188 @@
+"""
+필드 매핑 변환기
+컬렉션의 field_mapping(키 이름 변경/제외)과 field_definitions(number/date 타입 변환)를 한 번 컴파일하여
+매핑 버전별로 캐시하고, 문서 하나 또는 배치 단위로 적용
+"""
+import hashlib
+import json
+import re
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Dict, List, Any, Callable, Hashable, Optional, Tuple
+
+from backend.app.models.collection import Collection
+
+# 캐시할 컴파일 결과 수 (컬렉션 × 매핑 버전)
+MAPPING_CACHE_SIZE = 64
+
+_NUMBER_PATTERN = re.compile(r'-?\d[\d,]*(?:\.\d+)?')
+_DATE_PATTERNS = (
+    re.compile(r'(\d{4})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})'),  # 2024.01.05, 2024년 1월 5일
+    re.compile(r'^(\d{4})(\d{2})(\d{2})$'),  # 20240105
+)
+_MONTH_PATTERN = re.compile(r'(\d{4})\s*[.\-/년]\s*(\d{1,2})(?!\d)')  # 2024.01, 2024년 1월
+
+
+def coerce_number(value: Any) -> Any:
+    """'12,000원', '320쪽' → 12000, 320 (숫자를 찾지 못하면 원래 값)"""
+    if not isinstance(value, str):
+        return value
+    match = _NUMBER_PATTERN.search(value)
+    if not match:
+        return value
+    number = float(match.group().replace(',', ''))
+    return int(number) if number.is_integer() else number
+
+
+def coerce_date(value: Any) -> Any:
+    """'2024.01.05', '2024년 1월 5일' → '2024-01-05', '2024.01' → '2024-01' (해석할 수 없으면 원래 값)"""
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if not isinstance(value, str):
+        return value
+    text = value.strip()
+    for pattern in _DATE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            try:
+                return date(*(int(part) for part in match.groups())).isoformat()
+            except ValueError:
+                return value
+    match = _MONTH_PATTERN.search(text)
+    if match and 1 <= int(match.group(2)) <= 12:
+        return f"{match.group(1)}-{int(match.group(2)):02d}"
+    return value
+
+
+_COERCERS: Dict[str, Callable[[Any], Any]] = {
+    "number": coerce_number,
+    "date": coerce_date,
+}
+
+
+def parse_mapping_config(config: Any) -> Tuple[Dict[str, str], bool]:
+    """
+    Collection.field_mapping → (mapping, ignore_unmapped)
+
+    - 현재 형식: {"mapping": {...}, "ignore_unmapped": bool}
+    - 레거시 형식: 매핑 dict 자체 ({"title": "책제목", ...})
+    """
+    if not isinstance(config, dict):
+        return {}, False
+    if "mapping" in config or "ignore_unmapped" in config:
+        return config.get("mapping") or {}, bool(config.get("ignore_unmapped", False))
+    return config, False
+
+
+class CompiledMapping:
+    """
+    컴파일된 필드 매핑
+
+    - mapping: {원본 키: 대상 키} (대상 키가 빈 문자열이면 제외)
+    - ignore_unmapped: True면 매핑에 없는 키 제외, False면 원래 키로 유지
+    - field_definitions의 number/date 필드는 매핑 후 값 변환 (매핑이 없으면 변환도 하지 않고 입력 그대로)
+    """
+
+    def __init__(
+        self,
+        mapping: Optional[Dict[str, str]] = None,
+        ignore_unmapped: bool = False,
+        field_definitions: Optional[Dict[str, Any]] = None,
+    ):
+        # 제외할 키는 None으로 저장 (매핑에 없는 키와 구분)
+        self._targets: Dict[str, Optional[str]] = {
+            source: target or None for source, target in (mapping or {}).items()
+        }
+        self.ignore_unmapped = ignore_unmapped and bool(self._targets)
+        fields = ((field_definitions or {}).get("fields") or []) if self._targets else []
+        self._coercers: List[Tuple[str, Callable[[Any], Any]]] = [
+            (field["key"], _COERCERS[field.get("type")])
+            for field in fields
+            if isinstance(field, dict) and field.get("key") and field.get("type") in _COERCERS
+        ]
+
+    @property
+    def is_identity(self) -> bool:
+        """매핑할 것이 없는지 (apply가 입력을 그대로 반환)"""
+        return not self._targets
+
+    def apply(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """문서 하나에 매핑 적용"""
+        if self.is_identity:
+            return data
+        if self.ignore_unmapped:
+            targets = self._targets
+            mapped = {targets[key]: value for key, value in data.items() if targets.get(key)}
+        else:
+            get = self._targets.get
+            mapped = {}
+            for key, value in data.items():
+                target = get(key, key)
+                if target is not None:
+                    mapped[target] = value
+        for key, coerce in self._coercers:
+            if key in mapped:
+                mapped[key] = coerce(mapped[key])
+        return mapped
+
+    def apply_many(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """문서 배치에 매핑 적용"""
+        if self.is_identity:
+            return documents
+        apply = self.apply
+        return [apply(document) for document in documents]
+
+
+_cache: "OrderedDict[Hashable, CompiledMapping]" = OrderedDict()
+
+
+def _cached(key: Hashable, build: Callable[[], CompiledMapping]) -> CompiledMapping:
+    """캐시에서 컴파일 결과 조회 (없으면 build로 컴파일하여 저장, LRU)"""
+    compiled = _cache.get(key)
+    if compiled is None:
+        compiled = build()
+        _cache[key] = compiled
+        while len(_cache) > MAPPING_CACHE_SIZE:
+            _cache.popitem(last=False)
+    else:
+        _cache.move_to_end(key)
+    return compiled
+
+
+def _version(mapping: Dict[str, str], ignore_unmapped: bool, field_definitions: Optional[Dict[str, Any]]) -> str:
+    """매핑 설정 내용의 해시 (설정이 바뀌면 다시 컴파일)"""
+    payload = json.dumps([mapping, ignore_unmapped, field_definitions], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def get_compiled_mapping(
+    mapping: Optional[Dict[str, str]] = None,
+    ignore_unmapped: bool = False,
+    field_definitions: Optional[Dict[str, Any]] = None,
+) -> CompiledMapping:
+    """
+    매핑 설정으로 컴파일된 매핑 반환 (같은 설정이면 캐시 재사용)
+
+    설정 내용을 해시하므로 작업 시작 시처럼 한 번만 호출하는 곳에서 사용
+    (요청마다 호출하는 곳은 compiled_mapping_for)
+    """
+    return _cached(
+        _version(mapping or {}, ignore_unmapped, field_definitions),
+        lambda: CompiledMapping(mapping, ignore_unmapped, field_definitions),
+    )
+
+
+def compiled_mapping_for(collection: Collection, apply_mapping: bool = True) -> CompiledMapping:
+    """
+    컬렉션의 저장된 매핑 컴파일 (apply_mapping=False거나 저장된 매핑이 없으면 입력을 그대로 반환)
+
+    컬렉션 id와 수정 시각(updated_at, 수정된 적 없으면 created_at)으로 캐시하므로
+    호출마다 설정을 해시하지 않고, 매핑/필드 정의를 저장하면 새 버전으로 다시 컴파일
+    """
+    def build() -> CompiledMapping:
+        mapping, ignore_unmapped = parse_mapping_config(collection.field_mapping) if apply_mapping else ({}, False)
+        return CompiledMapping(mapping, ignore_unmapped, collection.field_definitions)
+
+    return _cached(("collection", collection.id, collection.updated_at or collection.created_at, apply_mapping), build)
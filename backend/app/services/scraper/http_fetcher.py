@@ -0,0 +1,102 @@
+"""
+HTTP 페처 (스크래핑 1단계)
+서버에서 렌더링된 HTML을 keep-alive 커넥션 풀로 가져옴 (브라우저 없이)
+"""
+import logging
+import re
+from contextlib import asynccontextmanager
+from typing import Optional, AsyncIterator
+import httpx
+
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# <meta charset="..."> 또는 <meta http-equiv="Content-Type" content="...; charset=...">
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+
+DEFAULT_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36'
+    ),
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+}
+
+
+class HttpPage:
+    """HTTP 응답 요약"""
+
+    def __init__(self, url: str, status_code: int, html: str):
+        self.url = url  # 리다이렉트 후 최종 URL
+        self.status_code = status_code
+        self.html = html
+
+
+def _create_client(proxy: Optional[str] = None) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        headers=DEFAULT_HEADERS,
+        proxy=proxy,
+        follow_redirects=True,
+        timeout=settings.SCRAPER_HTTP_TIMEOUT_SECONDS,
+        limits=httpx.Limits(
+            max_connections=settings.SCRAPER_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.SCRAPER_HTTP_MAX_CONNECTIONS,
+        ),
+    )
+
+
+def _decode_html(response: httpx.Response) -> str:
+    """Content-Type 헤더 → <meta charset> → UTF-8 순서로 인코딩 결정 (EUC-KR 페이지 대응)"""
+    content_type = response.headers.get('content-type', '')
+    if 'charset=' in content_type.lower():
+        return response.text
+
+    match = _META_CHARSET_RE.search(response.content[:4096])
+    encoding = match.group(1).decode('ascii') if match else 'utf-8'
+    if encoding.lower() in ('euc-kr', 'ks_c_5601-1987'):
+        encoding = 'cp949'  # EUC-KR 상위 호환
+    try:
+        return response.content.decode(encoding, errors='replace')
+    except LookupError:
+        return response.content.decode('utf-8', errors='replace')
+
+
+async def fetch_html(client: httpx.AsyncClient, url: str) -> HttpPage:
+    """
+    URL의 HTML 가져오기
+
+    Raises:
+        httpx.HTTPError: 연결 실패, timeout 등
+    """
+    response = await client.get(url)
+    return HttpPage(url=str(response.url), status_code=response.status_code, html=_decode_html(response))
+
+
+# 애플리케이션 공용 HTTP 클라이언트 (keep-alive 커넥션 재사용)
+http_client: Optional[httpx.AsyncClient] = None
+
+
+async def start_http_client(proxy: Optional[str] = None) -> None:
+    """공용 HTTP 클라이언트 생성 (proxy: 모든 요청을 보낼 프록시 URL, 벤치마크의 가짜 서점 서버 등)"""
+    global http_client
+    http_client = _create_client(proxy)
+
+
+async def stop_http_client() -> None:
+    """공용 HTTP 클라이언트 종료"""
+    global http_client
+    if http_client:
+        await http_client.aclose()
+        http_client = None
+
+
+@asynccontextmanager
+async def get_http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """공용 클라이언트 반환 (앱 lifespan 밖에서는 임시 클라이언트 생성 후 종료)"""
+    if http_client is not None:
+        yield http_client
+        return
+    async with _create_client() as client:
+        yield client
@@ -0,0 +1,721 @@
+"""
+CSV 일괄 등록 작업 큐 (MongoDB)
+업로드된 CSV를 작업(import_jobs)과 행(import_job_rows)으로 저장하고, 백그라운드 워커가 처리하며
+진행 이벤트(import_job_events)를 순번(seq)과 함께 기록하여 SSE/폴링으로 언제든 다시 연결 가능
+"""
+import asyncio
+import json
+import logging
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, AsyncGenerator, AsyncIterator, Optional, Set
+
+from pymongo import ReturnDocument
+
+from backend.app.core.config import settings
+from backend.app.db.base import SessionLocal
+from backend.app.db.mongodb import get_database
+from backend.app.services.scraper import dedup
+from backend.app.services.scraper.csv_processor import CsvRow, IndexedCsvRow, bulk_scrape_events
+
+logger = logging.getLogger(__name__)
+
+JOBS_COLLECTION = "import_jobs"
+ROWS_COLLECTION = "import_job_rows"
+EVENTS_COLLECTION = "import_job_events"
+
+# 작업 상태
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+BLOCKED = "blocked"
+FAILED = "failed"
+CANCELLED = "cancelled"
+COOLDOWN = "cooldown"  # 차단 후 자동 재개 대기 (resume_at 이후 워커가 다시 가져감)
+FINISHED_STATUSES = (COMPLETED, BLOCKED, FAILED, CANCELLED)
+
+# 행 상태 (pending 행만 처리/재개 대상)
+ROW_PENDING = "pending"
+ROW_SUCCESS = "success"
+ROW_FALLBACK = "fallback"  # 스크래핑 실패, CSV 데이터로 아이템 생성
+ROW_FAILED = "failed"
+ROW_SKIPPED = "skipped"  # 이미 등록된 항목 (on_duplicate=skip)
+
+# CSV 업로드를 읽으면서 한 번에 저장하는 행 수 (작업 실행 시 한 번에 읽는 행 수)
+ROW_INSERT_BATCH_SIZE = 500
+# 행을 저장하는 중에 시작한 작업이 다음 행을 기다리는 최대 시간 (같은 프로세스면 저장 즉시 깨어남)
+ROW_WAIT_SECONDS = 1.0
+
+# 이벤트 대기 중 연결 유지용 SSE 주석 간격
+SSE_KEEPALIVE_SECONDS = 15.0
+
+
+def _jobs():
+    return get_database()[JOBS_COLLECTION]
+
+
+def _rows():
+    return get_database()[ROWS_COLLECTION]
+
+
+def _events():
+    return get_database()[EVENTS_COLLECTION]
+
+
+def job_summary(job: Dict[str, Any]) -> Dict[str, Any]:
+    """API 응답용 작업 정보 (매핑 등 내부 설정 제외)"""
+    return {
+        "job_id": job["_id"],
+        "collection_id": job["collection_id"],
+        "status": job["status"],
+        "total": job["total"],
+        "rows_complete": job.get("rows_complete", True),
+        "success": job.get("success", 0),
+        "failed": job.get("failed", 0),
+        "skipped": job.get("skipped", 0),
+        "on_duplicate": job.get("on_duplicate", dedup.INSERT),
+        "remaining_count": job.get("remaining_count"),
+        "download_token": job.get("download_token"),
+        "error": job.get("error"),
+        "auto_resume": job.get("auto_resume", False),
+        "auto_resume_attempts": job.get("auto_resume_attempts", 0),
+        "resume_at": job.get("resume_at"),
+        "last_seq": job.get("event_seq", 0),
+        "created_at": job["created_at"],
+        "started_at": job.get("started_at"),
+        "finished_at": job.get("finished_at"),
+    }
+
+
+async def ensure_import_job_indexes() -> None:
+    """작업/행/이벤트 인덱스 생성 (보관 기간이 지나면 TTL로 삭제)"""
+    retention = settings.SCRAPER_JOB_RETENTION_DAYS * 24 * 3600
+    try:
+        await _jobs().create_index([("status", 1), ("created_at", 1)])
+        await _jobs().create_index("created_at", expireAfterSeconds=retention, name="created_at_ttl")
+        await _rows().create_index([("job_id", 1), ("index", 1)], unique=True)
+        await _rows().create_index("created_at", expireAfterSeconds=retention, name="created_at_ttl")
+        await _events().create_index([("job_id", 1), ("seq", 1)], unique=True)
+        await _events().create_index("created_at", expireAfterSeconds=retention, name="created_at_ttl")
+    except Exception as e:
+        logger.warning(f"작업 큐 인덱스 생성 실패: {e}")
+
+
+async def create_import_job(
+    rows: AsyncIterator[CsvRow],
+    collection_id: int,
+    mapping: Dict[str, str],
+    ignore_unmapped: bool,
+    workers: Optional[int] = None,
+    force_refresh: bool = False,
+    auto_resume: Optional[bool] = None,
+    on_duplicate: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    CSV 일괄 등록 작업 생성 (queued 상태로 저장 후 워커에 알림)
+
+    rows(iter_csv_rows)를 읽으면서 ROW_INSERT_BATCH_SIZE개씩 행을 저장하므로
+    업로드 크기와 관계없이 메모리 사용량이 일정합니다.
+    작업은 첫 배치를 저장할 때 만들어져 바로 실행되며, 워커는 저장된 행부터 처리하면서
+    rows_complete가 될 때까지 다음 행을 기다립니다 (total은 지금까지 저장된 행 수).
+
+    auto_resume=True면 차단 시 대기(cooldown) 후 남은 행부터 자동으로 이어서 처리
+    (None이면 SCRAPER_JOB_AUTO_RESUME 설정값)
+
+    on_duplicate: 이미 등록된 항목 처리 방식 skip/update/insert (None이면 SCRAPER_IMPORT_ON_DUPLICATE)
+
+    Returns:
+        작업 문서
+
+    Raises:
+        ValueError: CSV 형식 오류 (아직 시작하지 않은 작업은 행과 함께 삭제,
+            이미 시작한 작업은 남은 행을 지우고 취소 - 처리된 행의 아이템은 유지)
+    """
+    now = datetime.utcnow()
+    job_id = uuid.uuid4().hex
+
+    job = {
+        "_id": job_id,
+        "collection_id": collection_id,
+        "status": QUEUED,
+        "total": 0,
+        "rows_complete": False,
+        "success": 0,
+        "failed": 0,
+        "skipped": 0,
+        "event_seq": 0,
+        "mapping": mapping,
+        "ignore_unmapped": ignore_unmapped,
+        "workers": workers,
+        "force_refresh": force_refresh,
+        "on_duplicate": on_duplicate or settings.SCRAPER_IMPORT_ON_DUPLICATE,
+        "auto_resume": settings.SCRAPER_JOB_AUTO_RESUME if auto_resume is None else auto_resume,
+        "auto_resume_attempts": 0,
+        "created_at": now,
+    }
+    worker = get_import_worker()
+
+    total = 0
+    batch: List[Dict[str, Any]] = []
+    job_inserted = False
+
+    async def insert_batch() -> None:
+        nonlocal job_inserted
+        await _rows().insert_many(batch, ordered=False)
+        # 첫 배치를 저장한 뒤 작업을 만들어 워커가 바로 시작할 수 있게 함
+        if job_inserted:
+            await _jobs().update_one({"_id": job_id}, {"$set": {"total": total, "rows_updated_at": datetime.utcnow()}})
+        else:
+            await _jobs().insert_one({**job, "total": total, "rows_updated_at": datetime.utcnow()})
+            job_inserted = True
+        if worker:
+            worker.notify(job_id)
+
+    try:
+        async for url, extra, original_row in rows:
+            batch.append({
+                "job_id": job_id,
+                "index": total,
+                "url": url,
+                "extra": extra,
+                "original_row": original_row,
+                "status": ROW_PENDING,
+                "created_at": now,
+            })
+            total += 1
+            if len(batch) >= ROW_INSERT_BATCH_SIZE:
+                await insert_batch()
+                batch = []
+        if batch:
+            await insert_batch()
+    except Exception as e:
+        if job_inserted:
+            await _abort_job_rows(job_id, str(e))
+        else:
+            await _rows().delete_many({"job_id": job_id})
+        raise
+
+    if job_inserted:
+        job = await _jobs().find_one_and_update(
+            {"_id": job_id},
+            {"$set": {"total": total, "rows_complete": True}},
+            return_document=ReturnDocument.AFTER,
+        )
+    else:
+        job.update({"total": total, "rows_complete": True})
+        await _jobs().insert_one(job)
+    if worker:
+        worker.notify(job_id)
+    logger.info(f"[JOB] 작업 생성 {job_id} - 컬렉션: {collection_id}, 행: {total}개")
+    return job
+
+
+async def _abort_job_rows(job_id: str, error: str) -> None:
+    """행 저장 중 오류: 시작 전 작업은 행과 함께 삭제, 이미 시작한 작업은 남은 행을 지우고 취소"""
+    deleted = await _jobs().delete_one({"_id": job_id, "status": QUEUED})
+    if deleted.deleted_count:
+        await _rows().delete_many({"job_id": job_id})
+        return
+    await cancel_import_job(job_id)
+    await _rows().delete_many({"job_id": job_id, "status": ROW_PENDING})
+    await _jobs().update_one({"_id": job_id}, {"$set": {"rows_complete": True, "error": error}})
+    logger.warning(f"[JOB] 행 저장 실패로 작업 취소 {job_id}: {error}")
+
+
+async def get_import_job(job_id: str) -> Optional[Dict[str, Any]]:
+    return await _jobs().find_one({"_id": job_id})
+
+
+async def list_import_jobs(collection_id: Optional[int] = None, limit: int = 20) -> List[Dict[str, Any]]:
+    """최근 작업 목록 (최신순)"""
+    query = {"collection_id": collection_id} if collection_id is not None else {}
+    cursor = _jobs().find(query).sort("created_at", -1).limit(limit)
+    return await cursor.to_list(length=limit)
+
+
+async def cancel_import_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    작업 취소 요청
+
+    대기 중(자동 재개 대기 포함)인 작업은 바로 취소, 실행 중인 작업은 워커가 취소 요청을 확인한 뒤 중단
+    (처리 중이던 행은 pending으로 남아 재개 가능)
+    """
+    job = await _jobs().find_one_and_update(
+        {"_id": job_id, "status": {"$in": [QUEUED, COOLDOWN]}},
+        {"$set": {"status": CANCELLED, "finished_at": datetime.utcnow()}, "$unset": {"resume_at": ""}},
+        return_document=ReturnDocument.AFTER,
+    )
+    if job:
+        return job
+
+    job = await _jobs().find_one_and_update(
+        {"_id": job_id, "status": RUNNING},
+        {"$set": {"cancel_requested": True}},
+        return_document=ReturnDocument.AFTER,
+    )
+    if job:
+        worker = get_import_worker()
+        if worker:
+            worker.cancel_local(job_id)
+        return job
+    return await get_import_job(job_id)
+
+
+async def resume_import_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    중단된 작업(차단/실패/취소)을 다시 대기열에 넣음 (pending 행만 처리)
+
+    자동 재개 대기 중인 작업은 대기 시간을 건너뛰고 바로 재개하며, 자동 재개 횟수는 초기화
+
+    Returns:
+        작업 문서 (재개할 수 없는 상태면 None)
+    """
+    job = await _jobs().find_one_and_update(
+        {"_id": job_id, "status": {"$in": [BLOCKED, FAILED, CANCELLED, COOLDOWN]}},
+        {
+            "$set": {"status": QUEUED, "cancel_requested": False, "auto_resume_attempts": 0},
+            "$unset": {"error": "", "download_token": "", "remaining_count": "", "finished_at": "", "resume_at": ""},
+        },
+        return_document=ReturnDocument.AFTER,
+    )
+    if job:
+        logger.info(f"[JOB] 작업 재개 요청 {job_id}")
+        worker = get_import_worker()
+        if worker:
+            worker.notify()
+    return job
+
+
+async def stream_job_events(job_id: str, after_seq: int = 0) -> AsyncGenerator[str, None]:
+    """
+    작업 이벤트를 SSE로 전송 (after_seq 이후부터, 작업이 끝날 때까지 대기하며 전송)
+
+    각 이벤트에 `id: seq` 줄을 붙이므로 EventSource의 Last-Event-ID로 끊긴 지점부터 재연결 가능
+
+    Yields:
+        Server-Sent Events 형식 문자열
+    """
+    last_seq = after_seq
+    idle = 0.0
+    worker = get_import_worker()
+
+    while True:
+        # 작업 상태를 먼저 읽어야 종료 판단 시 마지막 이벤트를 놓치지 않음
+        job = await get_import_job(job_id)
+        if job is None:
+            yield f"data: {json.dumps({'type': 'error', 'message': '작업을 찾을 수 없습니다.'})}\n\n"
+            return
+
+        cursor = _events().find({"job_id": job_id, "seq": {"$gt": last_seq}}).sort("seq", 1).limit(500)
+        events = await cursor.to_list(length=500)
+        for doc in events:
+            last_seq = doc["seq"]
+            yield f"id: {last_seq}\ndata: {json.dumps(doc['event'], default=str)}\n\n"
+
+        if events:
+            idle = 0.0
+            continue
+        if job["status"] in FINISHED_STATUSES:
+            return
+
+        # 새 이벤트 대기 (같은 프로세스의 워커면 즉시 알림, 아니면 주기적 조회)
+        waited = await _wait_for_event(worker, job_id, timeout=1.0)
+        idle = 0.0 if waited else idle + 1.0
+        if idle >= SSE_KEEPALIVE_SECONDS:
+            idle = 0.0
+            yield ": keepalive\n\n"
+
+
+async def _wait_for_event(worker: Optional["ImportJobWorker"], job_id: str, timeout: float) -> bool:
+    if worker is None:
+        await asyncio.sleep(timeout)
+        return False
+    return await worker.wait_for_event(job_id, timeout)
+
+
+class ImportJobWorker:
+    """
+    작업 큐 워커 (프로세스 내 asyncio)
+
+    - queued 작업, 대기 시간이 지난 cooldown 작업, 하트비트가 끊긴 running 작업(서버 재시작 등)을
+      원자적으로 가져와 실행
+    - 동시에 실행하는 작업 수는 max_jobs로 제한 (작업 안의 행 동시 처리 수는 작업별 workers)
+    - 여러 프로세스(API 서버 + 별도 워커)가 같은 큐를 처리해도 한 작업은 한 워커만 실행
+    """
+
+    def __init__(self, max_jobs: int, poll_seconds: float, stale_seconds: float, heartbeat_seconds: float):
+        self.max_jobs = max(1, max_jobs)
+        self.poll_seconds = poll_seconds
+        self.stale_seconds = stale_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.worker_id = f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}"
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._wake = asyncio.Event()
+        # 작업별 대기 중인 SSE 연결의 Event (연결마다 따로 두고 대기가 끝나면 제거)
+        self._event_waiters: Dict[str, Set[asyncio.Event]] = {}
+        self._loop_task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    async def start(self) -> None:
+        if self._loop_task is not None:
+            return
+        self._stopping = False
+        self._loop_task = asyncio.create_task(self._run_loop())
+        logger.info(f"작업 큐 워커 시작 ({self.worker_id}, 동시 작업: {self.max_jobs})")
+
+    async def stop(self) -> None:
+        """실행 중인 작업을 중단하고 대기열로 되돌림 (다음 시작 시 이어서 처리)"""
+        self._stopping = True
+        if self._loop_task:
+            self._loop_task.cancel()
+            await asyncio.gather(self._loop_task, return_exceptions=True)
+            self._loop_task = None
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info("작업 큐 워커 종료")
+
+    def notify(self, job_id: Optional[str] = None) -> None:
+        """
+        새 작업이 생겼음을 알림 (다음 조회 주기를 기다리지 않음)
+
+        job_id를 주면 그 작업의 이벤트를 기다리는 SSE 스트림도 깨움 (행 저장 등 작업 정보가 바뀜)
+        """
+        self._wake.set()
+        if job_id is not None:
+            self._publish(job_id)
+
+    def cancel_local(self, job_id: str) -> None:
+        """이 프로세스에서 실행 중인 작업이면 바로 중단"""
+        task = self._tasks.get(job_id)
+        if task:
+            task.cancel()
+
+    async def wait_for_event(self, job_id: str, timeout: float) -> bool:
+        """job_id 작업의 새 이벤트를 최대 timeout초 대기 (이 프로세스에서 실행 중일 때만 즉시 깨어남)"""
+        waiter = asyncio.Event()
+        waiters = self._event_waiters.setdefault(job_id, set())
+        waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            waiters.discard(waiter)
+            if not waiters and self._event_waiters.get(job_id) is waiters:
+                del self._event_waiters[job_id]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "worker_id": self.worker_id,
+            "running_jobs": list(self._tasks.keys()),
+            "max_jobs": self.max_jobs,
+        }
+
+    async def _run_loop(self) -> None:
+        while True:
+            try:
+                while len(self._tasks) < self.max_jobs:
+                    job = await self._claim()
+                    if job is None:
+                        break
+                    task = asyncio.create_task(self._run_job(job))
+                    self._tasks[job["_id"]] = task
+                    task.add_done_callback(lambda _, job_id=job["_id"]: self._on_done(job_id))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"작업 큐 조회 실패: {e}")
+
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def _on_done(self, job_id: str) -> None:
+        self._tasks.pop(job_id, None)
+        # 대기 중인 연결을 깨워 종료 상태를 확인하게 함 (Event는 각 연결이 대기를 마치며 제거)
+        self._publish(job_id)
+        self._wake.set()
+
+    async def _claim(self) -> Optional[Dict[str, Any]]:
+        """대기 중 작업, 자동 재개 시각이 된 작업, 하트비트가 끊긴 실행 중 작업을 가져옴 (오래된 작업부터)"""
+        now = datetime.utcnow()
+        stale_before = now - timedelta(seconds=self.stale_seconds)
+        return await _jobs().find_one_and_update(
+            {
+                "_id": {"$nin": list(self._tasks.keys())},
+                "$or": [
+                    {"status": QUEUED},
+                    {"status": COOLDOWN, "resume_at": {"$lte": now}},
+                    {"status": RUNNING, "heartbeat_at": {"$lt": stale_before}},
+                ],
+            },
+            {
+                "$set": {"status": RUNNING, "worker_id": self.worker_id, "heartbeat_at": now, "started_at": now},
+                "$unset": {"resume_at": "", "download_token": "", "remaining_count": ""},
+            },
+            sort=[("created_at", 1)],
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def _run_job(self, job: Dict[str, Any]) -> None:
+        job_id = job["_id"]
+        runner = _JobRunner(job, self)
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        try:
+            await runner.run()
+        except asyncio.CancelledError:
+            if self._stopping:
+                # 서버 종료: 처리 중이던 행은 pending으로 남아 있으므로 대기열로 되돌림
+                await _jobs().update_one({"_id": job_id, "status": RUNNING}, {"$set": {"status": QUEUED}})
+                logger.info(f"[JOB] 서버 종료로 작업 중단, 대기열로 복귀 {job_id}")
+            else:
+                await runner.finish(CANCELLED)
+                logger.info(f"[JOB] 작업 취소 {job_id}")
+        except Exception as e:
+            logger.exception(f"[JOB] 작업 실패 {job_id}: {e}")
+            await runner.record({'type': 'error', 'message': str(e)})
+            await runner.finish(FAILED, error=str(e))
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, job_id: str) -> None:
+        """실행 중 표시 갱신 + 다른 프로세스에서 들어온 취소 요청 확인"""
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            job = await _jobs().find_one_and_update(
+                {"_id": job_id, "worker_id": self.worker_id},
+                {"$set": {"heartbeat_at": datetime.utcnow()}},
+                projection={"cancel_requested": 1},
+            )
+            if job is None or job.get("cancel_requested"):
+                self.cancel_local(job_id)
+                return
+
+    def _publish(self, job_id: str) -> None:
+        for waiter in self._event_waiters.get(job_id, ()):
+            waiter.set()
+
+
+class _JobRunner:
+    """작업 하나 실행 (pending 행을 페이지 단위로 읽으며 일괄 스크래핑 → 이벤트/행 상태 기록)"""
+
+    def __init__(self, job: Dict[str, Any], worker: ImportJobWorker):
+        self.job = job
+        self.job_id = job["_id"]
+        self.worker = worker
+        self.seq = job.get("event_seq", 0)
+        self.total = job.get("total", 0)
+
+    def _will_auto_resume(self) -> bool:
+        """이번 실행이 차단되면 자동 재개할지 여부 (최대 횟수 초과 시 blocked로 종료)"""
+        return (
+            self.job.get("auto_resume", False)
+            and self.job.get("auto_resume_attempts", 0) < settings.SCRAPER_JOB_AUTO_RESUME_MAX_ATTEMPTS
+        )
+
+    async def _status_counts(self) -> Dict[str, int]:
+        """행 상태별 수 (재개 시 이미 처리된 수)"""
+        counts = _rows().aggregate([
+            {"$match": {"job_id": self.job_id}},
+            {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+        ])
+        return {doc["_id"]: doc["count"] async for doc in counts}
+
+    async def _pending_rows(self) -> AsyncIterator[IndexedCsvRow]:
+        """
+        pending 행을 index 순서로 ROW_INSERT_BATCH_SIZE개씩 읽어서 전달 (작업 전체 행을 메모리에 올리지 않음)
+
+        행을 저장하는 중(rows_complete=False)이면 다음 행이 저장될 때까지 기다리며 total도 갱신
+        (업로드 요청이 중단되어 stale_seconds 동안 행이 저장되지 않으면 저장된 행까지만 처리)
+        """
+        last_index = -1
+        while True:
+            # 작업 상태를 먼저 읽어야 마지막 배치를 놓치지 않음
+            job = await _jobs().find_one({"_id": self.job_id}, {"total": 1, "rows_complete": 1, "rows_updated_at": 1})
+            if job is None:
+                return
+            self.total = job.get("total", self.total)
+            rows_complete = job.get("rows_complete", True)
+            if not rows_complete and job["rows_updated_at"] < datetime.utcnow() - timedelta(seconds=self.worker.stale_seconds):
+                logger.warning(f"[JOB] 행 저장이 중단된 작업 {self.job_id} - 저장된 {self.total}개 행까지만 처리")
+                rows_complete = True
+
+            page = await _rows().find(
+                {"job_id": self.job_id, "status": ROW_PENDING, "index": {"$gt": last_index}},
+                {"index": 1, "url": 1, "extra": 1, "original_row": 1},
+            ).sort("index", 1).limit(ROW_INSERT_BATCH_SIZE).to_list(length=ROW_INSERT_BATCH_SIZE)
+            for row in page:
+                last_index = row["index"]
+                yield row["index"], (row["url"], row.get("extra") or {}, row.get("original_row") or {})
+
+            if len(page) < ROW_INSERT_BATCH_SIZE:
+                if rows_complete:
+                    return
+                if not page:
+                    await _wait_for_event(self.worker, self.job_id, timeout=ROW_WAIT_SECONDS)
+
+    async def run(self) -> None:
+        counts = await self._status_counts()
+        done_success = counts.get(ROW_SUCCESS, 0)
+        done_skipped = counts.get(ROW_SKIPPED, 0)
+        done_failed = counts.get(ROW_FALLBACK, 0) + counts.get(ROW_FAILED, 0)
+
+        logger.info(f"[JOB] 작업 실행 {self.job_id} - 처리할 행: {counts.get(ROW_PENDING, 0)}/{self.total}개")
+
+        # 요청 범위 밖에서 실행되므로 전용 DB 세션 사용
+        db = SessionLocal()
+        auto_resume = self._will_auto_resume()
+        try:
+            blocked_event: Optional[Dict[str, Any]] = None
+            async for event in bulk_scrape_events(
+                self._pending_rows(), lambda: self.total,
+                self.job["collection_id"], self.job.get("mapping") or {}, self.job.get("ignore_unmapped", False), db,
+                workers=self.job.get("workers"),
+                force_refresh=self.job.get("force_refresh", False),
+                start_success=done_success,
+                start_failed=done_failed,
+                # 중복 처리 방식이 없는 작업(이전 버전)은 기존처럼 모두 등록
+                on_duplicate=self.job.get("on_duplicate", dedup.INSERT),
+                start_skipped=done_skipped,
+            ):
+                if event['type'] == 'start':
+                    event['job_id'] = self.job_id
+                await self._update_row(event)
+                if event['type'] == 'blocked':
+                    blocked_event = event
+                    # 자동 재개하더라도 남은 CSV는 대체 수단으로 계속 제공
+                    await _jobs().update_one(
+                        {"_id": self.job_id},
+                        {"$set": {
+                            "download_token": event['download_token'],
+                            "remaining_count": event['remaining_count'],
+                        }},
+                    )
+                if event['type'] == 'complete' and event.get('blocked') and auto_resume:
+                    continue  # 작업이 끝나지 않았으므로 cooldown 이벤트로 대체
+                await self.record(event)
+        finally:
+            db.close()
+
+        if blocked_event is None:
+            await self.finish(COMPLETED)
+        elif auto_resume:
+            await self.cooldown(blocked_event)
+        else:
+            await self.finish(BLOCKED)
+
+    async def _update_row(self, event: Dict[str, Any]) -> None:
+        """progress/error_item/skipped 이벤트로 행 상태 기록 (재개 시 다시 처리하지 않도록)"""
+        if event['type'] not in ('progress', 'error_item', 'skipped') or 'index' not in event:
+            return
+        item = event.get('item')
+        if event['type'] == 'progress':
+            status = ROW_SUCCESS
+        elif event['type'] == 'skipped':
+            status = ROW_SKIPPED
+        else:
+            status = ROW_FALLBACK if item else ROW_FAILED
+        update = {"status": status, "updated_at": datetime.utcnow()}
+        if item:
+            update["item_id"] = item['id']
+        if event.get('tier'):
+            update["tier"] = event['tier']
+        if event.get('message'):
+            update["error"] = event['message']
+        await _rows().update_one({"job_id": self.job_id, "index": event['index'] - 1}, {"$set": update})
+
+    async def record(self, event: Dict[str, Any]) -> None:
+        """이벤트 저장 (순번 부여) 및 작업 진행 수 갱신"""
+        self.seq += 1
+        now = datetime.utcnow()
+        await _events().insert_one({"job_id": self.job_id, "seq": self.seq, "event": event, "created_at": now})
+
+        update: Dict[str, Any] = {"event_seq": self.seq, "heartbeat_at": now}
+        if 'success' in event:
+            update["success"] = event['success']
+        if 'failed' in event:
+            update["failed"] = event['failed']
+        if 'skipped' in event:
+            update["skipped"] = event['skipped']
+        await _jobs().update_one({"_id": self.job_id}, {"$set": update})
+        self.worker._publish(self.job_id)
+
+    async def cooldown(self, blocked_event: Dict[str, Any]) -> None:
+        """
+        차단된 작업을 대기 상태로 전환 (대기 시간이 지나면 워커가 남은 행부터 다시 실행)
+
+        대기 시간은 SCRAPER_JOB_COOLDOWN_SECONDS부터 자동 재개할 때마다 2배씩 증가
+        (최대 SCRAPER_JOB_COOLDOWN_MAX_SECONDS)
+        """
+        attempt = self.job.get("auto_resume_attempts", 0) + 1
+        delay = min(
+            settings.SCRAPER_JOB_COOLDOWN_SECONDS * (2 ** (attempt - 1)),
+            settings.SCRAPER_JOB_COOLDOWN_MAX_SECONDS,
+        )
+        resume_at = datetime.utcnow() + timedelta(seconds=delay)
+
+        await self.record({
+            'type': 'cooldown',
+            'message': f"{int(delay)}초 후 남은 {blocked_event['remaining_count']}개 URL을 자동으로 이어서 처리합니다. "
+                       f"({attempt}/{settings.SCRAPER_JOB_AUTO_RESUME_MAX_ATTEMPTS}회)",
+            'attempt': attempt,
+            'max_attempts': settings.SCRAPER_JOB_AUTO_RESUME_MAX_ATTEMPTS,
+            'delay_seconds': delay,
+            'resume_at': resume_at.isoformat() + 'Z',
+            'total': blocked_event['total'],
+            'success': blocked_event['success'],
+            'failed': blocked_event['failed'],
+            'skipped': blocked_event['skipped'],
+            'remaining_count': blocked_event['remaining_count'],
+            'download_token': blocked_event['download_token'],
+        })
+        await _jobs().update_one(
+            {"_id": self.job_id},
+            {"$set": {"status": COOLDOWN, "resume_at": resume_at, "auto_resume_attempts": attempt}},
+        )
+        self.worker._publish(self.job_id)
+        logger.info(f"[JOB] 차단으로 대기 {self.job_id} - {int(delay)}초 후 재개 ({attempt}회)")
+
+    async def finish(self, status: str, error: Optional[str] = None) -> None:
+        update: Dict[str, Any] = {"status": status, "finished_at": datetime.utcnow()}
+        if error:
+            update["error"] = error
+        await _jobs().update_one({"_id": self.job_id}, {"$set": update})
+        self.worker._publish(self.job_id)
+        logger.info(f"[JOB] 작업 종료 {self.job_id} - 상태: {status}")
+
+
+# 애플리케이션 공용 작업 큐 워커
+import_worker: Optional[ImportJobWorker] = None
+
+
+def get_import_worker() -> Optional[ImportJobWorker]:
+    """공용 워커 반환 (이 프로세스에서 실행 중이 아니면 None)"""
+    return import_worker
+
+
+async def start_import_worker() -> None:
+    """공용 작업 큐 워커 시작"""
+    global import_worker
+    await ensure_import_job_indexes()
+    import_worker = ImportJobWorker(
+        max_jobs=settings.SCRAPER_JOB_CONCURRENCY,
+        poll_seconds=settings.SCRAPER_JOB_POLL_SECONDS,
+        stale_seconds=settings.SCRAPER_JOB_STALE_SECONDS,
+        heartbeat_seconds=settings.SCRAPER_JOB_HEARTBEAT_SECONDS,
+    )
+    await import_worker.start()
+
+
+async def stop_import_worker() -> None:
+    """공용 작업 큐 워커 종료"""
+    global import_worker
+    if import_worker:
+        await import_worker.stop()
+        import_worker = None
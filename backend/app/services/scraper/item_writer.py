@@ -0,0 +1,97 @@
+"""
+CSV 일괄 등록용 아이템 배치 저장
+준비된 아이템 문서를 모았다가 개수/시간 기준으로 한 번의 insert_many(ordered=False)로 저장
+"""
+import logging
+import time
+from typing import Dict, List, Any, Optional, Tuple
+
+from pymongo.errors import BulkWriteError
+
+from backend.app.db.mongodb import get_database
+from backend.app.services.item.item_service import item_helper
+from backend.app.services.item.count_cache import invalidate_item_counts
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE_KEY_ERROR = 11000
+ORDERED_ABORTED = "앞선 문서 저장 실패로 저장하지 않음"
+
+
+class ItemBatchWriter:
+    """
+    아이템 배치 저장기
+
+    - add(key, document)로 문서를 버퍼에 추가 (key: 결과를 되돌려줄 행 번호 등)
+    - 버퍼가 batch_size개가 되거나 첫 문서 추가 후 flush_seconds가 지나면 flush 대상
+    - flush()는 기본적으로 ordered=False로 저장하여 일부 문서가 실패해도 나머지는 저장되며,
+      insert_many가 문서에 채워 넣은 _id로 다시 조회하지 않고 결과를 반환
+    - ordered=True면 첫 실패 문서에서 저장을 멈추고, 그 뒤 문서는 ORDERED_ABORTED 에러로 반환
+    """
+
+    def __init__(self, mongo_collection_name: str, batch_size: int, flush_seconds: float, ordered: bool = False):
+        self.collection = get_database()[mongo_collection_name]
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = max(0.0, flush_seconds)
+        self.ordered = ordered
+        self._buffer: List[Tuple[Any, Dict[str, Any]]] = []
+        self._first_added_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def add(self, key: Any, document: Dict[str, Any]) -> None:
+        if not self._buffer:
+            self._first_added_at = time.monotonic()
+        self._buffer.append((key, document))
+
+    def time_until_flush(self) -> Optional[float]:
+        """다음 시간 기준 flush까지 남은 초 (버퍼가 비어 있으면 None)"""
+        if not self._buffer:
+            return None
+        return max(0.0, self.flush_seconds - (time.monotonic() - self._first_added_at))
+
+    def should_flush(self) -> bool:
+        if not self._buffer:
+            return False
+        return len(self._buffer) >= self.batch_size or self.time_until_flush() == 0.0
+
+    async def flush(self) -> List[Tuple[Any, Optional[Dict[str, Any]], Optional[str], Optional[int]]]:
+        """
+        버퍼의 문서를 저장
+
+        Returns:
+            추가한 순서대로 (key, 저장된 아이템 또는 None, 에러 메시지 또는 None, 에러 코드 또는 None) 목록
+            (에러 코드 DUPLICATE_KEY_ERROR: unique 인덱스 중복)
+        """
+        if not self._buffer:
+            return []
+
+        batch = self._buffer
+        self._buffer = []
+        self._first_added_at = None
+
+        errors: Dict[int, Tuple[str, Optional[int]]] = {}
+        try:
+            await self.collection.insert_many([document for _, document in batch], ordered=self.ordered)
+        except BulkWriteError as e:
+            for write_error in e.details.get('writeErrors', []):
+                errors[write_error['index']] = (write_error.get('errmsg', 'insert 실패'), write_error.get('code'))
+            if self.ordered and errors:
+                # ordered insert는 첫 실패 이후 문서를 저장하지 않음
+                errors.update({i: (ORDERED_ABORTED, None) for i in range(min(errors) + 1, len(batch))})
+        except Exception as e:
+            # 연결 오류 등: 배치 전체를 실패로 보고
+            logger.warning(f"[BATCH] 아이템 {len(batch)}개 저장 실패: {e}")
+            errors = {i: (str(e), None) for i in range(len(batch))}
+        invalidate_item_counts(self.collection.name)
+
+        if errors:
+            logger.warning(f"[BATCH] 아이템 {len(batch)}개 중 {len(errors)}개 저장 실패")
+        else:
+            logger.debug(f"[BATCH] 아이템 {len(batch)}개 저장")
+
+        return [
+            (key, None, *errors[i]) if i in errors else (key, item_helper(document), None, None)
+            for i, (key, document) in enumerate(batch)
+        ]
@@ -0,0 +1,147 @@
+"""
+호스트별 요청 속도 제한 (Token bucket + 적응형 backoff)
+차단 의심 신호가 나오면 속도를 줄이고 잠시 멈추며, 정상 응답이 이어지면 다시 속도를 올림
+"""
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class _HostBucket:
+    """호스트 하나의 token bucket 상태"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate  # 요청/초
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.consecutive_blocks = 0
+        self.lock = asyncio.Lock()  # 대기 순서 보장 (FIFO)
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class AdaptiveRateLimiter:
+    """
+    호스트별 적응형 속도 제한기 (AIMD)
+
+    - 성공: 속도를 increase만큼 증가 (최대 max_rate)
+    - 차단 신호: 속도를 decrease 배율로 감소 (최소 min_rate) + backoff 시간 동안 정지
+      (연속 차단 신호마다 backoff 2배, 최대 backoff_max)
+    """
+
+    def __init__(
+        self,
+        initial_rate: float,
+        min_rate: float,
+        max_rate: float,
+        burst: int,
+        increase: float,
+        decrease: float,
+        backoff_base: float,
+        backoff_max: float,
+    ):
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = max(1, burst)
+        self.increase = increase
+        self.decrease = decrease
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._buckets: Dict[str, _HostBucket] = {}
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlparse(url).hostname or ''
+
+    def _bucket(self, url: str) -> _HostBucket:
+        host = self.host_of(url)
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = _HostBucket(self.initial_rate, self.burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    async def acquire(self, url: str) -> None:
+        """요청 전 호출: 해당 호스트의 토큰이 생길 때까지 대기"""
+        bucket = self._bucket(url)
+        async with bucket.lock:
+            while True:
+                now = time.monotonic()
+                if now < bucket.paused_until:
+                    await asyncio.sleep(bucket.paused_until - now)
+                    continue
+                bucket.refill(now)
+                if bucket.tokens >= 1:
+                    bucket.tokens -= 1
+                    return
+                await asyncio.sleep((1 - bucket.tokens) / bucket.rate)
+
+    def record_success(self, url: str) -> None:
+        """정상 응답: 속도 조금씩 증가"""
+        bucket = self._bucket(url)
+        bucket.consecutive_blocks = 0
+        bucket.rate = min(self.max_rate, bucket.rate + self.increase)
+
+    def record_soft_block(self, url: str, reason: str = "") -> None:
+        """차단 의심 신호: 속도 감소 + 일시 정지"""
+        bucket = self._bucket(url)
+        now = time.monotonic()
+        bucket.consecutive_blocks += 1
+        bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+        bucket.refill(now)
+        bucket.tokens = 0.0
+        pause = min(self.backoff_max, self.backoff_base * (2 ** (bucket.consecutive_blocks - 1)))
+        bucket.paused_until = max(bucket.paused_until, now + pause)
+        logger.info(
+            f"[RATE] {self.host_of(url)} 차단 신호 ({reason}) - "
+            f"속도 {bucket.rate:.2f}/s, {pause:.0f}초 정지 (연속 {bucket.consecutive_blocks}회)"
+        )
+
+    def current_rate(self, url: str) -> float:
+        """호스트의 현재 허용 속도 (요청/초)"""
+        bucket = self._buckets.get(self.host_of(url))
+        return round(bucket.rate if bucket else self.initial_rate, 3)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """호스트별 현재 상태 (모니터링용)"""
+        now = time.monotonic()
+        return {
+            host: {
+                'rate': round(bucket.rate, 3),
+                'paused_seconds': round(max(0.0, bucket.paused_until - now), 1),
+                'consecutive_blocks': bucket.consecutive_blocks,
+            }
+            for host, bucket in self._buckets.items()
+        }
+
+
+# 애플리케이션 공용 속도 제한기 (여러 요청/일괄 등록이 같은 호스트 상태를 공유)
+_rate_limiter: Optional[AdaptiveRateLimiter] = None
+
+
+def get_rate_limiter() -> AdaptiveRateLimiter:
+    """공용 속도 제한기 반환 (최초 호출 시 설정값으로 생성)"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = AdaptiveRateLimiter(
+            initial_rate=settings.SCRAPER_RATE_LIMIT_INITIAL,
+            min_rate=settings.SCRAPER_RATE_LIMIT_MIN,
+            max_rate=settings.SCRAPER_RATE_LIMIT_MAX,
+            burst=settings.SCRAPER_RATE_LIMIT_BURST,
+            increase=settings.SCRAPER_RATE_LIMIT_INCREASE,
+            decrease=settings.SCRAPER_RATE_LIMIT_DECREASE,
+            backoff_base=settings.SCRAPER_BACKOFF_BASE_SECONDS,
+            backoff_max=settings.SCRAPER_BACKOFF_MAX_SECONDS,
+        )
+    return _rate_limiter
@@ -0,0 +1,130 @@
+"""
+페이지 로드 중 불필요한 요청 차단
+메타 태그와 일부 셀렉터만 읽으므로 이미지/미디어/폰트와 외부 추적 스크립트는 받지 않음
+"""
+import logging
+from typing import Dict, Iterable, Optional, Tuple, FrozenSet
+from urllib.parse import urlparse
+from playwright.async_api import BrowserContext, Route
+
+from backend.app.core.config import settings
+from backend.app.services.scraper.site_profiles import get_site_profile
+
+logger = logging.getLogger(__name__)
+
+# 기본 차단 리소스 타입 (Playwright resource_type)
+DEFAULT_BLOCKED_RESOURCE_TYPES: FrozenSet[str] = frozenset({'image', 'media', 'font'})
+
+# 기본 차단 호스트 (분석/광고/추적, 하위 도메인 포함)
+DEFAULT_BLOCKED_HOSTS: Tuple[str, ...] = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'googlesyndication.com',
+    'googleadservices.com',
+    'doubleclick.net',
+    'facebook.net',
+    'connect.facebook.com',
+    'criteo.com',
+    'criteo.net',
+    'adnxs.com',
+    'hotjar.com',
+    'clarity.ms',
+    'wcs.naver.net',
+    'wcs.naver.com',
+    'mobon.net',
+    'dable.io',
+    'adfit.kakao.com',
+    'channel.io',
+)
+
+
+def _host_matches(host: str, patterns: Iterable[str]) -> bool:
+    """host가 patterns 중 하나와 같거나 그 하위 도메인인지"""
+    return any(host == pattern or host.endswith('.' + pattern) for pattern in patterns)
+
+
+class ResourceRules:
+    """요청 차단 규칙 (리소스 타입 + 호스트 deny/allow 목록)"""
+
+    def __init__(
+        self,
+        blocked_types: Iterable[str] = DEFAULT_BLOCKED_RESOURCE_TYPES,
+        blocked_hosts: Iterable[str] = DEFAULT_BLOCKED_HOSTS,
+        allowed_hosts: Iterable[str] = (),
+    ):
+        self.blocked_types = frozenset(blocked_types)
+        self.blocked_hosts = tuple(blocked_hosts)
+        self.allowed_hosts = tuple(allowed_hosts)
+
+    def with_overrides(
+        self,
+        allow_types: Iterable[str] = (),
+        block_types: Iterable[str] = (),
+        allow_hosts: Iterable[str] = (),
+        block_hosts: Iterable[str] = (),
+    ) -> 'ResourceRules':
+        """
+        기본 규칙에서 일부만 바꾼 규칙 생성 (사이트 프로필용)
+
+        예: 파싱에 이미지 응답이 필요한 사이트 → with_overrides(allow_types=['image'])
+        """
+        return ResourceRules(
+            blocked_types=(self.blocked_types | frozenset(block_types)) - frozenset(allow_types),
+            blocked_hosts=self.blocked_hosts + tuple(block_hosts),
+            allowed_hosts=self.allowed_hosts + tuple(allow_hosts),
+        )
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """요청을 차단할지 판단 (allow 목록이 deny 목록보다 우선)"""
+        host = urlparse(url).hostname or ''
+        if self.allowed_hosts and _host_matches(host, self.allowed_hosts):
+            return False
+        if resource_type in self.blocked_types:
+            return True
+        return _host_matches(host, self.blocked_hosts)
+
+
+DEFAULT_RESOURCE_RULES = ResourceRules()
+
+# 프로필별 규칙 캐시 (프로필 이름 → 규칙)
+_profile_rules: Dict[str, ResourceRules] = {}
+
+
+def get_resource_rules(url: str) -> Optional[ResourceRules]:
+    """
+    URL에 적용할 차단 규칙 (SCRAPER_BLOCK_RESOURCES=False면 None)
+
+    사이트 프로필의 resource_overrides가 있으면 기본 규칙에 적용
+    (예: 파싱에 이미지 응답이 필요한 사이트 → {'allow_types': ['image']})
+    """
+    if not settings.SCRAPER_BLOCK_RESOURCES:
+        return None
+    profile = get_site_profile(url)
+    if profile is None or not profile.resource_overrides:
+        return DEFAULT_RESOURCE_RULES
+    rules = _profile_rules.get(profile.name)
+    if rules is None:
+        rules = DEFAULT_RESOURCE_RULES.with_overrides(**profile.resource_overrides)
+        _profile_rules[profile.name] = rules
+    return rules
+
+
+async def install_request_filter(context: BrowserContext, rules: Optional[ResourceRules]) -> None:
+    """
+    BrowserContext에 요청 가로채기 설치
+
+    Args:
+        context: 페이지를 열 BrowserContext
+        rules: 차단 규칙 (None이면 설치하지 않음)
+    """
+    if rules is None:
+        return
+
+    async def handle_route(route: Route) -> None:
+        request = route.request
+        if rules.should_block(request.resource_type, request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await context.route("**/*", handle_route)
@@ -0,0 +1,210 @@
+"""
+스크래핑 결과 캐시 (MongoDB)
+정규화한 URL(또는 사이트 상품 ID) + 파서 버전을 키로 추출 결과를 저장하여 재시도/중복 스크래핑 시 네트워크 요청 생략
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from backend.app.core.config import settings
+from backend.app.db.mongodb import get_mongodb_client, get_database
+from backend.app.services.scraper.site_parsers import PARSER_VERSION
+from backend.app.services.scraper.site_profiles import get_site_profile
+
+logger = logging.getLogger(__name__)
+
+CACHE_COLLECTION = "scrape_cache"
+
+# 추적/광고용 쿼리 파라미터 (캐시 키에서 제거)
+TRACKING_PARAMS = frozenset({
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid', 'ref', 'ref_',
+    # 네이버 검색광고
+    'n_media', 'n_query', 'n_rank', 'n_ad_group', 'n_ad', 'n_keyword', 'n_keyword_id', 'n_campaign_type',
+})
+TRACKING_PREFIXES = ('utm_',)
+
+# 몇 번 저장할 때마다 크기 제한을 확인할지
+EVICTION_CHECK_INTERVAL = 100
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    캐시 키용 URL 정규화
+
+    - scheme/host 소문자, fragment 제거, 끝의 '/' 제거
+    - 추적용 쿼리 파라미터 제거 후 나머지는 정렬
+    """
+    parts = urlsplit(url.strip())
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query.sort()
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ''))
+
+
+def source_key(url: str) -> str:
+    """
+    URL이 가리키는 대상의 키 (파서 버전 제외, 중복 아이템 감지에도 사용)
+
+    - 상품 ID 패턴이 있는 사이트: "kyobobook:S000001713046" (URL 형태가 달라도 같은 상품이면 같은 키)
+    - 그 외: 정규화한 URL
+    """
+    profile = get_site_profile(url)
+    if profile is not None:
+        product_id = profile.product_id(url)
+        if product_id:
+            return f"{profile.name}:{product_id}"
+    return canonicalize_url(url)
+
+
+def cache_key(url: str) -> str:
+    """
+    캐시 키 생성 (source_key + 파서 버전)
+
+    - 상품 ID 패턴이 있는 사이트: "kyobobook:S000001713046@1.1"
+    - 그 외: "https://example.com/item?id=1@1"
+    """
+    profile = get_site_profile(url)
+    if profile is not None:
+        return f"{source_key(url)}@{PARSER_VERSION}.{profile.version}"
+    return f"{source_key(url)}@{PARSER_VERSION}"
+
+
+class ScrapeCache:
+    """
+    스크래핑 결과 캐시
+
+    - TTL 인덱스(expires_at)로 만료된 항목 자동 삭제
+    - SCRAPER_CACHE_MAX_ENTRIES를 넘으면 오래된 항목부터 삭제
+    - MongoDB 연결이 없거나(스크립트 실행 등) 캐시 오류가 나도 스크래핑은 계속 진행
+    """
+
+    def __init__(self, ttl_hours: int, max_entries: int, enabled: bool = True):
+        self.ttl = timedelta(hours=ttl_hours)
+        self.max_entries = max(1, max_entries)
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+
+    def _collection(self):
+        if not self.enabled or get_mongodb_client() is None:
+            return None
+        return get_database()[CACHE_COLLECTION]
+
+    async def ensure_indexes(self) -> None:
+        """TTL 인덱스 및 eviction용 인덱스 생성 (앱 시작 시 호출)"""
+        collection = self._collection()
+        if collection is None:
+            return
+        try:
+            await collection.create_index("expires_at", expireAfterSeconds=0)
+            await collection.create_index("created_at")
+        except Exception as e:
+            logger.warning(f"스크래핑 캐시 인덱스 생성 실패: {e}")
+
+    async def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 메타데이터 조회
+
+        Returns:
+            메타데이터 (source_url 제외), 없거나 만료됐으면 None
+        """
+        collection = self._collection()
+        if collection is None:
+            return None
+        try:
+            doc = await collection.find_one({"_id": cache_key(url)})
+        except Exception as e:
+            logger.warning(f"스크래핑 캐시 조회 실패: {e}")
+            return None
+
+        # TTL 인덱스 삭제 주기(약 60초) 사이에 만료된 항목 제외
+        if doc is None or doc["expires_at"] <= datetime.utcnow():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return doc["metadata"]
+
+    async def set(self, url: str, metadata: Dict[str, Any], tier: str) -> None:
+        """추출 결과 저장 (source_url은 요청마다 다르므로 제외)"""
+        collection = self._collection()
+        if collection is None:
+            return
+        now = datetime.utcnow()
+        stored = {key: value for key, value in metadata.items() if key != 'source_url'}
+        try:
+            await collection.replace_one(
+                {"_id": cache_key(url)},
+                {
+                    "url": canonicalize_url(url),
+                    "metadata": stored,
+                    "isbn": stored.get("isbn"),
+                    "tier": tier,
+                    "created_at": now,
+                    "expires_at": now + self.ttl,
+                },
+                upsert=True,
+            )
+        except Exception as e:
+            logger.warning(f"스크래핑 캐시 저장 실패: {e}")
+            return
+
+        self._writes += 1
+        if self._writes % EVICTION_CHECK_INTERVAL == 0:
+            await self._evict(collection)
+
+    async def invalidate(self, url: str) -> None:
+        """URL의 캐시 항목 삭제"""
+        collection = self._collection()
+        if collection is None:
+            return
+        try:
+            await collection.delete_one({"_id": cache_key(url)})
+        except Exception as e:
+            logger.warning(f"스크래핑 캐시 삭제 실패: {e}")
+
+    async def _evict(self, collection) -> None:
+        """최대 항목 수를 넘으면 오래된 항목부터 삭제"""
+        try:
+            count = await collection.estimated_document_count()
+            excess = count - self.max_entries
+            if excess <= 0:
+                return
+            cursor = collection.find({}, {"_id": 1}).sort("created_at", 1).limit(excess)
+            old_ids = [doc["_id"] async for doc in cursor]
+            if old_ids:
+                result = await collection.delete_many({"_id": {"$in": old_ids}})
+                logger.info(f"스크래핑 캐시 정리: {result.deleted_count}개 삭제 (최대 {self.max_entries}개)")
+        except Exception as e:
+            logger.warning(f"스크래핑 캐시 정리 실패: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중률 (프로세스 시작 이후)"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+        }
+
+
+# 애플리케이션 공용 스크래핑 캐시
+_scrape_cache: Optional[ScrapeCache] = None
+
+
+def get_scrape_cache() -> ScrapeCache:
+    """공용 스크래핑 캐시 반환 (최초 호출 시 설정값으로 생성)"""
+    global _scrape_cache
+    if _scrape_cache is None:
+        _scrape_cache = ScrapeCache(
+            ttl_hours=settings.SCRAPER_CACHE_TTL_HOURS,
+            max_entries=settings.SCRAPER_CACHE_MAX_ENTRIES,
+            enabled=settings.SCRAPER_CACHE_ENABLED,
+        )
+    return _scrape_cache
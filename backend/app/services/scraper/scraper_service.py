@@ -6,14 +6,16 @@ from sqlalchemy import select
 from backend.app.models.collection import Collection
 from backend.app.schemas.item import ItemCreate
 from backend.app.services.item.item_service import create_item as create_item_service
-from backend.app.services.scraper.web_scraper import scrape_url, apply_field_mapping
+from backend.app.services.scraper.web_scraper import scrape_url
+from backend.app.services.scraper.field_mapper import compiled_mapping_for
 
 
 async def scrape_url_with_mapping(
     url: str,
     collection_id: int,
     apply_mapping: bool,
-    db: Session
+    db: Session,
+    force_refresh: bool = False
 ) -> Dict[str, Any]:
     """
     URL 스크래핑 후 매핑 적용
@@ -23,12 +25,13 @@ async def scrape_url_with_mapping(
         collection_id: 컬렉션 ID
         apply_mapping: 매핑 적용 여부
         db: DB 세션
+        force_refresh: True면 스크래핑 캐시를 무시하고 다시 가져옴
 
     Returns:
         스크래핑 및 매핑된 메타데이터
     """
-    # URL 스크래핑
-    metadata = await scrape_url(url)
+    # URL 스크래핑 (캐시 우선)
+    metadata = await scrape_url(url, force_refresh=force_refresh)
 
     # 매핑 적용
     if apply_mapping:
@@ -36,15 +39,9 @@ async def scrape_url_with_mapping(
         result = db.execute(stmt)
         collection = result.scalar_one_or_none()
 
-        if collection and collection.field_mapping:
-            mapping_config = collection.field_mapping
-            if isinstance(mapping_config, dict):
-                mapping = mapping_config.get("mapping", {})
-                ignore_unmapped = mapping_config.get("ignore_unmapped", False)
-                metadata = apply_field_mapping(metadata, mapping, ignore_unmapped)
-            else:
-                # 레거시 형식
-                metadata = apply_field_mapping(metadata, mapping_config)
+        if collection:
+            # 컬렉션 매핑 설정별로 컴파일된 매핑 재사용 (field_definitions의 number/date 값 변환 포함)
+            metadata = compiled_mapping_for(collection).apply(metadata)
 
     return metadata
 
@@ -52,7 +49,8 @@ async def scrape_url_with_mapping(
 async def scrape_and_create(
     url: str,
     collection_id: int,
-    db: Session
+    db: Session,
+    force_refresh: bool = False
 ) -> Dict[str, Any]:
     """
     URL 스크래핑 후 아이템 생성
@@ -61,12 +59,13 @@ async def scrape_and_create(
         url: 스크래핑할 URL
         collection_id: 컬렉션 ID
         db: DB 세션
+        force_refresh: True면 스크래핑 캐시를 무시하고 다시 가져옴
 
     Returns:
         생성된 아이템 정보
     """
-    # URL 스크래핑
-    metadata = await scrape_url(url)
+    # URL 스크래핑 (캐시 우선)
+    metadata = await scrape_url(url, force_refresh=force_refresh)
 
     # 아이템 생성
     item_data = ItemCreate(
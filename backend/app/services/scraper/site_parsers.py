@@ -0,0 +1,137 @@
+"""
+HTML 파싱 (순수 함수)
+한 번 캡처한 HTML에서 공통 메타 태그와 사이트 프로필(site_profiles.py) 규칙으로 정보를 추출 (브라우저 IPC 없음)
+"""
+import json
+import logging
+from typing import Dict, Any
+from bs4 import BeautifulSoup
+
+from backend.app.services.scraper.site_profiles import get_site_profile
+
+logger = logging.getLogger(__name__)
+
+# 공통 추출 로직 버전 (extract_common_metadata를 바꾸면 올려서 스크래핑 캐시 무효화)
+PARSER_VERSION = 1
+
+
+def make_soup(html: str) -> BeautifulSoup:
+    """lxml 파서로 DOM 생성 (html.parser보다 수 배 빠름)"""
+    return BeautifulSoup(html, 'lxml')
+
+
+def extract_common_metadata(soup: BeautifulSoup) -> Dict[str, Any]:
+    """Open Graph, Twitter Card, JSON-LD, <title>에서 메타데이터 추출 (사이트 무관)"""
+    metadata = {}
+
+    # Open Graph 메타 태그
+    og_tags = {
+        'og:title': 'title',
+        'og:description': 'description',
+        'og:image': 'image',
+        'og:type': 'type',
+    }
+
+    for og_key, meta_key in og_tags.items():
+        tag = soup.find('meta', property=og_key)
+        if tag and tag.get('content'):
+            metadata[meta_key] = tag['content']
+
+    # Twitter Card 메타 태그
+    twitter_tags = {
+        'twitter:title': 'title',
+        'twitter:description': 'description',
+        'twitter:image': 'image',
+    }
+
+    for twitter_key, meta_key in twitter_tags.items():
+        if meta_key not in metadata:
+            tag = soup.find('meta', attrs={'name': twitter_key})
+            if tag and tag.get('content'):
+                metadata[meta_key] = tag['content']
+
+    # 일반 메타 태그
+    if 'description' not in metadata:
+        desc_tag = soup.find('meta', attrs={'name': 'description'})
+        if desc_tag and desc_tag.get('content'):
+            metadata['description'] = desc_tag['content']
+
+    # 페이지 제목 (fallback)
+    if 'title' not in metadata:
+        title_tag = soup.find('title')
+        if title_tag:
+            metadata['title'] = title_tag.get_text().strip()
+
+    # JSON-LD 구조화된 데이터
+    json_ld_scripts = soup.find_all('script', type='application/ld+json')
+    for script in json_ld_scripts:
+        try:
+            data = json.loads(script.string)
+
+            if isinstance(data, dict):
+                # Book schema
+                if data.get('@type') == 'Book':
+                    metadata['title'] = data.get('name', metadata.get('title'))
+
+                    # author 처리 (dict 또는 string 가능)
+                    author_data = data.get('author')
+                    if isinstance(author_data, dict):
+                        metadata['author'] = author_data.get('name')
+                    elif isinstance(author_data, str):
+                        metadata['author'] = author_data
+
+                    # publisher 처리 (dict 또는 string 가능)
+                    publisher_data = data.get('publisher')
+                    if isinstance(publisher_data, dict):
+                        metadata['publisher'] = publisher_data.get('name')
+                    elif isinstance(publisher_data, str):
+                        metadata['publisher'] = publisher_data
+
+                    metadata['isbn'] = data.get('isbn')
+                    metadata['date_published'] = data.get('datePublished')
+
+                    # 가격 정보
+                    if 'offers' in data:
+                        offers = data['offers']
+                        if isinstance(offers, dict):
+                            metadata['price'] = offers.get('price')
+
+                # Product schema
+                elif data.get('@type') == 'Product':
+                    metadata['title'] = data.get('name', metadata.get('title'))
+                    metadata['description'] = data.get('description', metadata.get('description'))
+
+                    if 'offers' in data:
+                        offers = data['offers']
+                        if isinstance(offers, dict):
+                            metadata['price'] = offers.get('price')
+
+        except Exception:
+            continue
+
+    return metadata
+
+
+def parse_html(url: str, html: str) -> tuple[Dict[str, Any], bool]:
+    """
+    HTML 스냅샷에서 메타데이터 추출 (순수 함수, 스레드에서 실행 가능)
+
+    Args:
+        url: 페이지 URL (리다이렉트 후 최종 URL, 사이트 판별용)
+        html: 페이지 HTML
+
+    Returns:
+        (metadata, complete) 튜플
+        - complete: 사이트 프로필의 필수 필드를 모두 추출했는지
+          (프로필이 없는 사이트는 True - 공통 메타 태그만으로 충분)
+    """
+    soup = make_soup(html)
+    metadata = extract_common_metadata(soup)
+
+    profile = get_site_profile(url)
+    if profile is None:
+        return metadata, True
+
+    site_metadata = profile.extract(soup, html, metadata)
+    metadata.update(site_metadata)
+    return metadata, profile.is_complete(site_metadata)
@@ -0,0 +1,349 @@
+"""
+사이트 프로필 레지스트리
+사이트별 추출 규칙(셀렉터, 정규식, 후처리, JS 필요 여부, 요청 차단 규칙)을 선언형으로 정의하고
+모듈 로드 시 한 번만 컴파일하여 호스트 → 프로필을 dict 조회로 찾음
+"""
+import html as html_lib
+import logging
+import re
+from typing import Dict, Any, List, Optional, Callable, Iterable
+from urllib.parse import urlparse
+import soupsieve
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+_KOREAN_DATE_RE = re.compile(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일')
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _korean_date(value: str) -> str:
+    """"2021년 10월 05일" → "2021-10-05" (형식이 다르면 원문 반환)"""
+    date_match = _KOREAN_DATE_RE.search(value)
+    if date_match:
+        year, month, day = date_match.groups()
+        return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+    return value
+
+
+def _digits_int(value: str) -> Optional[int]:
+    """"4,950원" → 4950"""
+    digits = _NON_DIGIT_RE.sub('', value)
+    return int(digits) if digits else None
+
+
+# 후처리 함수 (프로필에서는 이름으로 참조)
+POST_PROCESSORS: Dict[str, Callable[[Any], Any]] = {
+    'strip': lambda value: value.strip(),
+    'collapse_ws': lambda value: _WHITESPACE_RE.sub(' ', value).strip(),
+    'unescape': html_lib.unescape,
+    'korean_date': _korean_date,
+    'digits_int': _digits_int,
+    'int': int,
+}
+
+
+class FieldRule:
+    """
+    필드 하나의 추출 규칙 (컴파일된 상태)
+
+    같은 key의 규칙이 여러 개면 정의 순서대로 시도하고 처음 값을 얻은 규칙을 사용
+    """
+
+    def __init__(
+        self,
+        key: str,
+        selector: Optional[str] = None,
+        source: str = 'text',
+        attr: Optional[str] = None,
+        index: int = 0,
+        child: Optional[str] = None,
+        contains: Optional[str] = None,
+        regex: Optional[str] = None,
+        many: bool = False,
+        exclude: Optional[str] = None,
+        join: str = ', ',
+        min_length: int = 0,
+        post: Iterable[str] = ('strip',),
+        aliases: Iterable[str] = (),
+    ):
+        """
+        Args:
+            key: 메타데이터 키
+            selector: CSS 셀렉터 (source='text'일 때)
+            source: 'text' (셀렉터 요소 텍스트) | 'html' (전체 HTML) | 'meta:<key>' (공통 메타데이터 값)
+            attr: 텍스트 대신 읽을 속성
+            index: 셀렉터 결과 중 사용할 위치
+            child: 선택한 요소 안에서 다시 찾을 셀렉터
+            contains: 이 문자열을 포함하는 요소만 사용
+            regex: 값에 적용할 정규식 (그룹이 있으면 첫 그룹)
+            many: 모든 요소 값을 join으로 연결
+            exclude: many일 때 이 문자열을 포함하는 값 제외
+            min_length: 이보다 짧은 값은 없는 것으로 간주
+            post: 후처리 함수 이름 목록 (POST_PROCESSORS)
+            aliases: 같은 값을 함께 저장할 키 (하위 호환성)
+        """
+        if source == 'text' and not selector:
+            raise ValueError(f"'{key}' 규칙에 selector가 필요합니다.")
+        unknown = [name for name in post if name not in POST_PROCESSORS]
+        if unknown:
+            raise ValueError(f"'{key}' 규칙의 알 수 없는 후처리: {unknown}")
+
+        self.key = key
+        self.source = source
+        self.selector = soupsieve.compile(selector) if selector else None
+        self.attr = attr
+        self.index = index
+        self.child = soupsieve.compile(child) if child else None
+        self.contains = contains
+        self.regex = re.compile(regex) if regex else None
+        self.many = many
+        self.exclude = exclude
+        self.join = join
+        self.min_length = min_length
+        self.post = [POST_PROCESSORS[name] for name in post]
+        self.aliases = tuple(aliases)
+
+    def extract(self, soup: BeautifulSoup, html: str, common: Dict[str, Any]) -> Any:
+        """규칙 적용 (값이 없으면 None)"""
+        if self.source == 'html':
+            return self._finish(html)
+        if self.source.startswith('meta:'):
+            value = common.get(self.source[5:])
+            return self._finish(value) if isinstance(value, str) else None
+
+        elements = self.selector.select(soup)
+        if self.contains is not None:
+            elements = [elem for elem in elements if self.contains in elem.get_text()]
+
+        if self.many:
+            values = []
+            for elem in elements:
+                value = self._finish(self._read(elem))
+                if value and not (self.exclude and self.exclude in str(value)):
+                    values.append(value)
+            return self.join.join(str(value) for value in values) if values else None
+
+        if len(elements) <= self.index:
+            return None
+        elem = elements[self.index]
+        if self.child is not None:
+            elem = self.child.select_one(elem)
+            if elem is None:
+                return None
+        return self._finish(self._read(elem))
+
+    def _read(self, elem) -> Optional[str]:
+        if self.attr:
+            return elem.get(self.attr)
+        return elem.get_text()
+
+    def _finish(self, value: Optional[str]) -> Any:
+        """정규식 → 후처리 → 최소 길이 검사"""
+        if value is None:
+            return None
+        if self.regex is not None:
+            match = self.regex.search(value)
+            if not match:
+                return None
+            value = match.group(1) if match.groups() else match.group(0)
+        for func in self.post:
+            try:
+                value = func(value)
+            except (ValueError, TypeError):
+                return None
+            if value is None:
+                return None
+        if isinstance(value, str) and (not value or len(value) < self.min_length):
+            return None
+        return value
+
+
+class SiteProfile:
+    """사이트 하나의 컴파일된 추출 프로필"""
+
+    def __init__(
+        self,
+        name: str,
+        hosts: Iterable[str],
+        fields: Iterable[Dict[str, Any]] = (),
+        js_required: bool = False,
+        resource_overrides: Optional[Dict[str, List[str]]] = None,
+        required: Iterable[str] = ('title',),
+        product_id: Optional[str] = None,
+        version: int = 1,
+    ):
+        """
+        Args:
+            name: 프로필 이름 (통계/벤치마크용)
+            hosts: 대상 호스트 (하위 도메인 포함)
+            fields: FieldRule 인자 딕셔너리 목록
+            js_required: 본문이 JavaScript로만 렌더링되어 HTTP 단계를 건너뛸지
+            resource_overrides: 요청 차단 규칙 변경 (ResourceRules.with_overrides 인자)
+            required: HTTP 단계에서 이 필드를 못 찾으면 브라우저로 전환
+            product_id: URL에서 상품 ID를 뽑는 정규식 (스크래핑 캐시 키, 대소문자 무시)
+            version: 규칙 버전 (규칙을 바꾸면 올려서 이전 캐시 무효화)
+        """
+        self.name = name
+        self.hosts = tuple(hosts)
+        self.rules = [FieldRule(**spec) for spec in fields]
+        self.js_required = js_required
+        self.resource_overrides = resource_overrides or {}
+        self.required = tuple(required)
+        self.product_id_pattern = re.compile(product_id, re.IGNORECASE) if product_id else None
+        self.version = version
+
+    def product_id(self, url: str) -> Optional[str]:
+        """URL의 상품 ID (패턴이 없거나 찾지 못하면 None)"""
+        if self.product_id_pattern is None:
+            return None
+        match = self.product_id_pattern.search(url)
+        return match.group(1) if match else None
+
+    def extract(self, soup: BeautifulSoup, html: str, common: Dict[str, Any]) -> Dict[str, Any]:
+        """규칙을 순서대로 적용 (키별로 처음 얻은 값 사용)"""
+        metadata: Dict[str, Any] = {}
+        for rule in self.rules:
+            if rule.key in metadata:
+                continue
+            try:
+                value = rule.extract(soup, html, common)
+            except Exception as e:
+                logger.warning(f"{self.name} 파싱 오류 ({rule.key}): {e}")
+                continue
+            if value is None:
+                continue
+            metadata[rule.key] = value
+            for alias in rule.aliases:
+                metadata[alias] = value
+        return metadata
+
+    def is_complete(self, metadata: Dict[str, Any]) -> bool:
+        """필수 필드를 모두 추출했는지"""
+        return all(metadata.get(key) for key in self.required)
+
+
+class SiteRegistry:
+    """호스트 → 프로필 레지스트리 (호스트 접미사 dict 조회)"""
+
+    def __init__(self):
+        self._by_host: Dict[str, SiteProfile] = {}
+
+    def register(self, profile: SiteProfile) -> None:
+        for host in profile.hosts:
+            self._by_host[host.lower()] = profile
+
+    def for_host(self, host: str) -> Optional[SiteProfile]:
+        """
+        호스트에 맞는 프로필 (없으면 None)
+
+        'product.kyobobook.co.kr' → 'product.kyobobook.co.kr', 'kyobobook.co.kr', 'co.kr' 순서로 조회
+        (레이블 수만큼의 dict 조회이므로 등록된 프로필 수와 무관)
+        """
+        labels = host.lower().split('.')
+        for i in range(len(labels) - 1):
+            profile = self._by_host.get('.'.join(labels[i:]))
+            if profile is not None:
+                return profile
+        return None
+
+    def for_url(self, url: str) -> Optional[SiteProfile]:
+        return self.for_host(urlparse(url).hostname or '')
+
+    def profiles(self) -> List[SiteProfile]:
+        """등록된 프로필 목록 (중복 제거, 등록 순서)"""
+        return list(dict.fromkeys(self._by_host.values()))
+
+
+# ISBN은 13자리 우선, 없으면 10자리
+_ISBN13 = r'ISBN[:\s]*(\d{13})'
+_ISBN10 = r'ISBN[:\s]*(\d{10})'
+# 페이지수 ("224쪽")
+_PAGE_COUNT = {'key': 'page_count', 'source': 'html', 'regex': r'(\d+)\s*쪽', 'post': ['int'], 'aliases': ['pages']}
+
+# 사이트 프로필 정의 (새 사이트는 여기에 추가)
+PROFILE_DEFINITIONS: List[Dict[str, Any]] = [
+    {
+        'name': 'kyobobook',
+        'hosts': ['kyobobook.co.kr'],
+        # https://product.kyobobook.co.kr/detail/S000001713046
+        'product_id': r'/detail/(S\d+)',
+        'fields': [
+            {'key': 'title', 'selector': '.prod_title'},
+            {'key': 'author', 'selector': '.author a'},
+            # "대원씨아이 · 2021년 10월 05일" 형식 (· 구분자가 없으면 전체를 출판일로 간주)
+            {'key': 'publisher', 'selector': '.prod_info_text.publish_date', 'regex': r'^([^·]+)·'},
+            {'key': 'publication_date', 'selector': '.prod_info_text.publish_date', 'regex': r'([^·]+)$',
+             'post': ['strip', 'korean_date']},
+            {'key': 'price', 'selector': '.sell_price .val', 'post': ['digits_int']},
+            # 이미지 URL 패턴: https://contents.kyobobook.co.kr/sih/fit-in/458x0/pdt/9791136287489.jpg
+            {'key': 'isbn', 'source': 'meta:image', 'regex': r'/pdt/(\d{13})\.'},
+            {'key': 'isbn', 'selector': '.info_detail_wrap', 'regex': _ISBN13},
+            {'key': 'isbn', 'selector': '.info_detail_wrap', 'regex': _ISBN10},
+            {'key': 'description', 'selector': '.intro_bottom', 'post': ['collapse_ws']},
+            _PAGE_COUNT,
+            # breadcrumb 두 번째 레벨 (국내도서 > 만화/소설 등)
+            {'key': 'category', 'selector': '.breadcrumb_list .breadcrumb_item[data-id]', 'index': 1, 'child': 'a'},
+        ],
+    },
+    {
+        'name': 'aladin',
+        'hosts': ['aladin.co.kr'],
+        # https://www.aladin.co.kr/shop/wproduct.aspx?ItemId=281358410
+        'product_id': r'[?&]ItemId=(\d+)',
+        'fields': [
+            {'key': 'title', 'selector': '.prod_title'},
+            # 여러 저자, 역할 설명("(지은이)") 제외
+            {'key': 'author', 'selector': '.Ere_prod_author_box a', 'many': True, 'exclude': '(',
+             'post': ['strip', 'unescape']},
+            {'key': 'publisher', 'selector': '.Ere_sub_black a'},
+            # "출간일: 2008-03-18" 형식
+            {'key': 'publication_date', 'selector': '.Ere_sub_gray', 'contains': '출간일',
+             'regex': r'(\d{4}-\d{2}-\d{2})'},
+            {'key': 'price', 'selector': '.Ere_prod_price .val', 'post': ['digits_int']},
+            # 알라딘은 여러 곳에 ISBN이 있을 수 있으므로 페이지 전체에서 검색
+            {'key': 'isbn', 'source': 'html', 'regex': _ISBN13},
+            {'key': 'isbn', 'source': 'html', 'regex': _ISBN10},
+            {'key': 'description', 'selector': '#divContentTab1', 'min_length': 20, 'post': ['collapse_ws']},
+            {'key': 'description', 'selector': '.Ere_prod_mconts_T', 'min_length': 20, 'post': ['collapse_ws']},
+            {'key': 'description', 'selector': '.book_summary_wrap', 'min_length': 20, 'post': ['collapse_ws']},
+            _PAGE_COUNT,
+        ],
+    },
+    {
+        'name': 'yes24',
+        'hosts': ['yes24.com'],
+        # https://www.yes24.com/Product/Goods/1234567
+        'product_id': r'/Goods/(\d+)',
+        'fields': [
+            {'key': 'title', 'selector': '.gd_name'},
+            {'key': 'author', 'selector': '.gd_auth a', 'many': True},
+            {'key': 'publisher', 'selector': '.gd_pub a'},
+            {'key': 'publication_date', 'selector': '.gd_date', 'post': ['strip', 'korean_date']},
+            {'key': 'price', 'selector': '.nor_price em', 'post': ['digits_int']},
+            {'key': 'isbn', 'source': 'html', 'regex': r'ISBN13[^\d]*(\d{13})'},
+            {'key': 'isbn', 'source': 'html', 'regex': _ISBN13},
+            {'key': 'description', 'selector': '.infoWrap_txt', 'min_length': 20, 'post': ['collapse_ws']},
+            _PAGE_COUNT,
+        ],
+    },
+]
+
+
+def build_registry(definitions: Iterable[Dict[str, Any]]) -> SiteRegistry:
+    """프로필 정의를 컴파일하여 레지스트리 생성"""
+    registry = SiteRegistry()
+    for definition in definitions:
+        registry.register(SiteProfile(**definition))
+    return registry
+
+
+# 모듈 로드(앱 시작) 시 한 번 컴파일
+site_registry = build_registry(PROFILE_DEFINITIONS)
+
+
+def get_site_profile(url: str) -> Optional[SiteProfile]:
+    """URL에 맞는 사이트 프로필 (없으면 None)"""
+    return site_registry.for_url(url)
+
@@ -1,42 +1,90 @@
 """
 웹 페이지 스크래핑 서비스
-Playwright를 사용하여 JavaScript 렌더링된 페이지도 크롤링
+서버 렌더링 HTML은 HTTP로 바로 파싱하고, 필요할 때만 Playwright로 JavaScript 렌더링된 페이지를 크롤링
 """
+import asyncio
 import logging
+from collections import defaultdict
 from typing import Optional, Dict, Any
-from playwright.async_api import async_playwright, Browser, Page
-from bs4 import BeautifulSoup
-import re
+from urllib.parse import urlparse
+import httpx
+
+from backend.app.core.config import settings
+from backend.app.services.scraper.browser_pool import BrowserPool, get_browser_pool
+from backend.app.services.scraper.rate_limiter import get_rate_limiter
+from backend.app.services.scraper.request_filter import get_resource_rules, install_request_filter
+from backend.app.services.scraper.http_fetcher import get_http_client, fetch_html
+from backend.app.services.scraper.site_parsers import parse_html
+from backend.app.services.scraper.site_profiles import get_site_profile
+from backend.app.services.scraper.scrape_cache import get_scrape_cache
+from backend.app.services.scraper.field_mapper import get_compiled_mapping
 
 logger = logging.getLogger(__name__)
 
+# 요청 제한/과부하로 간주하는 HTTP 상태 코드
+THROTTLE_STATUS_CODES = {429, 503}
+
+# 에러 페이지 제목 패턴
+ERROR_TITLE_PATTERNS = [
+    '400 bad request', '401 unauthorized', '403 forbidden', '404 not found',
+    '500 internal server error', '502 bad gateway', '503 service unavailable',
+    'page not found', '접근이 거부', '페이지를 찾을 수 없', '요청한 페이지를 찾을 수 없'
+]
+
+
+class SoftBlockError(ValueError):
+    """
+    차단 의심 신호 (빈 제목, 에러 페이지 제목, 429/503 응답)
+
+    reason: 'empty_title' | 'error_title' | 'status'
+    """
+
+    def __init__(self, message: str, reason: str):
+        super().__init__(message)
+        self.reason = reason
+
+    @property
+    def retryable(self) -> bool:
+        """속도를 낮춰 재시도할 가치가 있는지 (에러 페이지 제목은 재시도해도 동일)"""
+        return self.reason in ('empty_title', 'status')
+
 
 class WebScraper:
     """웹 페이지 메타데이터 추출"""
 
-    def __init__(self):
-        self._browser: Optional[Browser] = None
+    def __init__(self, pool: Optional[BrowserPool] = None):
+        self._pool: Optional[BrowserPool] = pool
+        self._owns_pool = False
 
     async def __aenter__(self):
-        """Context manager 진입"""
-        self.playwright = await async_playwright().start()
-        self._browser = await self.playwright.chromium.launch(headless=True)
+        """Context manager 진입 (공용 브라우저 풀 사용, 없으면 전용 풀 생성)"""
+        if self._pool is None:
+            shared_pool = get_browser_pool()
+            if shared_pool and shared_pool.is_running:
+                self._pool = shared_pool
+            else:
+                # 앱 lifespan 밖(스크립트 등)에서 사용하거나 공용 풀 시작에 실패한 경우
+                logger.info("공용 브라우저 풀이 없어 전용 브라우저를 실행합니다.")
+                self._pool = BrowserPool(size=1, max_pages_per_browser=settings.SCRAPER_BROWSER_MAX_PAGES)
+                await self._pool.start()
+                self._owns_pool = True
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Context manager 종료"""
+        """Context manager 종료 (전용 풀만 종료, 공용 풀은 앱 종료 시 정리)"""
         _ = (exc_type, exc_val, exc_tb)  # 사용되지 않음
-        if self._browser:
-            await self._browser.close()
-        if self.playwright:
-            await self.playwright.stop()
+        if self._owns_pool and self._pool:
+            await self._pool.stop()
+            self._pool = None
+            self._owns_pool = False
 
-    async def scrape_url(self, url: str) -> Dict[str, Any]:
+    async def scrape_url(self, url: str, acquire: bool = True) -> Dict[str, Any]:
         """
         URL에서 메타데이터 추출
 
         Args:
             url: 크롤링할 URL
+            acquire: False면 속도 제한 토큰을 받지 않음 (HTTP 단계에서 이미 받은 요청을 이어서 처리할 때)
 
         Returns:
             추출된 메타데이터 딕셔너리
@@ -44,364 +92,211 @@ class WebScraper:
         Raises:
             ValueError: 필수 필드가 없거나 페이지 로딩 실패 시
         """
-        if not self._browser:
+        if not self._pool:
             raise RuntimeError("WebScraper must be used as context manager")
 
-        page = await self._browser.new_page()
-
+        # 호스트별 속도 제한 (차단 신호에 따라 자동 조절)
+        rate_limiter = get_rate_limiter()
+        if acquire:
+            await rate_limiter.acquire(url)
         try:
-            # 페이지 로드 (최대 60초 대기, domcontentloaded로 변경하여 속도 개선)
-            await page.goto(url, wait_until="domcontentloaded", timeout=60000)
-
-            # 페이지 소스 가져오기
-            content = await page.content()
-
-            # BeautifulSoup으로 파싱
-            soup = BeautifulSoup(content, 'html.parser')
-
-            # 메타데이터 추출
-            metadata = await self._extract_metadata(soup, page)
-            metadata['source_url'] = url
-
-            # image를 image_url로 변경 (프론트엔드 호환성)
-            if 'image' in metadata and metadata['image']:
-                metadata['image_url'] = metadata.pop('image')
-
-            # 필수 필드 검증
-            if not metadata.get('title') or not metadata['title'].strip():
-                raise ValueError(f"페이지에서 제목을 찾을 수 없습니다. 페이지 로딩이 실패했거나 차단되었을 수 있습니다.")
-
-            # 에러 페이지 감지 (title에 HTTP 에러 코드가 있는 경우)
-            title_lower = metadata['title'].lower()
-            error_patterns = [
-                '400 bad request', '401 unauthorized', '403 forbidden', '404 not found',
-                '500 internal server error', '502 bad gateway', '503 service unavailable',
-                'page not found', '접근이 거부', '페이지를 찾을 수 없', '요청한 페이지를 찾을 수 없'
-            ]
-            # 정확한 에러 키워드만 (error는 너무 광범위하므로 제외)
-            if any(pattern in title_lower for pattern in error_patterns):
-                raise ValueError(f"페이지 로딩 실패: {metadata['title']}")
-
-            return metadata
-
-        finally:
-            await page.close()
-
-    async def _extract_metadata(self, soup: BeautifulSoup, page: Page) -> Dict[str, Any]:
-        """HTML에서 메타데이터 추출"""
-        metadata = {}
-
-        # Open Graph 메타 태그
-        og_tags = {
-            'og:title': 'title',
-            'og:description': 'description',
-            'og:image': 'image',
-            'og:type': 'type',
-        }
-
-        for og_key, meta_key in og_tags.items():
-            tag = soup.find('meta', property=og_key)
-            if tag and tag.get('content'):
-                metadata[meta_key] = tag['content']
-
-        # Twitter Card 메타 태그
-        twitter_tags = {
-            'twitter:title': 'title',
-            'twitter:description': 'description',
-            'twitter:image': 'image',
-        }
-
-        for twitter_key, meta_key in twitter_tags.items():
-            if meta_key not in metadata:
-                tag = soup.find('meta', attrs={'name': twitter_key})
-                if tag and tag.get('content'):
-                    metadata[meta_key] = tag['content']
-
-        # 일반 메타 태그
-        if 'description' not in metadata:
-            desc_tag = soup.find('meta', attrs={'name': 'description'})
-            if desc_tag and desc_tag.get('content'):
-                metadata['description'] = desc_tag['content']
-
-        # 페이지 제목 (fallback)
-        if 'title' not in metadata:
-            title_tag = soup.find('title')
-            if title_tag:
-                metadata['title'] = title_tag.get_text().strip()
-
-        # JSON-LD 구조화된 데이터
-        json_ld_scripts = soup.find_all('script', type='application/ld+json')
-        for script in json_ld_scripts:
+            metadata = await self._load_and_extract(url)
+        except SoftBlockError as e:
+            rate_limiter.record_soft_block(url, e.reason)
+            raise
+        rate_limiter.record_success(url)
+        return metadata
+
+    async def _load_and_extract(self, url: str) -> Dict[str, Any]:
+        """풀에서 컨텍스트를 받아 페이지 로드 후 HTML 스냅샷 한 번으로 메타데이터 추출"""
+        async with self._pool.context() as context:
+            # 이미지/폰트/추적 스크립트 등 파싱에 불필요한 요청 차단
+            await install_request_filter(context, get_resource_rules(url))
+            page = await context.new_page()
+
             try:
-                import json
-                data = json.loads(script.string)
-
-                if isinstance(data, dict):
-                    # Book schema
-                    if data.get('@type') == 'Book':
-                        metadata['title'] = data.get('name', metadata.get('title'))
-
-                        # author 처리 (dict 또는 string 가능)
-                        author_data = data.get('author')
-                        if isinstance(author_data, dict):
-                            metadata['author'] = author_data.get('name')
-                        elif isinstance(author_data, str):
-                            metadata['author'] = author_data
-
-                        # publisher 처리 (dict 또는 string 가능)
-                        publisher_data = data.get('publisher')
-                        if isinstance(publisher_data, dict):
-                            metadata['publisher'] = publisher_data.get('name')
-                        elif isinstance(publisher_data, str):
-                            metadata['publisher'] = publisher_data
-
-                        metadata['isbn'] = data.get('isbn')
-                        metadata['date_published'] = data.get('datePublished')
-
-                        # 가격 정보
-                        if 'offers' in data:
-                            offers = data['offers']
-                            if isinstance(offers, dict):
-                                metadata['price'] = offers.get('price')
-
-                    # Product schema
-                    elif data.get('@type') == 'Product':
-                        metadata['title'] = data.get('name', metadata.get('title'))
-                        metadata['description'] = data.get('description', metadata.get('description'))
-
-                        if 'offers' in data:
-                            offers = data['offers']
-                            if isinstance(offers, dict):
-                                metadata['price'] = offers.get('price')
-
-            except Exception:
-                continue
-
-        # 사이트별 특화 파싱
-        url = page.url  # 속성이므로 await 불필요
-        if 'kyobobook.co.kr' in url:
-            metadata.update(await self._parse_kyobo(soup, page, metadata))
-        elif 'aladin.co.kr' in url:
-            metadata.update(await self._parse_aladin(soup, page))
+                # 페이지 로드 (domcontentloaded로 변경하여 속도 개선)
+                response = await page.goto(url, wait_until="domcontentloaded", timeout=settings.SCRAPER_PAGE_TIMEOUT_MS)
 
-        return metadata
+                # 요청 제한/과부하 응답
+                if response and response.status in THROTTLE_STATUS_CODES:
+                    raise SoftBlockError(
+                        f"HTTP {response.status} 응답: 요청이 제한되었거나 서버가 과부하 상태입니다.",
+                        reason='status'
+                    )
 
-    async def _parse_kyobo(self, soup: BeautifulSoup, page: Page, existing_metadata: Dict[str, Any]) -> Dict[str, Any]:
-        """교보문고 페이지 특화 파싱"""
-        _ = soup  # 현재 사용하지 않음 (page.query_selector 사용)
-        metadata = {}
+                # 렌더링된 HTML을 한 번만 가져옴 (이후 파싱은 브라우저와 통신하지 않음)
+                content = await page.content()
+                final_url = page.url  # 리다이렉트 후 URL (속성이므로 await 불필요)
+            finally:
+                await page.close()
 
-        try:
-            # 책 제목
-            title_elem = await page.query_selector('.prod_title')
-            if title_elem:
-                metadata['title'] = (await title_elem.text_content()).strip()
-
-            # 저자 정보
-            author_elem = await page.query_selector('.author a')
-            if author_elem:
-                metadata['author'] = (await author_elem.text_content()).strip()
-
-            # 출판사와 출판일 (.prod_info_text.publish_date에서 함께 추출)
-            publish_info_elem = await page.query_selector('.prod_info_text.publish_date')
-            if publish_info_elem:
-                publish_text = (await publish_info_elem.text_content()).strip()
-                # "대원씨아이 · 2021년 10월 05일" 형식
-                parts = publish_text.split('·')
-                if len(parts) == 2:
-                    metadata['publisher'] = parts[0].strip()
-                    date_text = parts[1].strip()
-                    # "2021년 10월 05일" → "2021-10-05" 변환
-                    date_match = re.search(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일', date_text)
-                    if date_match:
-                        year, month, day = date_match.groups()
-                        metadata['publication_date'] = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                    else:
-                        metadata['publication_date'] = date_text
-                elif len(parts) == 1:
-                    # · 구분자가 없으면 전체를 출판일로 간주
-                    date_text = parts[0].strip()
-                    date_match = re.search(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일', date_text)
-                    if date_match:
-                        year, month, day = date_match.groups()
-                        metadata['publication_date'] = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                    else:
-                        metadata['publication_date'] = date_text
-
-            # 가격
-            price_elem = await page.query_selector('.sell_price .val')
-            if price_elem:
-                price_text = (await price_elem.text_content()).strip()
-                # 숫자만 추출
-                price_digits = re.sub(r'[^\d]', '', price_text)
-                if price_digits:
-                    metadata['price'] = int(price_digits)
-
-            # ISBN (이미지 URL에서 추출)
-            # 교보문고 이미지 URL 패턴: https://contents.kyobobook.co.kr/sih/fit-in/458x0/pdt/9791136287489.jpg
-            if 'image' in existing_metadata:
-                isbn_from_url = re.search(r'/pdt/(\d{13})\.', existing_metadata['image'])
-                if isbn_from_url:
-                    metadata['isbn'] = isbn_from_url.group(1)
-
-            # 페이지 텍스트에서도 시도
-            if 'isbn' not in metadata:
-                isbn_elem = await page.query_selector('.info_detail_wrap')
-                if isbn_elem:
-                    info_text = await isbn_elem.text_content()
-                    # 13자리 ISBN 우선 검색
-                    isbn_match = re.search(r'ISBN[:\s]*(\d{13})', info_text)
-                    if not isbn_match:
-                        # 10자리 ISBN
-                        isbn_match = re.search(r'ISBN[:\s]*(\d{10})', info_text)
-                    if isbn_match:
-                        metadata['isbn'] = isbn_match.group(1)
-
-            # 책 설명 (개행문자와 연속 공백 제거)
-            desc_elem = await page.query_selector('.intro_bottom')
-            if desc_elem:
-                desc_text = (await desc_elem.text_content()).strip()
-                # 개행문자와 연속 공백을 단일 공백으로 변환
-                desc_text = re.sub(r'\s+', ' ', desc_text)
-                metadata['description'] = desc_text
-
-            # 페이지수 추출 (전체 페이지에서 "n쪽" 패턴 찾기)
-            page_content = await page.content()
-            pages_match = re.search(r'(\d+)\s*쪽', page_content)
-            if pages_match:
-                try:
-                    page_count = int(pages_match.group(1))
-                    metadata['page_count'] = page_count
-                    metadata['pages'] = page_count  # 하위 호환성
-                except (ValueError, AttributeError):
-                    pass
-
-            # 카테고리 추출 (breadcrumb에서 두 번째 레벨 - 국내도서 > 만화/소설 등)
-            breadcrumb_list = await page.query_selector('.breadcrumb_list')
-            if breadcrumb_list:
-                # data-id 속성이 있는 breadcrumb_item들 가져오기
-                active_items = await breadcrumb_list.query_selector_all('.breadcrumb_item[data-id]')
-                if len(active_items) >= 2:
-                    # 두 번째 카테고리 (국내도서 다음 레벨)
-                    second_item = active_items[1]
-                    link = await second_item.query_selector('a')
-                    if link:
-                        cat_text = (await link.text_content()).strip()
-                        if cat_text:
-                            metadata['category'] = cat_text
-
-        except Exception as e:
-            logger.warning(f"교보문고 파싱 오류: {e}")
+        # DOM 파싱은 CPU 작업이므로 이벤트 루프 밖에서 실행
+        metadata, _ = await asyncio.to_thread(parse_html, final_url, content)
+        return finalize_metadata(metadata, url)
 
-        return metadata
 
-    async def _parse_aladin(self, soup: BeautifulSoup, page: Page) -> Dict[str, Any]:
-        """알라딘 페이지 특화 파싱"""
-        _ = soup  # 현재 사용하지 않음 (page.query_selector 사용)
-        metadata = {}
+def finalize_metadata(metadata: Dict[str, Any], url: str) -> Dict[str, Any]:
+    """
+    추출 결과 정리 및 검증 (HTTP/브라우저 공통)
 
-        try:
-            # 책 제목
-            title_elem = await page.query_selector('.prod_title')
-            if title_elem:
-                metadata['title'] = (await title_elem.text_content()).strip()
-
-            # 저자 정보 (여러 저자 가능)
-            author_elems = await page.query_selector_all('.Ere_prod_author_box a')
-            if author_elems:
-                authors = []
-                for elem in author_elems:
-                    text = (await elem.text_content()).strip()
-                    if text and '(' not in text:  # 역할 설명 제외
-                        # HTML 엔티티 디코딩
-                        import html
-                        text = html.unescape(text)
-                        authors.append(text)
-                if authors:
-                    metadata['author'] = ', '.join(authors)
-
-            # 출판사
-            publisher_elem = await page.query_selector('.Ere_sub_black a')
-            if publisher_elem:
-                metadata['publisher'] = (await publisher_elem.text_content()).strip()
-
-            # 출판일
-            date_elem = await page.query_selector('.Ere_sub_gray:has-text("출간일")')
-            if date_elem:
-                date_text = (await date_elem.text_content()).strip()
-                # "출간일: 2008-03-18" 형식
-                date_match = re.search(r'(\d{4}-\d{2}-\d{2})', date_text)
-                if date_match:
-                    metadata['publication_date'] = date_match.group(1)
-
-            # 가격
-            price_elem = await page.query_selector('.Ere_prod_price .val')
-            if price_elem:
-                price_text = (await price_elem.text_content()).strip()
-                # "4,950원" 형식에서 숫자만 추출
-                price_digits = re.sub(r'[^\d]', '', price_text)
-                if price_digits:
-                    metadata['price'] = int(price_digits)
-
-            # ISBN (13자리 우선, 페이지 전체에서 검색)
-            # 알라딘은 여러 곳에 ISBN이 있을 수 있음
-            page_content = await page.content()
-            # 13자리 ISBN 우선 검색
-            isbn_match = re.search(r'ISBN[:\s]*(\d{13})', page_content)
-            if not isbn_match:
-                # 10자리 ISBN
-                isbn_match = re.search(r'ISBN[:\s]*(\d{10})', page_content)
-            if isbn_match:
-                metadata['isbn'] = isbn_match.group(1)
-
-            # 책 설명 (여러 요소 시도, 개행문자와 연속 공백 제거)
-            desc_selectors = [
-                '#divContentTab1',  # 책 소개
-                '.Ere_prod_mconts_T',
-                '.book_summary_wrap'
-            ]
-            for selector in desc_selectors:
-                desc_elem = await page.query_selector(selector)
-                if desc_elem:
-                    desc_text = (await desc_elem.text_content()).strip()
-                    if desc_text and len(desc_text) > 20:
-                        # 개행문자와 연속 공백을 단일 공백으로 변환
-                        desc_text = re.sub(r'\s+', ' ', desc_text)
-                        metadata['description'] = desc_text
-                        break
-
-            # 페이지수 추출 (전체 페이지에서 "n쪽" 패턴 찾기)
-            page_content = await page.content()
-            pages_match = re.search(r'(\d+)\s*쪽', page_content)
-            if pages_match:
-                try:
-                    page_count = int(pages_match.group(1))
-                    metadata['page_count'] = page_count
-                    metadata['pages'] = page_count  # 하위 호환성
-                except (ValueError, AttributeError):
-                    pass
-
-            # 카테고리 추출 - 알라딘은 구조가 복잡하여 생략
-            # TODO: 알라딘 카테고리 추출 로직 개선 필요
-
-        except Exception as e:
-            logger.warning(f"알라딘 파싱 오류: {e}")
+    Raises:
+        SoftBlockError: 제목이 없거나 에러 페이지로 보이는 경우
+    """
+    metadata['source_url'] = url
+
+    # image를 image_url로 변경 (프론트엔드 호환성)
+    if 'image' in metadata and metadata['image']:
+        metadata['image_url'] = metadata.pop('image')
+
+    # 필수 필드 검증
+    if not metadata.get('title') or not metadata['title'].strip():
+        raise SoftBlockError(
+            "페이지에서 제목을 찾을 수 없습니다. 페이지 로딩이 실패했거나 차단되었을 수 있습니다.",
+            reason='empty_title'
+        )
+
+    # 에러 페이지 감지 (title에 HTTP 에러 코드가 있는 경우)
+    title_lower = metadata['title'].lower()
+    # 정확한 에러 키워드만 (error는 너무 광범위하므로 제외)
+    if any(pattern in title_lower for pattern in ERROR_TITLE_PATTERNS):
+        raise SoftBlockError(f"페이지 로딩 실패: {metadata['title']}", reason='error_title')
+
+    return metadata
+
+
+# 호스트별 처리 단계 통계 {host: {'cache': n, 'http': n, 'browser': n, 'escalated': n}}
+_tier_stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {'cache': 0, 'http': 0, 'browser': 0, 'escalated': 0})
+
+
+class ScrapeResult:
+    """스크래핑 결과 + 처리 단계 ('cache', 'http' 또는 'browser')"""
+
+    def __init__(self, metadata: Dict[str, Any], tier: str):
+        self.metadata = metadata
+        self.tier = tier
 
-        return metadata
 
+def get_tier_stats() -> Dict[str, Dict[str, int]]:
+    """호스트별 처리 단계 통계 (HTTP 우선 처리 튜닝용)"""
+    return {host: dict(counts) for host, counts in _tier_stats.items()}
 
-async def scrape_url(url: str) -> Dict[str, Any]:
+
+def _requires_browser(url: str) -> bool:
+    if not settings.SCRAPER_HTTP_FIRST:
+        return True
+    # 본문이 JavaScript로만 렌더링되는 사이트 (프로필의 js_required)
+    profile = get_site_profile(url)
+    return profile is not None and profile.js_required
+
+
+async def _scrape_with_http(url: str) -> Optional[Dict[str, Any]]:
+    """
+    HTTP GET + HTML 파싱으로 메타데이터 추출 (1단계, 속도 제한 토큰은 호출한 쪽에서 받음)
+
+    Returns:
+        메타데이터, 브라우저가 필요하면 None (필수 필드 없음, 연결 실패, 비정상 응답)
+
+    Raises:
+        SoftBlockError: 429/503 응답 (브라우저로 다시 요청해도 같은 결과이므로 상위로 전달)
     """
-    단일 URL 스크래핑 (편의 함수)
+    rate_limiter = get_rate_limiter()
+
+    try:
+        async with get_http_client() as client:
+            response = await fetch_html(client, url)
+    except httpx.HTTPError as e:
+        logger.debug(f"HTTP 요청 실패, 브라우저로 전환: {url} ({e})")
+        return None
+
+    if response.status_code in THROTTLE_STATUS_CODES:
+        error = SoftBlockError(
+            f"HTTP {response.status_code} 응답: 요청이 제한되었거나 서버가 과부하 상태입니다.",
+            reason='status'
+        )
+        rate_limiter.record_soft_block(url, error.reason)
+        raise error
+
+    if response.status_code != 200:
+        return None
+
+    metadata, complete = await asyncio.to_thread(parse_html, response.url, response.html)
+    if not complete:
+        # 사이트 프로필의 필수 필드 누락 → 스크립트 렌더링 페이지로 보고 브라우저에서 재시도
+        return None
+    try:
+        metadata = finalize_metadata(metadata, url)
+    except SoftBlockError:
+        # 제목이 스크립트로 렌더링되는 페이지일 수 있음 → 브라우저에서 판단
+        return None
+
+    rate_limiter.record_success(url)
+    return metadata
+
+
+async def scrape_page(url: str, force_refresh: bool = False) -> ScrapeResult:
+    """
+    단계별 스크래핑: 캐시 → HTTP → 필요할 때만 Playwright
 
     Args:
         url: 크롤링할 URL
+        force_refresh: True면 캐시를 무시하고 다시 가져옴 (결과는 캐시에 갱신)
 
     Returns:
-        메타데이터 딕셔너리
+        ScrapeResult (metadata, tier)
+    """
+    host = urlparse(url).hostname or ''
+    cache = get_scrape_cache()
+
+    if not force_refresh:
+        cached = await cache.get(url)
+        if cached is not None:
+            _tier_stats[host]['cache'] += 1
+            logger.debug(f"[TIER] cache: {url}")
+            return ScrapeResult(finalize_metadata(cached, url), 'cache')
+
+    result = await _fetch_page(url, host)
+    await cache.set(url, result.metadata, result.tier)
+    return result
+
+
+async def _fetch_page(url: str, host: str) -> ScrapeResult:
     """
+    네트워크에서 가져오기 (HTTP 우선 → 필요 시 브라우저)
+
+    URL 하나에 속도 제한 토큰은 한 번만 받음 (브라우저로 전환해도 같은 요청으로 보고,
+    성공/차단 기록은 마지막 단계의 결과로 남김)
+    """
+    await get_rate_limiter().acquire(url)
+
+    if not _requires_browser(url):
+        metadata = await _scrape_with_http(url)
+        if metadata is not None:
+            _tier_stats[host]['http'] += 1
+            logger.debug(f"[TIER] http: {url}")
+            return ScrapeResult(metadata, 'http')
+        _tier_stats[host]['escalated'] += 1
+
     async with WebScraper() as scraper:
-        return await scraper.scrape_url(url)
+        metadata = await scraper.scrape_url(url, acquire=False)
+    _tier_stats[host]['browser'] += 1
+    logger.debug(f"[TIER] browser: {url}")
+    return ScrapeResult(metadata, 'browser')
+
+
+async def scrape_url(url: str, force_refresh: bool = False) -> Dict[str, Any]:
+    """
+    단일 URL 스크래핑 (편의 함수, 캐시 → HTTP 우선 → 필요 시 공용 브라우저 풀 사용)
+
+    Args:
+        url: 크롤링할 URL
+        force_refresh: True면 캐시를 무시하고 다시 가져옴
+
+    Returns:
+        메타데이터 딕셔너리
+    """
+    result = await scrape_page(url, force_refresh=force_refresh)
+    return result.metadata
 
 
 def apply_field_mapping(
@@ -422,20 +317,4 @@ def apply_field_mapping(
         - ignore_unmapped=False: {"책제목": "...", "저자명": "...", "extra": "..."}
         - ignore_unmapped=True: {"책제목": "...", "저자명": "..."}
     """
-    if not mapping:
-        return scraped_data
-
-    mapped_data = {}
-    for scraped_key, value in scraped_data.items():
-        # 매핑이 있는 경우
-        if scraped_key in mapping:
-            target_key = mapping[scraped_key]
-            if target_key:  # 빈 문자열이 아닌 경우만
-                mapped_data[target_key] = value
-        # 매핑이 없는 경우
-        elif not ignore_unmapped:
-            # 매핑 안 된 필드는 원래 키로 유지
-            mapped_data[scraped_key] = value
-        # else: ignore_unmapped=True면 이 필드는 무시됨
-
-    return mapped_data
+    return get_compiled_mapping(mapping, ignore_unmapped).apply(scraped_data)
@@ -0,0 +1,49 @@
+"""
+CSV 일괄 등록 작업 워커 (별도 프로세스)
+API 서버와 같은 MongoDB 작업 큐를 처리 (SCRAPER_JOB_WORKER_ENABLED=false로 API 서버 안의 워커를 끄고 사용)
+
+실행:
+    uv run python -m backend.app.worker
+"""
+import asyncio
+import logging
+import signal
+
+from backend.app.db.mongodb import connect_to_mongodb, close_mongodb_connection
+from backend.app.services.scraper.browser_pool import start_browser_pool, stop_browser_pool
+from backend.app.services.scraper.http_fetcher import start_http_client, stop_http_client
+from backend.app.services.scraper.scrape_cache import get_scrape_cache
+from backend.app.services.scraper.artifact_store import start_artifact_store, stop_artifact_store
+from backend.app.services.scraper.import_jobs import start_import_worker, stop_import_worker
+
+logger = logging.getLogger(__name__)
+
+
+async def main():
+    await connect_to_mongodb()
+    await get_scrape_cache().ensure_indexes()
+    await start_artifact_store()
+    await start_http_client()
+    try:
+        await start_browser_pool()
+    except Exception as e:
+        logger.warning(f"브라우저 풀 시작 실패: {e}")
+    await start_import_worker()
+
+    # SIGINT/SIGTERM까지 실행
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+    await stop_event.wait()
+
+    await stop_import_worker()  # 실행 중인 작업은 대기열로 복귀
+    await stop_browser_pool()
+    await stop_http_client()
+    await stop_artifact_store()
+    await close_mongodb_connection()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(main())
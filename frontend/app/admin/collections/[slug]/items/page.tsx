@@ -374,6 +374,7 @@ export default function ItemsManagePage() {
                 className="px-4 py-2 border-2 border-slate-300 rounded-lg focus:border-amber-500 focus:outline-none"
               >
                 <option value="created_at">등록일</option>
+                {searchQuery && <option value="relevance">관련도</option>}
                 {fields
                   .filter((field) => field.sortable === true || field.key === 'title')
                   .map((field) => (
@@ -188,9 +188,19 @@ export default function CollectionItemsPage() {
   const [totalItems, setTotalItems] = useState(0);
   const pageSize = 30;
 
-  const handleItemClick = (item: Item) => {
+  const handleItemClick = async (item: Item) => {
+    // 목록은 요약(view=summary)이므로 먼저 요약으로 열고 전체 필드를 다시 조회
     setSelectedItem(item);
     setIsDetailModalOpen(true);
+    if (!collection) return;
+    try {
+      const res = await fetch(`/api/items/${collection.id}/${item._id}`);
+      if (!res.ok) return;
+      const fullItem: Item = await res.json();
+      setSelectedItem((current) => (current?._id === fullItem._id ? fullItem : current));
+    } catch (error) {
+      console.error('Failed to fetch item:', error);
+    }
   };
 
   const handleCloseDetail = () => {
@@ -235,6 +245,7 @@ export default function CollectionItemsPage() {
         page_size: pageSize.toString(),
         sort_key: sortKey,
         sort_order: sortOrder,
+        view: 'summary', // 카드/행에 필요한 필드만 (상세는 클릭 시 조회)
       });
 
       // 검색 파라미터 추가
@@ -343,6 +354,7 @@ export default function CollectionItemsPage() {
                 className="px-4 py-2 border-2 border-slate-300 rounded-lg focus:border-amber-500 focus:outline-none"
               >
                 <option value="created_at">등록일</option>
+                {searchQuery && <option value="relevance">관련도</option>}
                 {fields
                   .filter((field) => field.sortable === true || field.key === 'title')
                   .map((field) => (
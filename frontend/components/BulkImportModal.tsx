@@ -216,6 +216,15 @@ export default function BulkImportModal({
                   progress: data.progress,
                   errors: [...errors],
                 });
+              } else if (data.type === 'skipped') {
+                // 이미 등록된 항목 (중복) - 진행률만 갱신
+                setProgress({
+                  total: data.total,
+                  completed: data.success,
+                  failed: data.failed,
+                  progress: data.progress,
+                  errors: [...errors],
+                });
               } else if (data.type === 'blocked') {
                 // Block 감지
                 // console.log('[BLOCKED] 차단 감지:', data);
@@ -245,7 +254,7 @@ export default function BulkImportModal({
                 console.log('[COMPLETE] 완료 이벤트:', data);
 
                 // 불완전한 완료 감지: 성공 + 실패 < 전체
-                const processed = data.success + data.failed;
+                const processed = data.success + data.failed + (data.skipped || 0);
                 if (processed < data.total) {
                   console.warn(`[WARNING] 불완전한 완료: ${processed}/${data.total} 처리됨`);
                   // 불완전한 완료는 blocked로 처리
@@ -30,6 +30,7 @@ export interface FieldDefinition {
   // 표시 및 기능 옵션
   sortable?: boolean;      // 정렬 가능 여부
   searchable?: boolean;    // 검색 가능 여부
+  filterable?: boolean;    // 필터(일치 조건) 인덱스 생성 여부
   showInPublic?: boolean;  // public 페이지에 표시 여부
 }
 
@@ -163,6 +164,15 @@ function SortableFieldRow({
           title="검색 가능"
         />
       </td>
+      <td className="px-3 py-2 text-center">
+        <input
+          type="checkbox"
+          checked={field.filterable ?? false}
+          onChange={(e) => onUpdate(index, { filterable: e.target.checked })}
+          className="rounded border-slate-300"
+          title="필터 가능"
+        />
+      </td>
       <td className="px-3 py-2 text-center">
         <input
           type="checkbox"
@@ -395,6 +405,7 @@ export default function FieldDefinitionEditor({
                     <th className="px-3 py-3 text-left font-semibold text-slate-700">Placeholder</th>
                     <th className="px-3 py-3 text-center font-semibold text-slate-700" title="정렬 가능">정렬</th>
                     <th className="px-3 py-3 text-center font-semibold text-slate-700" title="검색 가능">검색</th>
+                    <th className="px-3 py-3 text-center font-semibold text-slate-700" title="필터 가능">필터</th>
                     <th className="px-3 py-3 text-center font-semibold text-slate-700" title="공개 표시">공개</th>
                     <th className="w-20 px-3 py-3 text-center font-semibold text-slate-700">작업</th>
                   </tr>
@@ -41,11 +41,12 @@ export interface Item {
 }
 
 export interface PaginatedItems {
-  items: Item[];
-  total: number;
-  page: number;
+  items: Item[];  // view=summary/fields면 metadata는 선택한 필드만 (collection_id, updated_at 없음)
+  total: number | null;  // include_total=false면 null
+  page: number | null;  // 커서 방식이면 null
   page_size: number;
-  total_pages: number;
+  total_pages: number | null;
+  next_cursor?: string | null;  // 커서 방식의 다음 페이지
 }
 
 // Collections
@@ -0,0 +1,393 @@
+"""
+CSV 일괄 등록 처리량 벤치마크
+scripts/fixtures/site_profiles 의 서점 HTML을 로컬 aiohttp 서버(가짜 서점)로 제공하고,
+CSV 읽기 → HTTP 스크래핑 → 파싱 → 필드 매핑 → 배치 저장(bulk-scrape-csv-stream 작업이 실행하는 bulk_scrape_events)을
+끝까지 실행하여 URL/초, 단계별 p50/p95 지연 시간, 최대 RSS를 출력 (실제 서점에는 요청하지 않음)
+
+- 서점 호스트(product.kyobobook.co.kr 등)의 http:// URL을 로컬 서버를 프록시로 지정한 HTTP 클라이언트로 요청하므로
+  사이트 프로필 파싱까지 실제와 같게 측정
+- 페이지마다 ISBN을 바꿔 제공하므로 모든 행이 새 아이템 (중복 확인 비용 포함)
+- MongoDB: 기본은 설정의 MongoDB에 임시 컬렉션을 만들고 끝나면 삭제, --mock-mongo면 mongomock-motor 사용
+- PostgreSQL은 사용하지 않음 (벤치마크용 컬렉션 정의를 메모리에서 제공)
+- aiohttp 필요 (pip install aiohttp)
+"""
+import argparse
+import asyncio
+import functools
+import inspect
+import io
+import json
+import os
+import random
+import re
+import resource
+import sys
+import time
+import uuid
+from collections import defaultdict
+from typing import Dict, List, Any, Optional
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi import UploadFile
+
+from backend.app.core.config import settings
+from backend.app.db import mongodb
+from backend.app.models.collection import Collection
+from backend.app.services.scraper import csv_processor, web_scraper
+from backend.app.services.scraper.csv_processor import bulk_scrape_events, indexed_rows, iter_csv_rows
+from backend.app.services.scraper.field_mapper import CompiledMapping
+from backend.app.services.scraper.http_fetcher import start_http_client, stop_http_client
+from backend.app.services.scraper.item_writer import ItemBatchWriter
+from backend.app.services.scraper.web_scraper import WebScraper
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'site_profiles')
+
+# 픽스처 이름 → (호스트, 상품 URL 경로 형식)
+FIXTURE_SITES = {
+    'kyobobook': ('product.kyobobook.co.kr', '/detail/S{n:012d}'),
+    'aladin': ('www.aladin.co.kr', '/shop/wproduct.aspx?ItemId={n}'),
+    'yes24': ('www.yes24.com', '/Product/Goods/{n}'),
+    'generic': ('books.example.test', '/books/{n}'),
+}
+
+# 벤치마크 컬렉션 (매핑 + number/date 타입 변환까지 실행되도록)
+BENCHMARK_MAPPING = {
+    'author': '저자',
+    'publisher': '출판사',
+    'publication_date': '출판일',
+    'date_published': '출판일',
+    'price': '가격',
+    'page_count': '쪽수',
+}
+BENCHMARK_FIELDS = {"fields": [
+    {"key": "title", "label": "제목", "type": "text", "required": True},
+    {"key": "저자", "label": "저자", "type": "text"},
+    {"key": "출판사", "label": "출판사", "type": "text"},
+    {"key": "출판일", "label": "출판일", "type": "date"},
+    {"key": "가격", "label": "가격", "type": "number"},
+    {"key": "쪽수", "label": "쪽수", "type": "number"},
+    {"key": "isbn", "label": "ISBN", "type": "text"},
+]}
+
+_ISBN13 = re.compile(r'97[89]\d{10}')
+_NUMBER = re.compile(r'\d+')
+
+
+class FakeBookstore:
+    """
+    픽스처 HTML을 제공하는 로컬 서점 서버
+
+    - 프록시 요청(Host 헤더의 서점 호스트)과 직접 요청(/<픽스처 이름>/...) 모두 처리
+    - latency_ms ± jitter_ms 만큼 지연 후 응답, throttle 비율만큼 429 응답
+    """
+
+    def __init__(self, sites: List[str], latency_ms: float, jitter_ms: float, throttle: float, seed: int):
+        self.pages = {}
+        for name in sites:
+            with open(os.path.join(FIXTURE_DIR, f"{name}.html"), encoding='utf-8') as f:
+                self.pages[name] = f.read()
+        self.hosts = {FIXTURE_SITES[name][0]: name for name in sites}
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.throttle = throttle
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.throttled = 0
+        self.url = ''
+        self._runner = None
+
+    async def start(self) -> str:
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_route('GET', '/{tail:.*}', self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+
+    def site_for(self, host: str, path: str) -> Optional[str]:
+        name = self.hosts.get(host.split(':')[0])
+        if name is None:
+            # 직접 요청: /<픽스처 이름>/<상품 경로>
+            name = path.lstrip('/').split('/', 1)[0]
+        return name if name in self.pages else None
+
+    async def _handle(self, request):
+        from aiohttp import web
+
+        self.requests += 1
+        name = self.site_for(request.host, request.path)
+        if name is None:
+            return web.Response(status=404, text='not found')
+
+        delay = self.latency + self.random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.throttle and self.random.random() < self.throttle:
+            self.throttled += 1
+            return web.Response(status=429, text='Too Many Requests')
+
+        # 상품 번호로 ISBN을 바꿔 행마다 다른 아이템이 되도록
+        numbers = _NUMBER.findall(request.path_qs)
+        isbn = f"979{int(numbers[-1]) % 10 ** 10:010d}" if numbers else None
+        html = _ISBN13.sub(isbn, self.pages[name]) if isbn else self.pages[name]
+        return web.Response(text=html, content_type='text/html', charset='utf-8')
+
+
+class StageTimer:
+    """단계별 소요 시간 기록 (함수를 감싸서 호출마다 기록)"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+
+    def wrap(self, owner, name: str, stage: str, skip_empty: bool = False) -> None:
+        """owner.name을 시간 기록 함수로 교체 (skip_empty: 빈 결과를 반환한 호출은 기록하지 않음)"""
+        original = getattr(owner, name)
+        samples = self.samples[stage]
+
+        if inspect.iscoroutinefunction(original):
+            @functools.wraps(original)
+            async def timed(*args, **kwargs):
+                started_at = time.perf_counter()
+                result = None
+                try:
+                    result = await original(*args, **kwargs)
+                    return result
+                finally:
+                    if result or not skip_empty:
+                        samples.append(time.perf_counter() - started_at)
+        else:
+            @functools.wraps(original)
+            def timed(*args, **kwargs):
+                started_at = time.perf_counter()
+                try:
+                    return original(*args, **kwargs)
+                finally:
+                    samples.append(time.perf_counter() - started_at)
+
+        setattr(owner, name, timed)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {
+            stage: {
+                'count': len(values),
+                'p50_ms': round(percentile(values, 50) * 1000, 3),
+                'p95_ms': round(percentile(values, 95) * 1000, 3),
+                'max_ms': round(max(values) * 1000, 3),
+            }
+            for stage, values in self.samples.items() if values
+        }
+
+
+def percentile(values: List[float], p: float) -> float:
+    """최근접 순위 백분위수"""
+    ordered = sorted(values)
+    rank = max(1, round(p / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def peak_rss_mb() -> float:
+    """프로세스 최대 RSS (MB, Linux는 KB 단위, macOS는 바이트 단위)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+class _BenchmarkSession:
+    """PostgreSQL 없이 벤치마크 컬렉션만 돌려주는 세션 (bulk_scrape_events의 컬렉션 조회용)"""
+
+    def __init__(self, collection: Collection):
+        self.collection = collection
+
+    def execute(self, _statement):
+        return self
+
+    def scalar_one_or_none(self) -> Collection:
+        return self.collection
+
+
+def build_csv(sites: List[str], count: int) -> bytes:
+    """사이트를 번갈아 가며 count개의 상품 URL이 있는 CSV"""
+    lines = ['url,purchase_date']
+    for n in range(1, count + 1):
+        host, path = FIXTURE_SITES[sites[n % len(sites)]]
+        lines.append(f"http://{host}{path.format(n=n)},2024-01-{n % 28 + 1:02d}")
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def configure(args) -> None:
+    """벤치마크용 설정 (캐시 미사용, 속도 제한/동시 처리 수 조정)"""
+    settings.SCRAPER_CACHE_ENABLED = False
+    settings.SCRAPER_HTTP_FIRST = True
+    settings.SCRAPER_BULK_MAX_WORKERS = max(settings.SCRAPER_BULK_MAX_WORKERS, args.workers)
+    settings.SCRAPER_PER_DOMAIN_CONCURRENCY = args.per_domain
+    if args.rate > 0:
+        settings.SCRAPER_RATE_LIMIT_INITIAL = args.rate
+        settings.SCRAPER_RATE_LIMIT_MAX = args.rate
+        settings.SCRAPER_RATE_LIMIT_BURST = max(settings.SCRAPER_RATE_LIMIT_BURST, args.per_domain)
+
+
+async def connect_mongo(mock: bool) -> None:
+    if not mock:
+        await mongodb.connect_to_mongodb()
+        return
+    try:
+        from mongomock_motor import AsyncMongoMockClient
+    except ImportError:
+        sys.exit("--mock-mongo에는 mongomock-motor가 필요합니다. (pip install mongomock-motor)")
+    mongodb.mongodb_client = AsyncMongoMockClient()
+
+
+async def run_bulk(urls_csv: bytes, collection: Collection, args) -> Dict[str, Any]:
+    """CSV 읽기부터 저장까지 bulk_scrape_events 실행"""
+    upload = UploadFile(file=io.BytesIO(urls_csv), filename='benchmark.csv')
+    urls, additional_data, original_rows = [], [], []
+    async for url, extra, row in iter_csv_rows(upload):
+        urls.append(url)
+        additional_data.append(extra)
+        original_rows.append(row)
+
+    counts: Dict[str, int] = defaultdict(int)
+    started_at = time.perf_counter()
+    async for event in bulk_scrape_events(
+        indexed_rows(urls, additional_data, original_rows), len(urls), collection.id,
+        BENCHMARK_MAPPING, False, _BenchmarkSession(collection),
+        workers=args.workers, force_refresh=True,
+    ):
+        counts[event['type']] += 1
+        if event['type'] == 'complete':
+            counts.update({key: event[key] for key in ('success', 'failed', 'skipped')})
+    elapsed = time.perf_counter() - started_at
+
+    return {
+        'urls': len(urls),
+        'success': counts['success'],
+        'failed': counts['failed'],
+        'skipped': counts['skipped'],
+        'blocked': counts['blocked'] > 0,
+        'elapsed_seconds': round(elapsed, 3),
+        'urls_per_second': round(len(urls) / elapsed, 2) if elapsed > 0 else 0.0,
+    }
+
+
+async def run_browser(server: FakeBookstore, sites: List[str], count: int, timer: StageTimer) -> None:
+    """WebScraper(Playwright)로 로컬 서버 직접 요청 (사이트 판별 없이 공통 메타 태그로 파싱)"""
+    timer.wrap(WebScraper, 'scrape_url', 'browser')
+    async with WebScraper() as scraper:
+        for n in range(1, count + 1):
+            name = sites[n % len(sites)]
+            url = f"{server.url}/{name}{FIXTURE_SITES[name][1].format(n=n)}"
+            try:
+                await scraper.scrape_url(url)
+            except Exception as e:
+                print(f"  [browser] 실패 {url}: {e}")
+
+
+def print_report(result: Dict[str, Any]) -> None:
+    bulk = result['bulk']
+    print(f"\n📚 URL {bulk['urls']}개: 성공 {bulk['success']}, 실패 {bulk['failed']}, "
+          f"건너뜀 {bulk['skipped']}{', 차단 감지' if bulk['blocked'] else ''}")
+    print(f"⏱  {bulk['elapsed_seconds']:.2f}초, {bulk['urls_per_second']:.2f} URL/초 "
+          f"(workers={result['workers']}, 지연 {result['latency_ms']}±{result['jitter_ms']}ms, "
+          f"429 비율 {result['throttle']})")
+    print(f"🌐 서버 요청 {result['server']['requests']}회, 429 {result['server']['throttled']}회")
+    print(f"\n{'단계':<10}{'횟수':>8}{'p50 ms':>12}{'p95 ms':>12}{'max ms':>12}")
+    for stage, stats in result['stages'].items():
+        print(f"{stage:<10}{stats['count']:>8}{stats['p50_ms']:>12.3f}{stats['p95_ms']:>12.3f}{stats['max_ms']:>12.3f}")
+    print(f"\n💾 최대 RSS: {result['peak_rss_mb']:.1f} MB")
+
+
+async def main_async(args) -> Dict[str, Any]:
+    sites = args.sites or list(FIXTURE_SITES)
+    unknown = [name for name in sites if name not in FIXTURE_SITES]
+    if unknown:
+        sys.exit(f"알 수 없는 픽스처: {', '.join(unknown)} (가능: {', '.join(FIXTURE_SITES)})")
+    try:
+        import aiohttp  # noqa: F401
+    except ImportError:
+        sys.exit("가짜 서점 서버에는 aiohttp가 필요합니다. (pip install aiohttp)")
+
+    configure(args)
+    timer = StageTimer()
+    timer.wrap(web_scraper, 'fetch_html', 'fetch')
+    timer.wrap(web_scraper, 'parse_html', 'parse')
+    timer.wrap(CompiledMapping, 'apply', 'mapping')
+    timer.wrap(csv_processor, '_scrape_with_retry', 'scrape')
+    timer.wrap(csv_processor, '_process_row', 'row')
+    timer.wrap(ItemBatchWriter, 'flush', 'insert', skip_empty=True)
+
+    server = FakeBookstore(sites, args.latency_ms, args.jitter_ms, args.throttle, args.seed)
+    await server.start()
+    await start_http_client(proxy=server.url)
+    await connect_mongo(args.mock_mongo)
+
+    mongo_collection = f"benchmark_{uuid.uuid4().hex[:12]}"
+    collection = Collection(
+        id=0, name='benchmark', slug=mongo_collection, mongo_collection=mongo_collection,
+        field_definitions=BENCHMARK_FIELDS, field_mapping={"mapping": BENCHMARK_MAPPING, "ignore_unmapped": False},
+    )
+    try:
+        bulk = await run_bulk(build_csv(sites, args.count), collection, args)
+        if args.browser:
+            await run_browser(server, sites, args.browser, timer)
+    finally:
+        if not args.keep:
+            await mongodb.get_database()[mongo_collection].drop()
+        await stop_http_client()
+        await server.stop()
+        if not args.mock_mongo:
+            await mongodb.close_mongodb_connection()
+
+    return {
+        'bulk': bulk,
+        'stages': timer.summary(),
+        'server': {'requests': server.requests, 'throttled': server.throttled},
+        'workers': args.workers,
+        'latency_ms': args.latency_ms,
+        'jitter_ms': args.jitter_ms,
+        'throttle': args.throttle,
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'mongo_collection': mongo_collection if args.keep else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CSV 일괄 등록 처리량 벤치마크 (로컬 가짜 서점 서버)")
+    parser.add_argument('sites', nargs='*', help=f"사용할 픽스처 (생략 시 전체: {', '.join(FIXTURE_SITES)})")
+    parser.add_argument('-n', '--count', type=int, default=500, help="CSV URL 수 (기본 500)")
+    parser.add_argument('-w', '--workers', type=int, default=settings.SCRAPER_BULK_WORKERS,
+                        help=f"동시 처리 수 (기본 {settings.SCRAPER_BULK_WORKERS})")
+    parser.add_argument('--per-domain', type=int, default=settings.SCRAPER_PER_DOMAIN_CONCURRENCY,
+                        help=f"도메인별 최대 동시 요청 수 (기본 {settings.SCRAPER_PER_DOMAIN_CONCURRENCY})")
+    parser.add_argument('--rate', type=float, default=100.0,
+                        help="호스트별 요청/초 고정 (기본 100, 0이면 설정값의 적응형 속도 제한 그대로)")
+    parser.add_argument('--latency-ms', type=float, default=50.0, help="서버 응답 지연 (기본 50)")
+    parser.add_argument('--jitter-ms', type=float, default=20.0, help="응답 지연 변동폭 (기본 ±20)")
+    parser.add_argument('--throttle', type=float, default=0.0, help="429 응답 비율 0~1 (기본 0)")
+    parser.add_argument('--seed', type=int, default=1, help="지연/429 난수 시드")
+    parser.add_argument('--browser', type=int, default=0, metavar='N',
+                        help="WebScraper(Playwright)로 N개 URL 추가 측정 (chromium 필요)")
+    parser.add_argument('--mock-mongo', action='store_true', help="MongoDB 대신 mongomock-motor 사용")
+    parser.add_argument('--keep', action='store_true', help="벤치마크 컬렉션을 삭제하지 않음")
+    parser.add_argument('--json', metavar='PATH', help="결과를 JSON 파일로 저장 (배포 전 비교용)")
+    args = parser.parse_args()
+
+    result = asyncio.run(main_async(args))
+    print_report(result)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"📝 결과 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+사이트 프로필 파싱 벤치마크
+scripts/fixtures/site_profiles/<프로필 이름>.html 을 프로필별로 반복 파싱하여 페이지당 시간과 추출 필드를 확인
+(네트워크/브라우저 없이 파싱 비용만 측정)
+"""
+import argparse
+import os
+import sys
+import time
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.app.services.scraper.site_parsers import parse_html
+from backend.app.services.scraper.site_profiles import site_registry
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'site_profiles')
+
+
+def benchmark_profile(name: str, url: str, html: str, iterations: int) -> None:
+    # 워밍업 (결과 확인 겸용)
+    metadata, complete = parse_html(url, html)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        parse_html(url, html)
+    elapsed = time.perf_counter() - start
+
+    per_page_ms = elapsed / iterations * 1000
+    status = "OK" if complete else "필수 필드 누락"
+    print(f"\n[{name}] {per_page_ms:.3f} ms/page ({iterations}회, {len(html):,} bytes) - {status}")
+    for key, value in sorted(metadata.items()):
+        text = str(value)
+        print(f"  {key}: {text[:80] + '...' if len(text) > 80 else text}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사이트 프로필 파싱 벤치마크")
+    parser.add_argument('profiles', nargs='*', help="측정할 프로필 이름 (생략 시 픽스처가 있는 전체)")
+    parser.add_argument('-n', '--iterations', type=int, default=200, help="반복 횟수 (기본 200)")
+    args = parser.parse_args()
+
+    profiles = site_registry.profiles()
+    if args.profiles:
+        profiles = [profile for profile in profiles if profile.name in args.profiles]
+
+    for profile in profiles:
+        fixture_path = os.path.join(FIXTURE_DIR, f"{profile.name}.html")
+        if not os.path.exists(fixture_path):
+            print(f"\n[{profile.name}] 픽스처 없음: {fixture_path}")
+            continue
+        with open(fixture_path, encoding='utf-8') as f:
+            html = f.read()
+        url = f"https://{profile.hosts[0]}/"
+        benchmark_profile(profile.name, url, html, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
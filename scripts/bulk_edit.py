@@ -0,0 +1,252 @@
+"""
+아이템 일괄 수정 스크립트
+메타데이터 조건(포함/정규식/일치/비어 있음)으로 대상을 MongoDB에서 직접 필터링하고
+배치 bulk_write로 필드를 일괄 설정 (backend/app/services/item/bulk_edit.py 사용)
+"""
+import asyncio
+import os
+import sys
+import click
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy import Column, Integer, String, JSON
+from motor.motor_asyncio import AsyncIOMotorClient
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.app.services.item.bulk_edit import (
+    CONTAINS, REGEX, EQUALS, EMPTY, NOT_EMPTY, MATCH_OPERATORS, BULK_EDIT_BATCH_SIZE,
+    build_filter, iter_matches, bulk_set_fields,
+)
+from backend.app.services.item.duplicate_keys import collection_mapping
+
+# .env 파일에서 필요한 환경변수만 로드
+env_path = os.path.join(os.path.dirname(__file__), '..', '.env')
+load_dotenv(env_path)
+
+# 필요한 환경변수 가져오기
+POSTGRES_HOST = os.getenv('POSTGRES_HOST', 'localhost')
+POSTGRES_PORT = os.getenv('POSTGRES_PORT', '5432')
+POSTGRES_USER = os.getenv('POSTGRES_USER', 'postgres')
+POSTGRES_PASSWORD = os.getenv('POSTGRES_PASSWORD', 'postgres')
+POSTGRES_DB = os.getenv('POSTGRES_DB', 'mystorage')
+
+MONGO_HOST = os.getenv('MONGO_HOST', 'localhost')
+MONGO_PORT = os.getenv('MONGO_PORT', '27017')
+MONGO_USER = os.getenv('MONGO_USER', 'admin')
+MONGO_PASSWORD = os.getenv('MONGO_PASSWORD', 'admin')
+MONGO_DB = os.getenv('MONGO_DB', 'mystorage')
+
+# DB 연결 URL
+DATABASE_URL = f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
+MONGO_URL = f"mongodb://{MONGO_USER}:{MONGO_PASSWORD}@{MONGO_HOST}:{MONGO_PORT}"
+
+# SQLAlchemy 설정
+engine = create_engine(DATABASE_URL)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+# Collection 모델 (간단한 정의만)
+class Base(DeclarativeBase):
+    pass
+
+
+class Collection(Base):
+    __tablename__ = "collections"
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    slug = Column(String, unique=True)
+    mongo_collection = Column(String)
+    field_mapping = Column(JSON)
+
+
+OPERATOR_LABELS = {
+    CONTAINS: "포함",
+    REGEX: "정규식",
+    EQUALS: "일치",
+    EMPTY: "비어 있음",
+    NOT_EMPTY: "값 있음",
+}
+
+
+def parse_condition(text: str):
+    """'필드:연산자[:값]' → (필드, 연산자, 값)"""
+    parts = text.split(':', 2)
+    if len(parts) < 2 or parts[1] not in MATCH_OPERATORS:
+        raise click.BadParameter(f"'필드:연산자[:값]' 형식이어야 합니다 (연산자: {', '.join(MATCH_OPERATORS)}): {text}")
+    field, operator = parts[0], parts[1]
+    value = parts[2] if len(parts) == 3 else None
+    if operator in (CONTAINS, REGEX, EQUALS) and value is None:
+        raise click.BadParameter(f"'{operator}' 조건에는 값이 필요합니다: {text}")
+    return field, operator, value
+
+
+def parse_change(text: str):
+    """'필드=값' → (필드, 값)"""
+    if '=' not in text:
+        raise click.BadParameter(f"'필드=값' 형식이어야 합니다: {text}")
+    field, value = text.split('=', 1)
+    return field.strip(), value
+
+
+def describe_condition(field: str, operator: str, value) -> str:
+    label = OPERATOR_LABELS[operator]
+    return f"{field} {label} '{value}'" if value is not None else f"{field} {label}"
+
+
+async def run_bulk_edit(
+    collection_name: str,
+    conditions: list,
+    changes: dict,
+    dry_run: bool = True,
+    batch_size: int = BULK_EDIT_BATCH_SIZE,
+    preview_limit: int = 50,
+):
+    """
+    조건에 맞는 아이템의 메타데이터 필드를 일괄 설정
+
+    Args:
+        collection_name: 컬렉션 이름 (slug)
+        conditions: (필드, 연산자, 값) 목록 (AND)
+        changes: {필드: 새 값}
+        dry_run: True면 실제 업데이트 없이 미리보기만
+        batch_size: bulk_write 한 번에 보내는 수정 수
+        preview_limit: 미리보기로 출력할 최대 아이템 수 (0이면 전체)
+    """
+    mongo_client = AsyncIOMotorClient(MONGO_URL)
+    db = SessionLocal()
+
+    try:
+        collection = db.execute(
+            select(Collection).where(Collection.slug == collection_name)
+        ).scalar_one_or_none()
+
+        if not collection:
+            click.echo(click.style(f"❌ 컬렉션 '{collection_name}'을 찾을 수 없습니다.", fg='red'))
+            return
+
+        if not collection.mongo_collection:
+            click.echo(click.style("❌ MongoDB 컬렉션이 설정되지 않았습니다.", fg='red'))
+            return
+
+        try:
+            query = build_filter(conditions)
+        except ValueError as e:
+            click.echo(click.style(f"❌ {e}", fg='red'))
+            return
+
+        click.echo(click.style(f"\n📚 컬렉션: {collection.name} (ID: {collection.id})", fg='blue', bold=True))
+        for condition in conditions:
+            click.echo(click.style(f"🔍 조건: {describe_condition(*condition)}", fg='cyan'))
+        for field, value in changes.items():
+            click.echo(click.style(f"✏️  변경: {field} → '{value}'", fg='cyan'))
+        click.echo("=" * 80 + "\n")
+
+        mongo_collection = mongo_client[MONGO_DB][collection.mongo_collection]
+
+        # 미리보기: 필요한 필드만 커서로 읽어 출력
+        preview_fields = ['title', *changes.keys()]
+        shown = 0
+        async for item in iter_matches(mongo_collection, query, preview_fields, limit=preview_limit):
+            shown += 1
+            metadata = item.get('metadata', {})
+            click.echo(f"{shown}. {metadata.get('title', '(제목 없음)')}")
+            for field, value in changes.items():
+                current = metadata.get(field)
+                current_display = f"'{current}'" if current else "(없음)"
+                click.echo(click.style(f"   {field}: {current_display} → '{value}'", fg='bright_black'))
+
+        if not shown:
+            click.echo(click.style("⚠️  조건과 일치하는 아이템이 없습니다.", fg='yellow'))
+            return
+
+        result = await bulk_set_fields(mongo_collection, query, changes, dry_run=True)
+        click.echo()
+        if result.matched > shown:
+            click.echo(click.style(f"... 외 {result.matched - shown}개", fg='bright_black'))
+        click.echo(click.style(f"✅ {result.matched}개의 아이템을 찾았습니다.", fg='green', bold=True))
+
+        if dry_run:
+            click.echo("=" * 80)
+            click.echo(click.style("🔍 DRY RUN 모드: 실제로 업데이트되지 않았습니다.", fg='yellow', bold=True))
+            click.echo(click.style("실제로 업데이트하려면 --execute 플래그를 사용하세요.", fg='yellow'))
+            return
+
+        click.echo("=" * 80)
+        click.echo(click.style("⚙️  업데이트를 시작합니다...\n", fg='blue', bold=True))
+
+        async def report(progress):
+            click.echo(f"   {progress.matched}개 처리 ({progress.modified}개 수정)")
+
+        result = await bulk_set_fields(
+            mongo_collection, query, changes, dry_run=False, batch_size=batch_size, on_batch=report,
+            mapping=collection_mapping(collection),
+        )
+
+        click.echo(f"\n{'='*80}")
+        click.echo(click.style(
+            f"🎉 완료! {result.modified}/{result.matched}개 아이템이 업데이트되었습니다.", fg='green', bold=True
+        ))
+        if result.failed:
+            click.echo(click.style(f"❌ 실패: {result.failed}개", fg='red'))
+        click.echo(click.style(
+            f"⏱  {result.elapsed:.2f}초, {result.rate:,.0f}개/초 (배치 {result.batches}회)", fg='bright_black'
+        ))
+
+    except Exception as e:
+        click.echo(click.style(f"❌ 오류 발생: {str(e)}", fg='red', bold=True))
+        import traceback
+        traceback.print_exc()
+    finally:
+        db.close()
+        mongo_client.close()
+
+
+@click.command()
+@click.option('--collection', '-c', required=True, help='컬렉션 이름 (slug)')
+@click.option('--where', '-w', 'conditions', multiple=True, required=True,
+              help=f"조건 '필드:연산자[:값]' (여러 개는 AND, 연산자: {', '.join(MATCH_OPERATORS)})")
+@click.option('--set', '-s', 'changes', multiple=True, required=True, help="변경 '필드=값' (여러 개 가능)")
+@click.option('--execute', is_flag=True, help='실제로 업데이트 실행 (없으면 미리보기만)')
+@click.option('--batch-size', default=BULK_EDIT_BATCH_SIZE, show_default=True, help='bulk_write 한 번에 보내는 수정 수')
+@click.option('--preview', default=50, show_default=True, help='미리보기로 출력할 최대 아이템 수 (0이면 전체)')
+def main(collection: str, conditions: tuple, changes: tuple, execute: bool, batch_size: int, preview: int):
+    """
+    아이템 일괄 수정 스크립트
+
+    조건에 맞는 아이템의 메타데이터 필드를 일괄 설정합니다.
+
+    예시:
+
+        # 제목에 "원피스"가 포함되고 시리즈가 없는 아이템 미리보기
+        python scripts/bulk_edit.py -c books -w "title:contains:원피스" -w "series:empty" -s "series=원피스"
+
+        # 출판사명 정리 (실제 업데이트)
+        python scripts/bulk_edit.py -c books -w "publisher:regex:^대원\\s*씨아이" -s "publisher=대원씨아이" --execute
+    """
+    try:
+        parsed_conditions = [parse_condition(text) for text in conditions]
+        parsed_changes = dict(parse_change(text) for text in changes)
+    except click.BadParameter as e:
+        raise click.UsageError(str(e))
+
+    click.echo("""
+╔════════════════════════════════════════════════════════════════╗
+║                     아이템 일괄 수정 스크립트                    ║
+╚════════════════════════════════════════════════════════════════╝
+    """)
+
+    asyncio.run(run_bulk_edit(
+        collection_name=collection,
+        conditions=parsed_conditions,
+        changes=parsed_changes,
+        dry_run=not execute,
+        batch_size=batch_size,
+        preview_limit=preview,
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+아이템 내보내기 스크립트
+컬렉션 아이템을 CSV / JSONL / Parquet 파일로 스트리밍 저장 (backend/app/services/item/export.py 사용)
+"""
+import asyncio
+import os
+import sys
+import time
+import click
+from sqlalchemy import select
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.app.db.base import SessionLocal
+from backend.app.db.mongodb import connect_to_mongodb, close_mongodb_connection, get_database
+from backend.app.models import Collection
+from backend.app.services.item.export import ItemExporter, EXPORT_FORMATS, EXPORT_BATCH_SIZE
+
+
+async def export_collection(collection_name: str, fmt: str, output: str, batch_size: int, only_public: bool):
+    """컬렉션(slug)의 아이템을 output 파일로 내보내기"""
+    db = SessionLocal()
+    await connect_to_mongodb()
+
+    try:
+        collection = db.execute(
+            select(Collection).where(Collection.slug == collection_name)
+        ).scalar_one_or_none()
+
+        if not collection:
+            click.echo(click.style(f"❌ 컬렉션 '{collection_name}'을 찾을 수 없습니다.", fg='red'))
+            return
+
+        if not collection.mongo_collection:
+            click.echo(click.style("❌ MongoDB 컬렉션이 설정되지 않았습니다.", fg='red'))
+            return
+
+        try:
+            exporter = ItemExporter(
+                get_database()[collection.mongo_collection],
+                fmt,
+                query={"is_public": True} if only_public else {},
+                field_definitions=collection.field_definitions,
+                batch_size=batch_size,
+            )
+        except ValueError as e:
+            click.echo(click.style(f"❌ {e}", fg='red'))
+            return
+
+        output = output or exporter.filename(collection.slug)
+        click.echo(click.style(f"\n📚 컬렉션: {collection.name} (ID: {collection.id})", fg='blue', bold=True))
+        click.echo(click.style(f"💾 출력: {output} ({fmt})", fg='cyan'))
+
+        started_at = time.perf_counter()
+        written = 0
+        with open(output, 'wb') as f:
+            async for chunk in exporter.stream():
+                f.write(chunk)
+                written += len(chunk)
+        elapsed = time.perf_counter() - started_at
+
+        rate = exporter.exported / elapsed if elapsed > 0 else 0
+        click.echo(click.style(
+            f"🎉 완료! {exporter.exported}개 아이템, {written:,} bytes", fg='green', bold=True
+        ))
+        click.echo(click.style(f"⏱  {elapsed:.2f}초, {rate:,.0f}개/초", fg='bright_black'))
+
+    finally:
+        db.close()
+        await close_mongodb_connection()
+
+
+@click.command()
+@click.option('--collection', '-c', required=True, help='컬렉션 이름 (slug)')
+@click.option('--format', '-f', 'fmt', type=click.Choice(list(EXPORT_FORMATS)), default='csv', show_default=True,
+              help='내보내기 형식')
+@click.option('--output', '-o', default=None, help='출력 파일 경로 (기본: <slug>.<확장자>)')
+@click.option('--batch-size', default=EXPORT_BATCH_SIZE, show_default=True, help='커서에서 한 번에 읽는 아이템 수')
+@click.option('--only-public', is_flag=True, help='공개 아이템만 내보내기')
+def main(collection: str, fmt: str, output: str, batch_size: int, only_public: bool):
+    """
+    아이템 내보내기 스크립트
+
+    예시:
+
+        # CSV (field_definitions 순서로 열 구성)
+        python scripts/export_items.py -c books
+
+        # JSONL (백업/다시 가져오기용)
+        python scripts/export_items.py -c books -f jsonl -o backup/books.jsonl
+
+        # Parquet (pyarrow 필요)
+        python scripts/export_items.py -c books -f parquet
+    """
+    asyncio.run(export_collection(collection, fmt, output, batch_size, only_public))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+아이템 일괄 수정 스크립트 테스트 (scripts/bulk_edit.py)
+
+PostgreSQL/MongoDB 없이 컬렉션 조회와 bulk_edit 호출을 대체하여 run_bulk_edit 전체 흐름을 실행
+"""
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+for module in ("click", "dotenv", "motor", "psycopg2", "sqlalchemy", "pydantic_settings"):
+    pytest.importorskip(module)
+
+from backend.app.services.item.bulk_edit import BulkEditResult  # noqa: E402
+
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / "scripts" / "bulk_edit.py"
+
+
+@pytest.fixture
+def script():
+    spec = importlib.util.spec_from_file_location("bulk_edit_script", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+
+class FakeSession:
+    def __init__(self, collection):
+        self.collection = collection
+        self.closed = False
+
+    def execute(self, statement):
+        return FakeResult(self.collection)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeDatabase:
+    def __getitem__(self, name):
+        return name
+
+
+class FakeMongoClient:
+    def __init__(self, url):
+        self.closed = False
+
+    def __getitem__(self, name):
+        return FakeDatabase()
+
+    def close(self):
+        self.closed = True
+
+
+def test_run_bulk_edit_execute_passes_collection_mapping(script, monkeypatch, capsys):
+    """--execute 실행 시 컬렉션의 필드 매핑을 읽어 bulk_set_fields에 전달 (예외 없이 완료)"""
+    collection = script.Collection(
+        id=1, name="책", slug="books", mongo_collection="items_books",
+        field_mapping={"mapping": {"source_url": "출처"}, "ignore_unmapped": False},
+    )
+    session = FakeSession(collection)
+    monkeypatch.setattr(script, "SessionLocal", lambda: session)
+    monkeypatch.setattr(script, "AsyncIOMotorClient", FakeMongoClient)
+
+    async def iter_matches(mongo_collection, query, fields, limit=0):
+        yield {"metadata": {"title": "원피스 1", "series": None}}
+
+    calls = []
+
+    async def bulk_set_fields(mongo_collection, query, changes, dry_run=True, **kwargs):
+        calls.append({"dry_run": dry_run, **kwargs})
+        result = BulkEditResult(dry_run)
+        result.matched = 1
+        result.modified = 0 if dry_run else 1
+        return result.finish()
+
+    monkeypatch.setattr(script, "iter_matches", iter_matches)
+    monkeypatch.setattr(script, "bulk_set_fields", bulk_set_fields)
+
+    asyncio.run(script.run_bulk_edit(
+        "books", [("title", script.CONTAINS, "원피스")], {"series": "원피스"}, dry_run=False,
+    ))
+
+    out = capsys.readouterr().out
+    assert "오류 발생" not in out
+    assert "1/1개 아이템이 업데이트되었습니다" in out
+    assert [call["dry_run"] for call in calls] == [True, False]
+    assert calls[1]["mapping"] == {"source_url": "출처"}
+    assert session.closed
@@ -0,0 +1,122 @@
+"""
+아이템 목록 전체 개수 캐시 테스트 (backend.app.services.item.count_cache)
+
+MongoDB 대신 count_documents 호출 수를 세는 가짜 컬렉션 사용
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("pydantic_settings")
+
+from backend.app.services.item import count_cache  # noqa: E402
+from backend.app.services.item.count_cache import ItemCountCache  # noqa: E402
+
+PUBLIC = {"is_public": True}
+
+
+class FakeCollection:
+    def __init__(self, name: str = "items_books", total: int = 10, estimated: int = 100):
+        self.name = name
+        self.total = total
+        self.estimated = estimated
+        self.counts = 0
+        self.on_count = None
+
+    async def count_documents(self, query):
+        self.counts += 1
+        if self.on_count:
+            self.on_count()
+        return self.total
+
+    async def estimated_document_count(self):
+        return self.estimated
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(count_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def count(cache: ItemCountCache, collection: FakeCollection, query) -> int:
+    return asyncio.run(cache.count(collection, query))
+
+
+def test_empty_query_uses_estimated_count():
+    collection = FakeCollection()
+    assert count(ItemCountCache(30, 10), collection, {}) == 100
+    assert collection.counts == 0
+
+
+def test_repeated_query_is_served_from_cache(clock):
+    cache = ItemCountCache(30, 10)
+    collection = FakeCollection()
+    assert count(cache, collection, {"is_public": True, "search_tokens": {"$all": ["해리"]}}) == 10
+    collection.total = 11
+    # 키 순서가 달라도 같은 조건
+    assert count(cache, collection, {"search_tokens": {"$all": ["해리"]}, "is_public": True}) == 10
+    assert collection.counts == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = ItemCountCache(30, 10)
+    collection = FakeCollection()
+    count(cache, collection, PUBLIC)
+    collection.total = 12
+    clock[0] += 29
+    assert count(cache, collection, PUBLIC) == 10
+    clock[0] += 1
+    assert count(cache, collection, PUBLIC) == 12
+    assert collection.counts == 2
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = ItemCountCache(30, 2)
+    collection = FakeCollection()
+    first, second, third = PUBLIC, {"is_public": False}, {"metadata.series": "원피스"}
+    count(cache, collection, first)
+    count(cache, collection, second)
+    count(cache, collection, first)  # first를 최근 사용으로
+    count(cache, collection, third)  # second가 밀려남
+    assert collection.counts == 3
+
+    count(cache, collection, first)
+    assert collection.counts == 3
+    count(cache, collection, second)
+    assert collection.counts == 4
+
+
+def test_invalidate_bumps_generation_for_one_collection(clock):
+    cache = ItemCountCache(30, 10)
+    books, comics = FakeCollection("items_books"), FakeCollection("items_comics")
+    count(cache, books, PUBLIC)
+    count(cache, comics, PUBLIC)
+
+    cache.invalidate("items_books")
+    books.total = 11
+    assert count(cache, books, PUBLIC) == 11
+    assert count(cache, comics, PUBLIC) == 10
+    assert (books.counts, comics.counts) == (2, 1)
+
+
+def test_count_is_not_stored_when_written_during_count(clock):
+    """count_documents 도중 무효화되면 (이전 세대의) 결과를 저장하지 않음"""
+    cache = ItemCountCache(30, 10)
+    collection = FakeCollection()
+    collection.on_count = lambda: cache.invalidate(collection.name)
+    count(cache, collection, PUBLIC)
+    collection.on_count = None
+    count(cache, collection, PUBLIC)
+    assert collection.counts == 2
+    assert cache.stats()["entries"] == 1
+
+
+def test_disabled_cache_always_counts():
+    cache = ItemCountCache(0, 10)
+    collection = FakeCollection()
+    count(cache, collection, PUBLIC)
+    count(cache, collection, PUBLIC)
+    assert collection.counts == 2
@@ -0,0 +1,222 @@
+"""
+CSV 일괄 등록 처리 테스트 (backend.app.services.scraper.csv_processor)
+
+업로드 파일은 메모리 버퍼로 대체하고, CSV_READ_CHUNK_SIZE를 줄여 청크 경계를 넘는 경우를 확인
+"""
+import asyncio
+import io
+
+import pytest
+
+for module in ("fastapi", "motor", "pydantic_settings", "sqlalchemy", "lxml"):
+    pytest.importorskip(module)
+
+from backend.app.services.scraper import csv_processor  # noqa: E402
+
+
+class FakeUpload:
+    """UploadFile.read(size)만 흉내내는 업로드 파일"""
+
+    def __init__(self, content: bytes):
+        self._buffer = io.BytesIO(content)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+
+def read_records(content: bytes) -> list:
+    async def collect():
+        return [row async for row in csv_processor.iter_csv_records(FakeUpload(content))]
+    return asyncio.run(collect())
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(csv_processor, "CSV_READ_CHUNK_SIZE", 8)
+
+
+def test_utf8_with_bom(small_chunks):
+    content = "﻿url,제목\nhttps://a.example/1,해리포터\n".encode("utf-8")
+    assert read_records(content) == [{"url": "https://a.example/1", "제목": "해리포터"}]
+
+
+def test_cp949_fallback(small_chunks):
+    content = "url,구매일\nhttps://a.example/1,2024년 1월\n".encode("cp949")
+    assert read_records(content) == [{"url": "https://a.example/1", "구매일": "2024년 1월"}]
+
+
+def test_cp949_after_ascii_prefix_spanning_chunks(small_chunks):
+    """앞부분이 ASCII뿐이라 UTF-8로 시작한 뒤 다음 청크에서 CP949로 전환"""
+    content = ("url,memo\n" + "https://a.example/1,ok\n" * 3 + "https://a.example/2,한글 메모\n").encode("cp949")
+    records = read_records(content)
+    assert len(records) == 4
+    assert records[-1] == {"url": "https://a.example/2", "memo": "한글 메모"}
+
+
+def test_quoted_newline_split_across_chunks(small_chunks):
+    content = 'url,memo\nhttps://a.example/1,"첫 줄\n둘째 줄, 쉼표"\nhttps://a.example/2,끝\n'.encode("utf-8")
+    assert read_records(content) == [
+        {"url": "https://a.example/1", "memo": "첫 줄\n둘째 줄, 쉼표"},
+        {"url": "https://a.example/2", "memo": "끝"},
+    ]
+
+
+def test_crlf_split_between_chunks(monkeypatch):
+    monkeypatch.setattr(csv_processor, "CSV_READ_CHUNK_SIZE", 10)
+    content = b"url,memo\r\nhttps://a\r\n"  # 두 번째 청크가 \r 다음에서 끊김
+    assert read_records(content) == [{"url": "https://a", "memo": None}]
+
+
+def test_invalid_encoding_is_rejected(small_chunks):
+    content = "url,memo\nhttps://a.example/1,한글\n".encode("utf-8") + b"\xff\xfe\xfd\n"
+    with pytest.raises(ValueError, match="인코딩"):
+        read_records(content)
+
+
+def test_rows_without_url_column_are_rejected():
+    async def collect():
+        return [row async for row in csv_processor.iter_csv_rows(FakeUpload("제목\n해리포터\n".encode("utf-8")))]
+    with pytest.raises(ValueError, match="URL"):
+        asyncio.run(collect())
+
+
+def test_rows_split_url_extra_and_original():
+    content = "URL,title,구매일\nhttps://a.example/1,무시,2024-01-05\n,빈 URL,\n".encode("utf-8")
+
+    async def collect():
+        return [row async for row in csv_processor.iter_csv_rows(FakeUpload(content))]
+
+    assert asyncio.run(collect()) == [(
+        "https://a.example/1",
+        {"구매일": "2024-01-05"},
+        {"URL": "https://a.example/1", "title": "무시", "구매일": "2024-01-05"},
+    )]
+
+
+class FakeWriter:
+    """ItemBatchWriter 대체 (추가한 문서를 다음 flush에서 바로 저장된 것으로 반환)"""
+
+    def __init__(self, *args, **kwargs):
+        self.pending = []
+
+    def add(self, key, document):
+        self.pending.append((key, document))
+
+    def time_until_flush(self):
+        return None
+
+    def should_flush(self):
+        return bool(self.pending)
+
+    async def flush(self):
+        flushed = [(key, {**document, "_id": f"item-{key}"}, None, None) for key, document in self.pending]
+        self.pending = []
+        return flushed
+
+
+class FakeDuplicateChecker:
+    def __init__(self, mongo_collection_name, mode):
+        self.mode = mode
+
+    async def prepare(self):
+        pass
+
+
+class FakeSession:
+    def execute(self, statement):
+        return self
+
+    def scalar_one_or_none(self):
+        return None
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """bulk_scrape_events의 저장/중복 감지/스크래핑을 대체하고 행 처리 동시 실행 수를 기록"""
+    from backend.app.services.scraper.artifact_store import MemoryArtifactStore
+
+    state = {"active": 0, "peak": 0, "store": MemoryArtifactStore(3600, 10 ** 6)}
+
+    async def get_mongo_collection_name(collection_id, db):
+        return "items_test"
+
+    async def process_row(idx, row, collection_id, mapping, mapper, dedup, force_refresh=False):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        if "blocked" in row[0]:
+            return {"status": "blocked", "error": "제목을 찾을 수 없습니다"}
+        return {"status": "success", "document": {"metadata": {"source_url": row[0]}}, "tier": "http"}
+
+    monkeypatch.setattr(csv_processor, "get_mongo_collection_name", get_mongo_collection_name)
+    monkeypatch.setattr(csv_processor, "ItemBatchWriter", FakeWriter)
+    monkeypatch.setattr(csv_processor, "DuplicateChecker", FakeDuplicateChecker)
+    monkeypatch.setattr(csv_processor, "_process_row", process_row)
+    monkeypatch.setattr(csv_processor, "get_artifact_store", lambda: state["store"])
+    return state
+
+
+def run_events(urls: list, workers: int) -> list:
+    original_rows = [{"url": url, "memo": f"메모 {idx}"} for idx, url in enumerate(urls)]
+
+    async def collect():
+        rows = csv_processor.indexed_rows(urls, [{} for _ in urls], original_rows)
+        return [
+            event async for event in csv_processor.bulk_scrape_events(
+                rows, len(urls), 1, {}, False, FakeSession(), workers=workers,
+            )
+        ]
+    return asyncio.run(collect())
+
+
+def test_blocked_job_stores_remaining_rows_as_csv(pipeline, monkeypatch):
+    """차단되면 차단된 행과 배정되지 않은 행을 원본 열 그대로 남은 CSV로 저장"""
+    monkeypatch.setattr(csv_processor, "REMAINING_CSV_WRITE_CHUNK_SIZE", 16)
+    urls = ["https://a.example/0", "https://a.example/blocked", *[f"https://a.example/{i}" for i in range(2, 6)]]
+    events = run_events(urls, workers=1)
+
+    blocked = next(event for event in events if event["type"] == "blocked")
+    assert blocked["index"] == 2
+    assert blocked["remaining_count"] == 5
+    assert events[-1] == {"type": "complete", "total": 6, "success": 1, "failed": 0, "skipped": 0, "blocked": True}
+
+    async def read_artifact():
+        artifact = await pipeline["store"].open(blocked["download_token"])
+        return b"".join([chunk async for chunk in artifact.chunks]).decode("utf-8")
+
+    lines = asyncio.run(read_artifact()).splitlines()
+    assert lines[0] == "﻿url,memo"
+    assert lines[1:] == [f"{url},메모 {idx}" for idx, url in enumerate(urls) if idx >= 1]
+
+
+@pytest.mark.parametrize("workers, expected", [(None, 4), (0, 1), (3, 3), (100, 8)])
+def test_worker_count_is_clamped(monkeypatch, workers, expected):
+    monkeypatch.setattr(csv_processor.settings, "SCRAPER_BULK_WORKERS", 4)
+    monkeypatch.setattr(csv_processor.settings, "SCRAPER_BULK_MAX_WORKERS", 8)
+    assert csv_processor._resolve_worker_count(workers) == expected
+
+
+def test_worker_pool_runs_rows_concurrently_up_to_workers(pipeline):
+    urls = [f"https://host{i}.example/{i}" for i in range(10)]
+    events = run_events(urls, workers=3)
+
+    assert pipeline["peak"] == 3
+    progress = [event for event in events if event["type"] == "progress"]
+    assert sorted(event["index"] for event in progress) == list(range(1, 11))
+    assert events[-1] == {"type": "complete", "total": 10, "success": 10, "failed": 0, "skipped": 0}
+
+
+def test_single_worker_processes_rows_in_order(pipeline):
+    urls = [f"https://host{i}.example/{i}" for i in range(5)]
+    events = run_events(urls, workers=1)
+
+    assert pipeline["peak"] == 1
+    assert [event["index"] for event in events if event["type"] == "progress"] == [1, 2, 3, 4, 5]
+
+
+def test_same_domain_rows_respect_per_domain_limit(pipeline, monkeypatch):
+    monkeypatch.setattr(csv_processor.settings, "SCRAPER_PER_DOMAIN_CONCURRENCY", 2)
+    urls = [f"https://kyobobook.co.kr/{i}" for i in range(8)]
+    run_events(urls, workers=6)
+    assert pipeline["peak"] == 2
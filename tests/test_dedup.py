@@ -0,0 +1,58 @@
+"""
+CSV 일괄 등록 중복 감지 테스트 (backend.app.services.scraper.dedup)
+
+MongoDB 대신 조회 결과가 없는 가짜 컬렉션으로 같은 작업 안의 행 사이 중복만 확인
+"""
+import asyncio
+
+import pytest
+
+for module in ("fastapi", "motor", "pydantic_settings", "sqlalchemy"):
+    pytest.importorskip(module)
+
+from backend.app.services.scraper import dedup  # noqa: E402
+
+
+class EmptyCollection:
+    """기존 아이템이 없는 컬렉션 (조회마다 이벤트 루프에 양보하여 동시 처리를 흉내)"""
+
+    name = "items_test"
+
+    async def find_one(self, query, projection=None):
+        await asyncio.sleep(0)
+        return None
+
+
+@pytest.fixture
+def checker(monkeypatch):
+    def factory(mode):
+        monkeypatch.setattr(dedup, "get_database", lambda: {"items_test": EmptyCollection()})
+        return dedup.DuplicateChecker("items_test", mode)
+    return factory
+
+
+@pytest.mark.parametrize("mode", [dedup.SKIP, dedup.UPDATE])
+def test_concurrent_rows_with_same_key_reserve_once(checker, mode):
+    """같은 키의 두 행을 동시에 확인하면 먼저 확인한 행만 통과하고 뒤 행은 그 행의 중복"""
+    duplicates = checker(mode)
+    keys = {"source": "kyobobook.co.kr/product/1"}
+
+    async def run():
+        return await asyncio.gather(duplicates.find(0, keys), duplicates.find(1, keys))
+
+    first, second = asyncio.run(run())
+    assert first is None
+    assert second == {"reason": "source", "row": 1}
+
+
+def test_release_lets_later_row_take_key(checker):
+    """실패한 행의 예약을 해제하면 같은 키의 뒤 행이 처리됨"""
+    duplicates = checker(dedup.SKIP)
+    keys = {"isbn": "9788934942467"}
+
+    async def run():
+        assert await duplicates.find(0, keys) is None
+        duplicates.release(0, keys)
+        return await duplicates.find(1, keys)
+
+    assert asyncio.run(run()) is None
@@ -0,0 +1,68 @@
+"""
+아이템 중복 감지 키 테스트 (backend.app.services.item.duplicate_keys)
+"""
+import pytest
+
+for module in ("motor", "pydantic_settings", "sqlalchemy"):
+    pytest.importorskip(module)
+
+from backend.app.services.item.duplicate_keys import (  # noqa: E402
+    dedup_keys, dedup_keys_changed, find_isbn, item_dedup_keys, normalize_isbn,
+)
+
+KYOBO_URL = "https://product.kyobobook.co.kr/detail/S000001713046"
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("9788934942467", "9788934942467"),
+    ("978-89-349-4246-7", "9788934942467"),
+    (" 978 89 349 4246 7 ", "9788934942467"),
+    ("8934942460", "9788934942467"),  # ISBN-10 → 978 접두어 + 체크 숫자 재계산
+    ("89-349-4246-0", "9788934942467"),
+    ("080442957x", "9780804429573"),  # 체크 숫자 X
+    (9788934942467, "9788934942467"),
+])
+def test_normalize_isbn(value, expected):
+    assert normalize_isbn(value) == expected
+
+
+@pytest.mark.parametrize("value", [None, "", "12345", "97889349424", "ISBN 없음", "89349424XX"])
+def test_normalize_isbn_rejects_invalid_values(value):
+    assert normalize_isbn(value) is None
+
+
+def test_find_isbn_uses_mapped_key():
+    data = {"국제표준도서번호": "89-349-4246-0"}
+    assert find_isbn(data) is None
+    assert find_isbn(data, {"isbn": "국제표준도서번호"}) == "9788934942467"
+    assert find_isbn({"isbn": "없음", "ISBN": "8934942460"}) == "9788934942467"
+
+
+def test_dedup_keys_uses_source_key_and_skips_missing_values():
+    assert dedup_keys(KYOBO_URL + "?utm_source=x", "9788934942467") == {
+        "source": "kyobobook:S000001713046", "isbn": "9788934942467",
+    }
+    assert dedup_keys(None, "9788934942467") == {"isbn": "9788934942467"}
+    assert dedup_keys("", None) == {}
+
+
+def test_item_dedup_keys_follows_mapping():
+    metadata = {"출처": KYOBO_URL, "ISBN": "8934942460", "source_url": ["목록은 무시"]}
+    assert item_dedup_keys(metadata) == {"isbn": "9788934942467"}
+    assert item_dedup_keys(metadata, {"source_url": "출처"}) == {
+        "source": "kyobobook:S000001713046", "isbn": "9788934942467",
+    }
+    assert item_dedup_keys(None) == {}
+
+
+@pytest.mark.parametrize("values, mapping, expected", [
+    ({"metadata.title": "원피스"}, None, False),
+    ({"metadata.source_url": KYOBO_URL}, None, True),
+    ({"metadata.ISBN": "8934942460"}, None, True),
+    ({"metadata": {}}, None, True),
+    ({"metadata.출처": KYOBO_URL}, None, False),
+    ({"metadata.출처": KYOBO_URL}, {"source_url": "출처"}, True),
+    ({"is_public": True}, None, False),
+])
+def test_dedup_keys_changed(values, mapping, expected):
+    assert dedup_keys_changed(values, mapping) is expected
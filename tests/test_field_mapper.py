@@ -0,0 +1,148 @@
+"""
+필드 매핑 변환기 테스트 (backend.app.services.scraper.field_mapper)
+"""
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import pytest
+
+for module in ("pydantic_settings", "sqlalchemy"):
+    pytest.importorskip(module)
+
+from backend.app.services.scraper import field_mapper  # noqa: E402
+from backend.app.services.scraper.field_mapper import (  # noqa: E402
+    CompiledMapping, coerce_date, coerce_number, compiled_mapping_for, parse_mapping_config,
+)
+
+FIELD_DEFINITIONS = {"fields": [
+    {"key": "가격", "type": "number"},
+    {"key": "출간일", "type": "date"},
+    {"key": "제목", "type": "text"},
+]}
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("12,000원", 12000),
+    ("320쪽", 320),
+    ("평점 4.5", 4.5),
+    ("-3", -3),
+    ("가격 없음", "가격 없음"),
+    (12000, 12000),
+    (None, None),
+])
+def test_coerce_number(value, expected):
+    assert coerce_number(value) == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2024.01.05", "2024-01-05"),
+    ("2024-1-5", "2024-01-05"),
+    ("2024/01/05", "2024-01-05"),
+    ("2024년 1월 5일", "2024-01-05"),
+    ("출간 2024.01.05.", "2024-01-05"),
+    ("20240105", "2024-01-05"),
+    ("2024.01", "2024-01"),
+    ("2024년 12월", "2024-12"),
+    (datetime(2024, 1, 5, 12, 30), "2024-01-05"),
+    (date(2024, 1, 5), "2024-01-05"),
+])
+def test_coerce_date(value, expected):
+    assert coerce_date(value) == expected
+
+
+@pytest.mark.parametrize("value", ["2024.02.30", "2024.13", "미정", "", 20240105, None])
+def test_coerce_date_keeps_unparsable_value(value):
+    assert coerce_date(value) == value
+
+
+def test_unmapped_keys_are_kept_by_default():
+    compiled = CompiledMapping({"title": "제목"})
+    assert compiled.apply({"title": "원피스", "author": "오다"}) == {"제목": "원피스", "author": "오다"}
+
+
+def test_ignore_unmapped_drops_unmapped_keys():
+    compiled = CompiledMapping({"title": "제목"}, ignore_unmapped=True)
+    assert compiled.apply({"title": "원피스", "author": "오다"}) == {"제목": "원피스"}
+
+
+def test_empty_target_excludes_key():
+    compiled = CompiledMapping({"title": "제목", "image_url": ""})
+    assert compiled.apply({"title": "원피스", "image_url": "https://a.example/1.jpg"}) == {"제목": "원피스"}
+    compiled = CompiledMapping({"title": "제목", "image_url": ""}, ignore_unmapped=True)
+    assert compiled.apply({"title": "원피스", "image_url": "https://a.example/1.jpg"}) == {"제목": "원피스"}
+
+
+def test_mapped_fields_are_coerced_by_definition_type():
+    compiled = CompiledMapping({"price": "가격", "pub_date": "출간일", "title": "제목"}, False, FIELD_DEFINITIONS)
+    assert compiled.apply({"price": "12,000원", "pub_date": "2024년 1월 5일", "title": "320쪽"}) == {
+        "가격": 12000, "출간일": "2024-01-05", "제목": "320쪽",
+    }
+
+
+def test_without_mapping_input_is_returned_unchanged():
+    """매핑이 없으면 field_definitions가 있어도 변환하지 않고 같은 객체를 반환"""
+    compiled = CompiledMapping({}, True, FIELD_DEFINITIONS)
+    data = {"가격": "12,000원", "출간일": "2024.01.05"}
+    assert compiled.is_identity
+    assert not compiled.ignore_unmapped
+    assert compiled.apply(data) is data
+    documents = [data]
+    assert compiled.apply_many(documents) is documents
+
+
+def test_apply_many_maps_each_document():
+    compiled = CompiledMapping({"title": "제목"}, True)
+    assert compiled.apply_many([{"title": "1"}, {"title": "2", "x": 1}]) == [{"제목": "1"}, {"제목": "2"}]
+
+
+@pytest.mark.parametrize("config, expected", [
+    ({"mapping": {"title": "제목"}, "ignore_unmapped": True}, ({"title": "제목"}, True)),
+    ({"mapping": None, "ignore_unmapped": False}, ({}, False)),
+    ({"ignore_unmapped": True}, ({}, True)),
+    ({"title": "제목"}, ({"title": "제목"}, False)),  # 레거시 형식
+    (None, ({}, False)),
+    ("title", ({}, False)),
+])
+def test_parse_mapping_config(config, expected):
+    assert parse_mapping_config(config) == expected
+
+
+def _collection(updated_at=None, field_mapping=None):
+    return SimpleNamespace(
+        id=1, created_at=datetime(2024, 1, 1), updated_at=updated_at,
+        field_mapping=field_mapping or {"mapping": {"title": "제목"}, "ignore_unmapped": True},
+        field_definitions=FIELD_DEFINITIONS,
+    )
+
+
+@pytest.fixture
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(field_mapper, "_cache", field_mapper.OrderedDict())
+
+
+def test_compiled_mapping_for_is_cached_per_collection_version(empty_cache):
+    first = compiled_mapping_for(_collection())
+    assert compiled_mapping_for(_collection()) is first
+    assert first.apply({"title": "원피스", "x": 1}) == {"제목": "원피스"}
+
+    # 저장하면 수정 시각이 바뀌어 새 매핑으로 다시 컴파일
+    updated = compiled_mapping_for(_collection(datetime(2024, 2, 1), {"mapping": {"title": "책제목"}}))
+    assert updated is not first
+    assert updated.apply({"title": "원피스", "x": 1}) == {"책제목": "원피스", "x": 1}
+
+
+def test_compiled_mapping_for_without_apply_mapping_is_identity(empty_cache):
+    compiled = compiled_mapping_for(_collection(), apply_mapping=False)
+    assert compiled.is_identity
+    assert compiled is not compiled_mapping_for(_collection())
+
+
+def test_cache_evicts_least_recently_used(empty_cache, monkeypatch):
+    monkeypatch.setattr(field_mapper, "MAPPING_CACHE_SIZE", 2)
+    first = field_mapper.get_compiled_mapping({"a": "1"})
+    second = field_mapper.get_compiled_mapping({"b": "2"})
+    assert field_mapper.get_compiled_mapping({"a": "1"}) is first  # a를 최근 사용으로
+    field_mapper.get_compiled_mapping({"c": "3"})  # b가 밀려남
+    assert field_mapper.get_compiled_mapping({"a": "1"}) is first
+    assert len(field_mapper._cache) == 2
+    assert field_mapper.get_compiled_mapping({"b": "2"}) is not second
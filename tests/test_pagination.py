@@ -0,0 +1,182 @@
+"""
+아이템 목록 커서 페이지네이션 테스트 (backend.app.services.item.pagination)
+
+커서 인코딩/조건 생성은 MongoDB 없이 확인하고, 타입이 섞인 정렬 필드를 페이지 단위로 끝까지 따라가는 테스트는
+설정(MONGO_*)의 서버에 임시 컬렉션을 만들어 실행 (서버에 연결할 수 없으면 건너뜀)
+"""
+import asyncio
+import base64
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+
+from backend.app.core.config import settings
+from backend.app.services.item import pagination
+from backend.app.services.item.indexes import KOREAN_COLLATION
+
+ITEM_ID = ObjectId("65a000000000000000000001")
+
+
+def _item(value, item_id=ITEM_ID) -> dict:
+    return {"_id": item_id, "metadata": {"volume": value}}
+
+
+@pytest.mark.parametrize("value", [
+    None, 3, 2.5, "원피스 10권", datetime(2024, 1, 5, 12, 30), True, ObjectId("65a0000000000000000000ff"),
+])
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+def test_cursor_round_trip(value, sort_order):
+    cursor = pagination.encode_cursor("volume", sort_order, _item(value))
+    assert "=" not in cursor
+    assert pagination.decode_cursor(cursor, "volume", sort_order) == (value, ITEM_ID)
+
+
+def test_cursor_for_missing_sort_field_decodes_as_null():
+    cursor = pagination.encode_cursor("volume", "asc", {"_id": ITEM_ID, "metadata": {}})
+    assert pagination.decode_cursor(cursor, "volume", "asc") == (None, ITEM_ID)
+
+
+def test_cursor_from_other_sort_is_rejected():
+    cursor = pagination.encode_cursor("volume", "asc", _item(3))
+    with pytest.raises(ValueError, match="다른 정렬 조건"):
+        pagination.decode_cursor(cursor, "volume", "desc")
+    with pytest.raises(ValueError, match="다른 정렬 조건"):
+        pagination.decode_cursor(cursor, "title", "asc")
+
+
+def _encode(payload: str) -> str:
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor!",
+    _encode("{broken json"),
+    _encode(json.dumps(["volume", "asc"])),
+    _encode(json.dumps({"k": "volume", "o": "asc", "v": 3, "id": "65a000000000000000000001"})),
+    pagination.encode_cursor("volume", "asc", _item(3))[:-4],
+])
+def test_tampered_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        pagination.decode_cursor(cursor, "volume", "asc")
+
+
+def _later_types(clauses: list) -> list:
+    """조건 중 정렬 순서상 뒤에 오는 타입 그룹 목록 ($type 조건)"""
+    return next(
+        clause["metadata.volume"]["$type"] for clause in clauses
+        if isinstance(clause.get("metadata.volume"), dict) and "$type" in clause["metadata.volume"]
+    )
+
+
+def test_equal_sort_values_continue_by_id():
+    condition = pagination.keyset_condition("volume", "asc", 3, ITEM_ID)
+    assert {"metadata.volume": 3, "_id": {"$gt": ITEM_ID}} in condition["$or"]
+    condition = pagination.keyset_condition("volume", "desc", 3, ITEM_ID)
+    assert {"metadata.volume": 3, "_id": {"$lt": ITEM_ID}} in condition["$or"]
+
+
+def test_ascending_number_continues_into_later_type_groups():
+    clauses = pagination.keyset_condition("volume", "asc", 3, ITEM_ID)["$or"]
+    types = _later_types(clauses)
+    assert "string" in types and "date" in types
+    assert "int" not in types
+    assert {"metadata.volume": None} not in clauses
+
+
+def test_descending_string_continues_into_numbers_then_null():
+    clauses = pagination.keyset_condition("volume", "desc", "원피스", ITEM_ID)["$or"]
+    types = _later_types(clauses)
+    assert types == ["double", "int", "long", "decimal"]
+    assert clauses[-1] == {"metadata.volume": None}
+
+
+def test_null_sort_value_boundaries():
+    ascending = pagination.keyset_condition("volume", "asc", None, ITEM_ID)
+    assert ascending == {"$or": [
+        {"metadata.volume": None, "_id": {"$gt": ITEM_ID}},
+        {"metadata.volume": {"$ne": None}},
+    ]}
+    descending = pagination.keyset_condition("volume", "desc", None, ITEM_ID)
+    assert descending == {"metadata.volume": None, "_id": {"$lt": ITEM_ID}}
+
+
+def test_unsupported_sort_value_is_rejected():
+    with pytest.raises(ValueError):
+        pagination.keyset_condition("volume", "asc", {1, 2}, ITEM_ID)
+
+
+def test_tampered_cursor_returns_400(monkeypatch):
+    """잘못된 커서로 목록을 조회하면 400 (MongoDB 조회 전에 거부)"""
+    pytest.importorskip("fastapi")
+    from fastapi import HTTPException
+    from backend.app.services.item import item_service
+
+    class FakeCollection:
+        mongo_collection = "items_test"
+        field_definitions = None
+
+    async def get_item_collection(collection_id, db):
+        return FakeCollection()
+
+    monkeypatch.setattr(item_service, "get_item_collection", get_item_collection)
+    monkeypatch.setattr(item_service, "get_database", lambda: {})
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(item_service.get_all_items(
+            1, db=None, is_owner=True, sort_key="volume", sort_order="asc",
+            cursor="not a cursor!", include_total=False,
+        ))
+    assert error.value.status_code == 400
+
+
+# 타입이 섞이고 값이 겹치는 정렬 필드 (필드 없음/null, 숫자, 문자열, 날짜, bool)
+MIXED_VALUES = [
+    None, None, 1, 1, 2.5, 10, "10권", "2권", "가", "가", "나",
+    datetime(2024, 1, 1), datetime(2024, 1, 1), True, False, "missing",
+]
+
+
+@pytest.fixture
+def mixed_collection():
+    client = MongoClient(settings.MONGO_URL, serverSelectionTimeoutMS=1000)
+    try:
+        client.admin.command("ping")
+    except PyMongoError:
+        client.close()
+        pytest.skip("MongoDB에 연결할 수 없습니다.")
+    collection = client[settings.MONGO_DB][f"test_pagination_{uuid.uuid4().hex}"]
+    collection.insert_many([
+        {"metadata": {} if value == "missing" else {"volume": value}} for value in MIXED_VALUES
+    ])
+    try:
+        yield collection
+    finally:
+        collection.drop()
+        client.close()
+
+
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+def test_pages_follow_full_sort_across_type_groups(mixed_collection, sort_order):
+    """페이지 크기 2로 끝까지 따라간 결과가 전체 정렬 결과와 같음 (누락/중복 없음)"""
+    sort_by = pagination.sort_spec("volume", sort_order)
+    expected = [item["_id"] for item in mixed_collection.find({}, {"_id": 1}, collation=KOREAN_COLLATION).sort(sort_by)]
+
+    seen = []
+    condition = None
+    while True:
+        page = list(
+            mixed_collection.find(pagination.combine({}, condition), collation=KOREAN_COLLATION).sort(sort_by).limit(2)
+        )
+        if not page:
+            break
+        seen.extend(item["_id"] for item in page)
+        value, last_id = pagination.decode_cursor(
+            pagination.encode_cursor("volume", sort_order, page[-1]), "volume", sort_order
+        )
+        condition = pagination.keyset_condition("volume", sort_order, value, last_id)
+    assert seen == expected
@@ -0,0 +1,107 @@
+"""
+호스트별 적응형 속도 제한기 테스트 (backend.app.services.scraper.rate_limiter)
+
+time.monotonic과 asyncio.sleep을 가짜 시계로 바꿔 실제로 기다리지 않고 대기 시간을 확인
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("pydantic_settings")
+
+from backend.app.services.scraper import rate_limiter  # noqa: E402
+from backend.app.services.scraper.rate_limiter import AdaptiveRateLimiter  # noqa: E402
+
+URL = "https://www.kyobobook.co.kr/product/1"
+OTHER_URL = "https://www.aladin.co.kr/product/1"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """가짜 시계 (sleep은 시계만 앞으로 돌리고 기다린 시간을 기록)"""
+    state = {"now": 1000.0, "sleeps": []}
+
+    async def sleep(seconds):
+        state["sleeps"].append(seconds)
+        state["now"] += seconds
+
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: state["now"])
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", sleep)
+    return state
+
+
+def make_limiter(**overrides) -> AdaptiveRateLimiter:
+    options = dict(
+        initial_rate=1.0, min_rate=0.2, max_rate=2.0, burst=2,
+        increase=0.25, decrease=0.5, backoff_base=10.0, backoff_max=60.0,
+    )
+    options.update(overrides)
+    return AdaptiveRateLimiter(**options)
+
+
+def test_success_increases_rate_additively_up_to_max(clock):
+    limiter = make_limiter()
+    limiter.record_success(URL)
+    assert limiter.current_rate(URL) == 1.25
+    for _ in range(10):
+        limiter.record_success(URL)
+    assert limiter.current_rate(URL) == 2.0
+
+
+def test_soft_block_decreases_rate_multiplicatively_down_to_min(clock):
+    limiter = make_limiter()
+    limiter.record_soft_block(URL, "429")
+    assert limiter.current_rate(URL) == 0.5
+    for _ in range(5):
+        limiter.record_soft_block(URL, "429")
+    assert limiter.current_rate(URL) == 0.2
+
+
+def test_backoff_doubles_per_consecutive_block_and_is_capped(clock):
+    limiter = make_limiter()
+    pauses = []
+    for _ in range(5):
+        limiter.record_soft_block(URL, "captcha")
+        pauses.append(limiter.snapshot()["www.kyobobook.co.kr"]["paused_seconds"])
+        clock["now"] += 100  # 다음 차단 전에 정지가 끝남
+    assert pauses == [10.0, 20.0, 40.0, 60.0, 60.0]
+
+
+def test_success_resets_backoff(clock):
+    limiter = make_limiter()
+    limiter.record_soft_block(URL, "429")
+    limiter.record_soft_block(URL, "429")
+    limiter.record_success(URL)
+    limiter.record_soft_block(URL, "429")
+    assert limiter.snapshot()["www.kyobobook.co.kr"]["consecutive_blocks"] == 1
+
+
+def test_hosts_are_limited_independently(clock):
+    limiter = make_limiter()
+    limiter.record_soft_block(URL, "429")
+    assert limiter.current_rate(OTHER_URL) == 1.0
+    assert limiter.snapshot().keys() == {"www.kyobobook.co.kr"}
+
+
+def test_acquire_allows_burst_then_waits_for_tokens(clock):
+    limiter = make_limiter()
+
+    async def acquire_three():
+        for _ in range(3):
+            await limiter.acquire(URL)
+
+    asyncio.run(acquire_three())
+    assert clock["sleeps"] == [pytest.approx(1.0)]
+
+
+def test_acquire_waits_out_pause_after_block(clock):
+    limiter = make_limiter()
+    limiter.record_soft_block(URL, "429")
+
+    async def acquire_three():
+        for _ in range(3):
+            await limiter.acquire(URL)
+
+    asyncio.run(acquire_three())
+    # 정지 10초 동안 burst만큼 다시 차고, 그 다음은 감속한 속도(0.5/s)로 2초마다 하나
+    assert clock["sleeps"] == [pytest.approx(10.0), pytest.approx(2.0)]
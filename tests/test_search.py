@@ -0,0 +1,77 @@
+"""
+아이템 검색 조건 테스트 (backend.app.services.item.search)
+
+MongoDB 조회가 필요한 테스트는 설정(MONGO_*)의 서버에 임시 컬렉션을 만들어 실행하며,
+서버에 연결할 수 없으면 건너뜀
+"""
+import uuid
+
+import pytest
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+
+from backend.app.core.config import settings
+from backend.app.services.item import search
+
+
+def _item(title: str, **metadata) -> dict:
+    item = {"title": title, "metadata": {"title": title, **metadata}}
+    item[search.SEARCH_TOKENS_FIELD] = search.search_tokens(item)
+    return item
+
+
+# 검색어 '해리포터'의 n-gram(해리/리포/포터)이 제목과 저자에 나뉘어 있는 아이템
+CROSS_FIELD = _item("해리 x", author="리포터")
+TITLE_MATCH = _item("해리포터와 마법사의 돌", author="J.K. 롤링")
+LIST_MATCH = _item("마법사의 돌", tags=["판타지", "해리포터"])
+EXCLUDED_MATCH = _item("해리 리포 포터", description="해리포터 시리즈 1권")
+
+
+@pytest.fixture
+def items_collection():
+    client = MongoClient(settings.MONGO_URL, serverSelectionTimeoutMS=1000)
+    try:
+        client.admin.command("ping")
+    except PyMongoError:
+        client.close()
+        pytest.skip("MongoDB에 연결할 수 없습니다.")
+    collection = client[settings.MONGO_DB][f"test_search_{uuid.uuid4().hex}"]
+    collection.insert_many([dict(item) for item in (CROSS_FIELD, TITLE_MATCH, LIST_MATCH, EXCLUDED_MATCH)])
+    try:
+        yield collection
+    finally:
+        collection.drop()
+        client.close()
+
+
+def _titles(collection, search_query: str, search_field: str) -> set:
+    condition = search.build_search_condition(search_query, search_field)
+    return {item["title"] for item in collection.find(condition)}
+
+
+def test_query_grams_span_fields():
+    """n-gram만으로는 여러 필드에 나뉜 아이템도 후보가 됨 (재확인이 필요한 이유)"""
+    grams = search.query_grams("해리포터")
+    assert set(grams) <= set(CROSS_FIELD[search.SEARCH_TOKENS_FIELD])
+
+
+def test_all_search_requires_word_within_one_field(items_collection):
+    assert _titles(items_collection, "해리포터", "all") == {TITLE_MATCH["title"], LIST_MATCH["title"]}
+
+
+def test_all_search_matches_each_word_in_different_fields(items_collection):
+    """단어마다 다른 필드에 있어도 일치 (단어 안의 n-gram만 한 필드에 모여 있으면 됨)"""
+    assert _titles(items_collection, "해리포터 롤링", "all") == {TITLE_MATCH["title"]}
+
+
+def test_field_search_checks_field_value(items_collection):
+    assert _titles(items_collection, "리포터", "author") == {CROSS_FIELD["title"]}
+    assert _titles(items_collection, "해리포터", "author") == set()
+
+
+def test_unindexed_field_search_uses_field_value(items_collection):
+    """토큰을 저장하지 않는 필드(description)도 필드 검색으로 찾음"""
+    assert search.build_search_condition("시리즈", "description") == {
+        "$and": [{"metadata.description": {"$regex": "시리즈", "$options": "i"}}]
+    }
+    assert _titles(items_collection, "해리포터 시리즈", "description") == {EXCLUDED_MATCH["title"]}